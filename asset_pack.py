@@ -0,0 +1,296 @@
+"""
+Archive d'images pré-décodées (« compilation » des assets).
+===========================================================
+Décoder un PNG/JPEG (puis souvent `smoothscale`) coûte cher sur l'Odroid,
+et le dépôt en contient plus de 2 000. `compile_pack()` décode une fois
+toutes les images des jeux et écrit leurs pixels bruts dans une seule
+archive, `.cache/assets.pack`, avec un index :
+
+    en-tête : MAGIC, offset et taille de l'index
+    données : pixels RGBA / RGBX, alignés sur 16 octets
+    index   : marshal {(chemin relatif, taille | None, lissé): entrée}
+
+À l'exécution, `load()` mappe l'archive en mémoire (`mmap`) et construit la
+surface directement depuis le buffer (`frombuffer` + `convert`) : aucun
+décodage, et seules les pages réellement lues sont chargées.
+
+Variantes redimensionnées : une image demandée à une taille absente de
+l'archive est décodée normalement, et la demande est notée dans
+`.cache/assets.wanted` ; la compilation suivante ajoute cette variante
+pré-redimensionnée. Une source modifiée (mtime différent) n'est jamais
+servie depuis l'archive.
+
+La compilation tourne après chaque mise à jour (updater.py) et réutilise
+les pixels déjà compilés des images inchangées. À la main :
+
+    python asset_pack.py
+
+Usage :
+    import asset_pack
+    sprite = asset_pack.load(path)                               # convert_alpha
+    bg     = asset_pack.load(path, (480, 320), alpha=False)      # smoothscale + convert
+    icon   = asset_pack.load(path, (24, 24), smooth=False)       # transform.scale
+"""
+import marshal
+import mmap
+import os
+import struct
+import sys
+import threading
+from pathlib import Path
+
+import pygame
+
+import mem_budget
+
+BASE_DIR    = Path(__file__).resolve().parent
+PACK_PATH   = BASE_DIR / ".cache" / "assets.pack"
+WANTED_PATH = BASE_DIR / ".cache" / "assets.wanted"
+
+MAGIC       = b"ASSETPK1"
+ASSET_EXTS  = {".png", ".jpg", ".jpeg"}
+_HEADER     = struct.Struct("<8sQQ")   # magic, offset index, taille index
+_ALIGN      = 16
+
+# Dossiers jamais compilés (mêmes exclusions que la précompilation .pyc)
+_SKIP_DIRS = {".git", ".cache", "__pycache__", "venv", ".venv", "poc"}
+
+_lock   = threading.Lock()
+_pack   = None     # (mmap, index) une fois ouvert ; False si absent/illisible
+_wanted = set()    # variantes déjà notées pendant ce processus
+
+
+def load(path, size=None, alpha: bool = True, smooth: bool = True):
+    """Surface prête à l'affichage pour l'image `path`.
+
+    `size` : taille finale (redimensionnement `smoothscale`, ou `scale` si
+    `smooth=False`). `alpha` : `convert_alpha()` sinon `convert()`.
+    Lève `pygame.error` / `OSError` comme `pygame.image.load`.
+    """
+    path = os.path.realpath(path)
+    size = None if size is None else (int(size[0]), int(size[1]))
+    key  = (_relpath(path), size, bool(smooth) if size else False)
+
+    surf = _from_pack(path, key, alpha)
+    if surf is None and size is not None:
+        # Taille demandée = taille d'origine : c'est l'entrée native de l'archive
+        surf = _from_pack(path, (key[0], None, False), alpha, size)
+    if surf is not None:
+        return surf
+
+    # Pas (encore) dans l'archive : décodage classique
+    if pygame.display.get_surface() is None:
+        img = _decode(path)[0]   # pas d'écran (chargement à l'import) : 32 bits sans convert
+    else:
+        img = pygame.image.load(path)
+        img = img.convert_alpha() if alpha else img.convert()
+    if size is not None and img.get_size() != size:
+        img = (pygame.transform.smoothscale if smooth else pygame.transform.scale)(img, size)
+        _note_wanted(key)
+    return img
+
+
+def native_size(path) -> tuple:
+    """Taille d'origine de l'image (lue dans l'index si possible)."""
+    path = os.path.realpath(path)
+    pack = _open()
+    if pack:
+        entry = pack[1].get((_relpath(path), None, False))
+        if entry is not None and entry[4] == _mtime(path):
+            return entry[1], entry[2]
+    return pygame.image.load(path).get_size()
+
+
+def stats() -> tuple:
+    """(entrées de l'index, octets mappés)."""
+    pack = _pack
+    if not pack:
+        return 0, 0
+    return len(pack[1]), len(pack[0])
+
+
+# ── Compilation ───────────────────────────────────────────────────────────────
+
+def compile_pack(base_dir=BASE_DIR, progress=None) -> tuple:
+    """(Re)construit l'archive. Retourne (nombre d'entrées, octets, décodées).
+
+    `progress(i, n, nom)` est appelé après chaque image source.
+    """
+    base_dir = Path(base_dir)
+    sources  = _sources(base_dir)
+    variants = _read_wanted()
+    old      = _open_file(PACK_PATH)          # réutilise les pixels inchangés
+    old_mm, old_index = old if old else (None, {})
+
+    tmp = PACK_PATH.with_suffix(".tmp")
+    tmp.parent.mkdir(parents=True, exist_ok=True)
+    index   = {}
+    decoded = 0
+    with open(tmp, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, 0, 0))
+        for i, src in enumerate(sources):
+            rel   = src.relative_to(base_dir).as_posix()
+            mtime = _mtime(src)
+            keys  = [(rel, None, False)] + [k for k in variants if k[0] == rel]
+            img   = None
+            for key in keys:
+                prev = old_index.get(key)
+                if prev is not None and prev[4] == mtime:
+                    off, w, h, fmt, _ = prev
+                    data = old_mm[off:off + w * h * 4]
+                else:
+                    if img is None:
+                        try:
+                            img, has_alpha = _decode(src)
+                        except (pygame.error, OSError):
+                            break
+                        decoded += 1
+                    fmt  = "RGBA" if has_alpha else "RGBX"
+                    surf = _scaled(img, key)
+                    w, h = surf.get_size()
+                    data = pygame.image.tobytes(surf, fmt)
+                f.write(b"\0" * (-f.tell() % _ALIGN))
+                index[key] = (f.tell(), w, h, fmt, mtime)
+                f.write(data)
+            if progress:
+                progress(i + 1, len(sources), rel)
+
+        index_off  = f.tell()
+        index_blob = marshal.dumps(index)
+        f.write(index_blob)
+        f.seek(0)
+        f.write(_HEADER.pack(MAGIC, index_off, len(index_blob)))
+        total = index_off
+
+    if old_mm is not None:
+        old_mm.close()
+    os.replace(tmp, PACK_PATH)
+    return len(index), total, decoded
+
+
+def _sources(base_dir: Path) -> list:
+    files = []
+    for path in sorted((base_dir / "games").rglob("*")):
+        if path.suffix.lower() in ASSET_EXTS and \
+                not _SKIP_DIRS.intersection(path.relative_to(base_dir).parts):
+            files.append(path)
+    return files
+
+
+def _decode(src: Path):
+    """Décode en surface 32 bits, sans écran (utilisable depuis un thread)."""
+    img = pygame.image.load(os.fspath(src))
+    has_alpha = bool(img.get_flags() & pygame.SRCALPHA) or img.get_colorkey() is not None
+    if img.get_bitsize() != 32:
+        img = pygame.image.frombuffer(pygame.image.tobytes(img, "RGBA"), img.get_size(), "RGBA")
+    return img, has_alpha
+
+
+def _scaled(img, key):
+    _, size, smooth = key
+    if size is None or img.get_size() == tuple(size):
+        return img
+    return (pygame.transform.smoothscale if smooth else pygame.transform.scale)(img, size)
+
+
+def _read_wanted() -> set:
+    try:
+        lines = WANTED_PATH.read_text(encoding="utf-8").splitlines()
+    except OSError:
+        return set()
+    keys = set()
+    for line in lines:
+        try:
+            rel, w, h, smooth = line.split("\t")
+            keys.add((rel, (int(w), int(h)), smooth == "1"))
+        except ValueError:
+            continue
+    return keys
+
+
+# ── Lecture ───────────────────────────────────────────────────────────────────
+
+def _from_pack(path, key, alpha, size=None):
+    pack = _open()
+    if not pack:
+        return None
+    mm, index = pack
+    entry = index.get(key)
+    if entry is None or entry[4] != _mtime(path):
+        return None
+    off, w, h, fmt, _ = entry
+    if size is not None and (w, h) != size:
+        return None
+    surf = pygame.image.frombuffer(memoryview(mm)[off:off + w * h * 4], (w, h), fmt)
+    if pygame.display.get_surface() is None:
+        return surf.copy()   # pas d'écran : copie détachée du mmap
+    return surf.convert_alpha() if alpha else surf.convert()
+
+
+def _open():
+    global _pack
+    if _pack is None:
+        with _lock:
+            if _pack is None:
+                _pack = _open_file(PACK_PATH) or False
+    return _pack
+
+
+def _open_file(path):
+    try:
+        with open(path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    try:
+        magic, off, length = _HEADER.unpack_from(mm, 0)
+        if magic != MAGIC:
+            raise ValueError(magic)
+        return mm, marshal.loads(mm[off:off + length])
+    except (struct.error, ValueError, EOFError, TypeError):
+        mm.close()
+        return None
+
+
+def _note_wanted(key) -> None:
+    if key[0] is None or key in _wanted:
+        return
+    with _lock:
+        _wanted.add(key)
+        rel, (w, h), smooth = key
+        try:
+            WANTED_PATH.parent.mkdir(parents=True, exist_ok=True)
+            with open(WANTED_PATH, "a", encoding="utf-8") as f:
+                f.write(f"{rel}\t{w}\t{h}\t{int(smooth)}\n")
+        except OSError:
+            pass
+
+
+def _relpath(path: str):
+    """Chemin relatif à BASE_DIR ('/' comme séparateur), None hors dépôt."""
+    try:
+        return Path(path).relative_to(BASE_DIR).as_posix()
+    except ValueError:
+        return None
+
+
+def _mtime(path) -> int:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return -1
+
+
+# Pages du mmap adossées au fichier : le noyau les récupère seul sous
+# pression, pas de fonction d'éviction.
+mem_budget.register("asset_pack (mmap)", stats)
+
+
+if __name__ == "__main__":
+    def _print_progress(i, n, name):
+        if i == n or i % 100 == 0:
+            print(f"  {i}/{n}  {name}")
+
+    entries, size, decoded = compile_pack(progress=_print_progress)
+    print(f"{entries} images ({decoded} décodées) → {PACK_PATH} ({size / 1e6:.1f} Mo)")
+    sys.exit(0)
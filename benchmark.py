@@ -0,0 +1,495 @@
+"""Benchmark headless des boucles de jeu (régressions de performance).
+
+Chaque scénario lance la scène principale d'un jeu sous SDL_VIDEODRIVER=dummy,
+dans un sous-processus dédié (modules `config`, `scene_game`… propres à chaque
+jeu, pic RSS mesuré par scénario). Le temps est virtualisé :
+
+- `pygame.time.Clock.tick()` ne dort pas et renvoie un dt fixe (1/60 s) ;
+- `pygame.time.get_ticks()` / `wait()` suivent ce temps simulé ;
+- les touches sont scriptées frame par frame (`key.get_pressed()` + événements
+  KEYDOWN/KEYUP générés sur les fronts).
+
+On mesure le temps réel entre deux `pygame.display.flip()/update()` ; les
+`warmup` premières frames et la frame qui suit un redémarrage de scène
+(fin de partie) sont exclues. Résultat : moyenne, p95, p99, max (ms) et pic
+RSS par scénario, écrits dans un JSON comparable à une référence.
+
+Avec `--alloc`, tracemalloc suit les allocations Python/numpy : pour chaque
+frame, pic de mémoire au-dessus du niveau de début de frame (Ko), c.-à-d. le
+volume des temporaires créés puis libérés dans la frame. tracemalloc ralentit
+l'exécution : comparer les ms entre deux runs de même mode.
+
+Usage :
+    python benchmark.py                             # tous les scénarios
+    python benchmark.py --only doom_raycast,bomberman_4ai --frames 300
+    python benchmark.py --out bench_results.json --baseline bench_baseline.json
+    python benchmark.py --only doom_raycast --alloc
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+
+BASE_DIR = Path(__file__).parent
+GAMES_DIR = BASE_DIR / "games"
+
+DEFAULT_FRAMES = 600
+DEFAULT_WARMUP = 60
+SIM_DT_MS = 1000.0 / 60.0
+SEED = 1234
+
+
+# ── Scripts d'entrée (frame → touches maintenues) ─────────────────────────────
+
+def _pulse(frame, period, length=2):
+    """True pendant `length` frames toutes les `period` frames."""
+    return frame % period < length
+
+
+def _doom_keys(frame):
+    keys = {pygame.K_UP}
+    if frame % 240 < 50:
+        keys.add(pygame.K_LEFT)
+    if _pulse(frame, 20):
+        keys.add(pygame.K_SPACE)
+    return keys
+
+
+def _minecraft_keys(frame):
+    # J1 part à droite, J2 à gauche : streaming de chunks des deux côtés + split
+    keys = {pygame.K_d, pygame.K_LEFT}
+    if _pulse(frame, 45, 8):
+        keys |= {pygame.K_w, pygame.K_UP}   # sauts pour franchir le relief
+    return keys
+
+
+def _shifter_keys(frame):
+    keys = set()
+    if _pulse(frame, 50):
+        keys.add(pygame.K_UP)    # J1 : vitesse +
+    if _pulse(frame + 20, 55):
+        keys.add(pygame.K_n)     # J2 : vitesse +
+    return keys
+
+
+def _motodash_keys(frame):
+    keys = {pygame.K_UP}
+    if frame % 180 > 150:
+        keys.add(pygame.K_LEFT)
+    return keys
+
+
+def _junglerun_keys(frame):
+    keys = set()
+    if _pulse(frame, 40):
+        keys.add(pygame.K_UP)    # J1
+    if _pulse(frame + 13, 55):
+        keys.add(pygame.K_n)     # J2
+    return keys
+
+
+def _no_keys(frame):
+    return set()
+
+
+# ── Scénarios (exécutés dans le sous-processus, cwd = dossier du jeu) ─────────
+
+def _run_doom(screen, tmp):
+    import scene_game
+    scene_game.run(screen, [])
+
+
+def _run_doom_floorcast(screen, tmp):
+    import config
+    config.FLOOR_CASTING = True   # avant le premier import du renderer
+    _run_doom(screen, tmp)
+
+
+def _run_minecraft(screen, tmp):
+    import db
+    db._DB_PATH = str(tmp / "worlds.db")
+    db.init()
+    from scenes.game import run
+    run(screen, [], 1, SEED)
+
+
+def _run_bomberman(screen, tmp):
+    import scene_game
+    scene_game.run(screen, [], ai_players=(0, 1, 2, 3))
+
+
+def _run_shifter(screen, tmp):
+    import scene_race
+    scene_race.run(screen, [], (0, 1), "tokio1")
+
+
+def _run_motodash(screen, tmp):
+    import scores
+    scores._SCORE_PATH = tmp / "motodash.json"
+    import levels
+    from scene_game import GameScene
+    scene = GameScene(screen, levels.LEVELS[0]["id"])
+    clock = pygame.time.Clock()
+    result = None
+    while result is None:
+        dt = clock.tick(60) / 1000.0
+        for event in pygame.event.get():
+            scene.handle_event(event)
+        result = scene.update(dt)
+        scene.render()
+        pygame.display.flip()
+
+
+def _run_junglerun(screen, tmp):
+    import scene_game
+    scene_game.run(screen, [])
+
+
+def _run_pokedex(screen, tmp):
+    import db
+    db.DB_PATH = str(tmp / "pokedex.db")
+    from state import GameState
+    from game_logic import update_sprite, render, update_animations
+    from input_handler import handle_continuous_input
+    from ui import create_list_view_background
+
+    gs = GameState()
+    gs.list_view_background = create_list_view_background()
+    gs.dresseur = "benchmark"
+    gs.state = "list"
+    going_down = True
+    while True:
+        pygame.event.get()
+        at_end = gs.selected_index >= len(gs.pokemon_list) - 1
+        if (going_down and at_end) or (not going_down and gs.selected_index == 0):
+            going_down = not going_down
+            gs.down_press_time = gs.up_press_time = pygame.time.get_ticks()
+        gs.key_down_pressed = going_down
+        gs.key_up_pressed = not going_down
+        handle_continuous_input(gs)
+        update_sprite(gs)
+        update_animations(gs)
+        render(gs)
+        gs.clock.tick(60)
+
+
+def _copy_pokedex_db(tmp):
+    shutil.copy(GAMES_DIR / "pokedex" / "pokedex.db", tmp / "pokedex.db")
+
+
+SCENARIOS = {
+    "doom_raycast":     {"game": "doom",        "run": _run_doom,       "keys": _doom_keys},
+    "doom_floorcast":   {"game": "doom",        "run": _run_doom_floorcast, "keys": _doom_keys},
+    "minecraft_stream": {"game": "minecraft2d", "run": _run_minecraft,  "keys": _minecraft_keys},
+    "bomberman_4ai":    {"game": "bomberman",   "run": _run_bomberman,  "keys": _no_keys},
+    "shifter_race":     {"game": "shifter",     "run": _run_shifter,    "keys": _shifter_keys},
+    "motodash_level":   {"game": "motodash",    "run": _run_motodash,   "keys": _motodash_keys},
+    "junglerun_split":  {"game": "junglerun",   "run": _run_junglerun,  "keys": _junglerun_keys,
+                         "warmup": 120},   # compte à rebours 3-2-1-GO
+    "pokedex_scroll":   {"game": "pokedex",     "run": _run_pokedex,    "keys": _no_keys,
+                         "requires": ["pokedex.db"], "prepare": _copy_pokedex_db},
+}
+
+
+# ── Harnais (sous-processus) ──────────────────────────────────────────────────
+
+class _Done(Exception):
+    """Levée depuis flip() quand le nombre de frames demandé est atteint."""
+
+
+class _HeldKeys:
+    """Remplace le résultat de `pygame.key.get_pressed()`."""
+
+    def __init__(self, held):
+        self._held = held
+
+    def __getitem__(self, key):
+        return key in self._held
+
+    def __len__(self):
+        return 512
+
+
+class _SimClock:
+    """`pygame.time.Clock` sans attente : chaque tick avance le temps simulé."""
+
+    def __init__(self):
+        self._fps = 1000.0 / SIM_DT_MS
+
+    def tick(self, framerate=0):
+        _sim_time[0] += SIM_DT_MS
+        return int(round(SIM_DT_MS))
+
+    tick_busy_loop = tick
+
+    def get_time(self):
+        return int(round(SIM_DT_MS))
+
+    get_rawtime = get_time
+
+    def get_fps(self):
+        return self._fps
+
+
+_sim_time = [0.0]
+
+
+class _FrameRecorder:
+    def __init__(self, frames, warmup, keys_fn, alloc=False):
+        self.total   = frames + warmup
+        self.warmup  = warmup
+        self.keys_fn = keys_fn
+        self.alloc   = alloc
+        self.frame   = 0
+        self.samples = []
+        self.allocs  = []   # Ko temporaires par frame (--alloc)
+        self.held    = set()
+        self._last   = None
+        self._base   = 0
+
+    def restart(self):
+        """Nouvelle partie : la frame en cours inclut un chargement, on l'ignore."""
+        self._last = None
+
+    def on_flip(self):
+        now = time.perf_counter()
+        if self.alloc:
+            cur, peak = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+        if self._last is not None and self.frame >= self.warmup:
+            self.samples.append((now - self._last) * 1000.0)
+            if self.alloc:
+                self.allocs.append((peak - self._base) / 1024.0)
+        if self.alloc:
+            self._base = cur
+        self.frame += 1
+        if self.frame >= self.total:
+            raise _Done
+        self._apply_keys(self.keys_fn(self.frame))
+        # Le post des événements ne doit pas compter dans la frame suivante
+        self._last = time.perf_counter()
+
+    def _apply_keys(self, held):
+        for k in held - self.held:
+            pygame.event.post(pygame.event.Event(
+                pygame.KEYDOWN, key=k, mod=0, unicode="", scancode=0))
+        for k in self.held - held:
+            pygame.event.post(pygame.event.Event(
+                pygame.KEYUP, key=k, mod=0, unicode="", scancode=0))
+        self.held = held
+
+
+def _install_sim_time():
+    pygame.time.Clock = _SimClock
+    pygame.time.get_ticks = lambda: int(_sim_time[0])
+
+    def _wait(ms):
+        _sim_time[0] += ms
+        return 0
+
+    pygame.time.wait = _wait
+    pygame.time.delay = _wait
+
+
+def _install_frame_hook(rec):
+    flip, update = pygame.display.flip, pygame.display.update
+
+    def _flip():
+        flip()
+        rec.on_flip()
+
+    def _update(*args, **kwargs):
+        update(*args, **kwargs)
+        rec.on_flip()
+
+    pygame.display.flip = _flip
+    pygame.display.update = _update
+    pygame.key.get_pressed = lambda: _HeldKeys(rec.held)
+
+
+def _peak_rss_mb():
+    try:
+        import resource
+    except ImportError:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(rss / 1024.0 if sys.platform != "darwin" else rss / 2**20, 1)
+
+
+def _percentile(sorted_vals, q):
+    if not sorted_vals:
+        return 0.0
+    return sorted_vals[min(len(sorted_vals) - 1, int(round(q * (len(sorted_vals) - 1))))]
+
+
+def _child(name, frames, warmup, out_path, alloc=False):
+    sc = SCENARIOS[name]
+    game_dir = GAMES_DIR / sc["game"]
+    os.chdir(game_dir)
+    sys.path[:0] = [str(game_dir), str(BASE_DIR)]
+    random.seed(SEED)
+    try:
+        import numpy as np
+        np.random.seed(SEED)
+    except ImportError:
+        pass
+
+    _install_sim_time()
+    pygame.init()
+    screen = pygame.display.set_mode((480, 320))
+    rec = _FrameRecorder(frames, sc.get("warmup", warmup), sc["keys"], alloc)
+    _install_frame_hook(rec)
+    if alloc:
+        tracemalloc.start()
+
+    t0 = time.perf_counter()
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        if "prepare" in sc:
+            sc["prepare"](tmp)
+        try:
+            while True:
+                sc["run"](screen, tmp)
+                rec.restart()   # fin de partie avant la fin du benchmark : on relance
+        except _Done:
+            pass
+
+    samples = sorted(rec.samples)
+    result = {
+        "frames":      len(samples),
+        "mean_ms":     round(sum(samples) / max(1, len(samples)), 3),
+        "p95_ms":      round(_percentile(samples, 0.95), 3),
+        "p99_ms":      round(_percentile(samples, 0.99), 3),
+        "max_ms":      round(samples[-1], 3) if samples else 0.0,
+        "peak_rss_mb": _peak_rss_mb(),
+        "wall_s":      round(time.perf_counter() - t0, 2),
+    }
+    if alloc:
+        allocs = sorted(rec.allocs)
+        result["alloc_kb"]     = round(sum(allocs) / max(1, len(allocs)), 1)
+        result["alloc_p95_kb"] = round(_percentile(allocs, 0.95), 1)
+    Path(out_path).write_text(json.dumps(result), encoding="utf-8")
+
+
+# ── Orchestration (processus parent) ──────────────────────────────────────────
+
+def _run_scenario(name, frames, warmup, alloc=False):
+    sc = SCENARIOS[name]
+    missing = [r for r in sc.get("requires", []) if not (GAMES_DIR / sc["game"] / r).exists()]
+    if missing:
+        return {"skipped": f"fichier(s) absent(s) : {', '.join(missing)}"}
+
+    with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
+        out_path = f.name
+    try:
+        proc = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--child", name,
+             "--frames", str(frames), "--warmup", str(warmup), "--out", out_path]
+            + (["--alloc"] if alloc else []),
+            capture_output=True, text=True,
+        )
+        if proc.returncode != 0:
+            tail = (proc.stderr or proc.stdout).strip().splitlines()[-1:] or ["?"]
+            return {"error": tail[0]}
+        return json.loads(Path(out_path).read_text(encoding="utf-8"))
+    finally:
+        os.unlink(out_path)
+
+
+def _compare(results, baseline, tolerance):
+    """Affiche les écarts vs la référence ; retourne le nombre de régressions."""
+    regressions = 0
+    print()
+    print(f"{'scénario':18s} {'métrique':8s} {'réf':>9s} {'actuel':>9s} {'écart':>8s}")
+    print("-" * 56)
+    for name, cur in results.items():
+        ref = baseline.get("scenarios", {}).get(name)
+        if not ref or "mean_ms" not in ref or "mean_ms" not in cur:
+            continue
+        for key in ("mean_ms", "p95_ms", "p99_ms", "alloc_kb"):
+            if key not in cur or key not in ref:
+                continue
+            delta = (cur[key] - ref[key]) / max(1e-6, ref[key])
+            flag = ""
+            if delta > tolerance:
+                flag = "  REGRESSION"
+                regressions += 1
+            print(f"{name:18s} {key.rsplit('_', 1)[0]:8s} {ref[key]:9.2f} {cur[key]:9.2f} {delta:+7.1%}{flag}")
+    return regressions
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--frames", type=int, default=DEFAULT_FRAMES, help="frames mesurées par scénario")
+    ap.add_argument("--warmup", type=int, default=DEFAULT_WARMUP, help="frames ignorées au début")
+    ap.add_argument("--only", default="", help="scénarios séparés par des virgules")
+    ap.add_argument("--out", default="bench_results.json")
+    ap.add_argument("--baseline", help="JSON de référence à comparer")
+    ap.add_argument("--tolerance", type=float, default=0.10, help="écart toléré (0.10 = +10 %%)")
+    ap.add_argument("--alloc", action="store_true",
+                    help="mesurer les temporaires alloués par frame (tracemalloc)")
+    ap.add_argument("--child", help=argparse.SUPPRESS)
+    args = ap.parse_args()
+
+    if args.child:
+        _child(args.child, args.frames, args.warmup, args.out, args.alloc)
+        return
+
+    names = [n for n in args.only.split(",") if n] or list(SCENARIOS)
+    unknown = [n for n in names if n not in SCENARIOS]
+    if unknown:
+        ap.error(f"scénario(s) inconnu(s) : {', '.join(unknown)} – choix : {', '.join(SCENARIOS)}")
+
+    alloc_hdr = f" {'Ko/fr':>7s}" if args.alloc else ""
+    print(f"{'scénario':18s} {'frames':>6s} {'moy':>7s} {'p95':>7s} {'p99':>7s} {'max':>7s} {'RSS Mo':>7s}"
+          + alloc_hdr)
+    print("-" * (66 + len(alloc_hdr)))
+    results = {}
+    for name in names:
+        r = _run_scenario(name, args.frames, args.warmup, args.alloc)
+        results[name] = r
+        if "skipped" in r or "error" in r:
+            print(f"{name:18s} {'ignoré' if 'skipped' in r else 'ERREUR'} : {r.get('skipped') or r.get('error')}")
+            continue
+        print(f"{name:18s} {r['frames']:6d} {r['mean_ms']:7.2f} {r['p95_ms']:7.2f} "
+              f"{r['p99_ms']:7.2f} {r['max_ms']:7.2f} {r['peak_rss_mb'] or 0:7.1f}"
+              + (f" {r['alloc_kb']:7.1f}" if args.alloc else ""))
+
+    report = {
+        "meta": {
+            "date":     time.strftime("%Y-%m-%d %H:%M:%S"),
+            "machine":  platform.machine(),
+            "python":   platform.python_version(),
+            "pygame":   pygame.version.ver,
+            "frames":   args.frames,
+            "warmup":   args.warmup,
+            "dt_ms":    round(SIM_DT_MS, 3),
+            "alloc":    args.alloc,
+        },
+        "scenarios": results,
+    }
+    Path(args.out).write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+    print(f"\nRésultats écrits dans {args.out}")
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        if _compare(results, baseline, args.tolerance):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
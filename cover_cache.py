@@ -0,0 +1,102 @@
+"""
+Cache disque des covers déjà recadrées (tuiles + fonds du launcher).
+====================================================================
+Décoder un PNG/JPG puis faire un `smoothscale` coûte cher sur l'Odroid.
+Ce module stocke le résultat final (surface recadrée, taille cible) sous
+forme de pixels bruts RGBX : au démarrage suivant, on mappe le fichier en
+mémoire (`mmap`) et on le blit dans une surface au format écran, sans
+décodage ni rééchantillonnage.
+
+Clé d'un blob : chemin source + taille cible (nom du fichier) et mtime de
+la source (suffixe). Si la cover change, son mtime change → cache miss,
+le blob est reconstruit et les anciennes versions sont supprimées.
+
+Usage :
+    import cover_cache
+    surf = cover_cache.load(path, (w, h), build)   # build() → Surface (w, h)
+"""
+import hashlib
+import mmap
+import os
+from pathlib import Path
+
+import pygame
+
+CACHE_DIR = Path(__file__).parent / ".cache" / "covers"
+
+_FORMAT = "RGBX"   # 4 octets/pixel, lisible directement par frombuffer
+_BPP    = 4
+
+
+def load(src_path: str, size: tuple, build) -> pygame.Surface:
+    """Retourne la surface en cache pour (src_path, size) ou la construit.
+
+    `build()` n'est appelé qu'en cas de cache miss ; son résultat (taille
+    `size`) est alors écrit sur disque. Toute erreur d'E/S sur le cache est
+    silencieuse : on retombe sur `build()`.
+    """
+    blob = _blob_path(src_path, size)
+    if blob is not None:
+        surf = _read(blob, size)
+        if surf is not None:
+            return surf
+
+    surf = build()
+    if blob is not None and surf is not None:
+        _write(blob, surf)
+    return surf
+
+
+def clear() -> None:
+    """Supprime tous les blobs du cache."""
+    try:
+        for p in CACHE_DIR.iterdir():
+            p.unlink()
+    except OSError:
+        pass
+
+
+# ── Internals ─────────────────────────────────────────────────────────────────
+
+def _blob_path(src_path: str, size: tuple):
+    """Chemin du blob pour la version courante (mtime) de la source."""
+    try:
+        mtime = os.stat(src_path).st_mtime_ns
+    except OSError:
+        return None
+    return CACHE_DIR / f"{_prefix(src_path, size)}-{mtime}.raw"
+
+
+def _prefix(src_path: str, size: tuple) -> str:
+    key = f"{os.path.abspath(src_path)}|{size[0]}x{size[1]}"
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+
+
+def _read(blob: Path, size: tuple):
+    """mmap le blob et le copie dans une surface au format écran."""
+    w, h = size
+    try:
+        with open(blob, "rb") as f:
+            if os.fstat(f.fileno()).st_size != w * h * _BPP:
+                return None
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                raw  = pygame.image.frombuffer(mm, (w, h), _FORMAT)
+                surf = raw.convert()
+                del raw   # libère la vue sur le mmap avant sa fermeture
+        return surf
+    except (OSError, ValueError, pygame.error):
+        return None
+
+
+def _write(blob: Path, surf: pygame.Surface) -> None:
+    """Écrit le blob (écriture atomique) et purge les anciennes versions."""
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        prefix = blob.name.rsplit("-", 1)[0]
+        for old in CACHE_DIR.glob(f"{prefix}-*.raw"):
+            old.unlink()
+        tmp = blob.with_suffix(".tmp")
+        tmp.write_bytes(pygame.image.tobytes(surf, _FORMAT))
+        os.replace(tmp, blob)
+    except (OSError, pygame.error):
+        pass
@@ -0,0 +1,64 @@
+"""Module partagé – simulation à pas fixe, rendu interpolé.
+
+Multiplier la physique par le `dt` de la frame rend la simulation
+dépendante du framerate : une frame lente fait des pas plus grands, les
+collisions ratent, les sauts changent de hauteur. Ici la simulation avance
+toujours par pas de `1 / hz` secondes ; un accumulateur convertit le temps
+réel écoulé en nombre de pas, et le rendu reçoit `alpha` (fraction du pas
+suivant déjà écoulée) pour interpoler entre l'état précédent et l'état
+courant.
+
+Si le rendu ne suit pas, plusieurs pas sont enchaînés dans la même frame
+(au plus `max_steps`) ; au-delà, le retard est abandonné (ralenti plutôt
+qu'emballement).
+
+Usage dans une boucle pygame :
+
+    step = FixedStep(60)
+
+    while True:
+        frame_dt = clock.tick(FPS) / 1000.0
+        ...                                 # événements / entrées
+        for _ in step.advance(frame_dt):
+            prev = snapshot(state)          # état avant le pas
+            update(state, step.dt)          # dt constant
+        render(state, prev, step.alpha)     # lerp(prev, state, alpha)
+        pygame.display.flip()
+"""
+
+MAX_FRAME_DT = 0.25   # secondes : au-delà (chargement, pause), le temps est ignoré
+MAX_STEPS    = 5      # pas de simulation maximum par frame
+
+
+class FixedStep:
+    """Accumulateur de temps → nombre de pas fixes à exécuter par frame."""
+
+    def __init__(self, hz: float = 60, max_steps: int = MAX_STEPS):
+        self.dt        = 1.0 / hz
+        self.max_steps = max_steps
+        self.acc       = 0.0
+        self.ticks     = 0    # pas exécutés depuis la création
+
+    def advance(self, frame_dt: float) -> range:
+        """Ajoute `frame_dt` secondes et retourne les pas à exécuter."""
+        self.acc += min(frame_dt, MAX_FRAME_DT)
+        n = int(self.acc / self.dt)
+        if n > self.max_steps:
+            n = self.max_steps
+            self.acc = self.dt * n   # retard abandonné
+        self.acc -= n * self.dt
+        self.ticks += n
+        return range(n)
+
+    @property
+    def alpha(self) -> float:
+        """Fraction [0, 1) du prochain pas déjà écoulée, pour l'interpolation."""
+        return min(1.0, self.acc / self.dt)
+
+    def reset(self) -> None:
+        """Vide l'accumulateur (après un chargement, une pause…)."""
+        self.acc = 0.0
+
+
+def lerp(a: float, b: float, t: float) -> float:
+    return a + (b - a) * t
@@ -0,0 +1,99 @@
+"""Module partagé – registre de polices et cache des textes rendus.
+
+`pygame.font.SysFont` parcourt la liste des polices système à chaque appel :
+plusieurs millisecondes sur l'Odroid. Les polices sont donc créées une seule
+fois par (famille, taille, gras, italique) et partagées par tout le processus.
+
+Les textes rendus sont gardés dans un cache LRU (police, texte, couleur,
+antialias, fond) borné à TEXT_CACHE_BYTES : un libellé statique n'est rendu
+qu'une fois, un texte qui change à chaque frame (chrono…) finit évincé.
+
+Usage :
+
+    import font_cache
+
+    font = font_cache.get_font("Arial", 16, bold=True)
+    surf = font_cache.render(font, "PARTEZ !", (255, 255, 255))
+    screen.blit(surf, pos)
+
+Les surfaces renvoyées sont partagées : ne jamais dessiner dessus. Un
+`set_alpha()` juste avant le blit reste possible.
+
+Les polices meurent avec `pygame.quit()` : appeler `clear()` après chaque
+réinitialisation de pygame (fait par main.py autour des jeux).
+"""
+
+from collections import OrderedDict
+
+import pygame
+
+import mem_budget
+
+TEXT_CACHE_BYTES = 2 * 1024 * 1024   # budget des surfaces texte en cache
+
+_fonts = {}              # (famille, taille, gras, italique) -> Font
+_texts = OrderedDict()   # (police, texte, couleur, aa, fond) -> Surface
+_bytes = 0
+
+
+def get_font(family, size: int, bold: bool = False, italic: bool = False):
+    """Police partagée ; `family=None` = police par défaut de pygame."""
+    key = (family, size, bold, italic)
+    font = _fonts.get(key)
+    if font is None:
+        if family is None:
+            font = pygame.font.Font(None, size)
+            font.set_bold(bold)
+            font.set_italic(italic)
+        else:
+            font = pygame.font.SysFont(family, size, bold=bold, italic=italic)
+        _fonts[key] = font
+    return font
+
+
+def render(font, text: str, color, antialias: bool = True, background=None):
+    """`font.render(...)` mis en cache (surface partagée, voir plus haut)."""
+    global _bytes
+    key = (font, text, tuple(color), antialias,
+           None if background is None else tuple(background))
+    surf = _texts.get(key)
+    if surf is not None:
+        _texts.move_to_end(key)
+        return surf
+
+    if background is None:
+        surf = font.render(text, antialias, color)
+    else:
+        surf = font.render(text, antialias, color, background)
+    _texts[key] = surf
+    _bytes += _surface_bytes(surf)
+    while _bytes > TEXT_CACHE_BYTES and len(_texts) > 1:
+        _, old = _texts.popitem(last=False)
+        _bytes -= _surface_bytes(old)
+    return surf
+
+
+def stats() -> tuple:
+    """(polices, textes en cache, octets des textes)."""
+    return len(_fonts), len(_texts), _bytes
+
+
+def clear() -> None:
+    """Oublie polices et textes (à appeler après `pygame.quit()`)."""
+    global _bytes
+    _fonts.clear()
+    _texts.clear()
+    _bytes = 0
+
+
+def _surface_bytes(surf) -> int:
+    return surf.get_pitch() * surf.get_height()
+
+
+def _evict_texts() -> None:
+    global _bytes
+    _texts.clear()
+    _bytes = 0
+
+
+mem_budget.register("font_cache.texts", lambda: (len(_texts), _bytes), _evict_texts)
@@ -0,0 +1,206 @@
+"""Module partagé – mesure du temps de frame et des phases d'une boucle de jeu.
+
+Chaque jeu découpe sa boucle en phases nommées avec `mark()` ; le profiler
+attribue à chaque phase le temps écoulé depuis le marqueur précédent.
+Un overlay (FPS, histogramme des temps de frame, ms par phase) s'affiche
+avec SELECT + V (boutons 12 + 16) ou F3 au clavier.
+
+Usage dans une boucle pygame :
+
+    prof = FrameProfiler()
+
+    while True:
+        dt = clock.tick(FPS) / 1000.0
+        prof.mark("wait")               # attente clock.tick
+        for e in events:
+            prof.handle_event(e)
+        ...                             # lecture des entrées
+        prof.mark("input")
+        ...                             # simulation
+        prof.mark("update")
+        ...                             # rendu
+        prof.mark("render")
+        prof.draw(screen)               # avant pygame.display.flip()
+        pygame.display.flip()
+        prof.mark("flip")
+        prof.end_frame()
+
+Export CSV : `FrameProfiler(csv_path=...)`, `start_csv(path)` ou la variable
+d'environnement FRAME_PROFILER_CSV – une ligne par frame (temps total et ms
+de chaque phase), ajoutée à la fin du fichier.
+"""
+
+import os
+import time
+from collections import deque
+
+import pygame
+
+TOGGLE_BUTTONS = (12, 16)   # SELECT + V
+TOGGLE_KEY     = pygame.K_F3
+HISTORY        = 120        # frames gardées pour FPS / histogramme
+TEXT_REFRESH   = 0.25       # secondes entre deux rendus du texte de l'overlay
+
+# Bornes hautes (ms) des barres de l'histogramme ; la dernière = au-delà
+HIST_BINS = (8, 17, 25, 34, 50, 100)
+
+_CSV_BATCH = 60             # lignes CSV écrites par paquet
+
+
+class FrameProfiler:
+    """Chronomètre les phases d'une boucle et affiche un overlay à la demande."""
+
+    def __init__(self, csv_path=None):
+        self.visible   = False
+        self._pressed  = set()
+        self._last     = time.perf_counter()   # dernier marqueur
+        self._frame_t0 = self._last            # début de la frame courante
+        self._phases   = {}                    # phase -> ms (frame courante)
+        self._order    = []                    # phases, ordre d'apparition
+        self._frames   = deque(maxlen=HISTORY) # ms par frame
+        self._avg      = {}                    # phase -> ms lissé
+        self._font     = None                  # initialisé à la demande
+        self._lines    = []                    # surfaces texte en cache
+        self._text_t   = 0.0
+        self._csv      = None
+        self._csv_cols = None
+        self._csv_rows = []
+        self._frame_no = 0
+
+        csv_path = csv_path or os.environ.get("FRAME_PROFILER_CSV")
+        if csv_path:
+            self.start_csv(csv_path)
+
+    # ── Mesure ────────────────────────────────────────────────────────────────
+
+    def mark(self, phase: str) -> None:
+        """Clôt la phase `phase` (temps depuis le marqueur précédent)."""
+        now = time.perf_counter()
+        ms  = (now - self._last) * 1000.0
+        self._last = now
+        if phase not in self._phases:
+            self._phases[phase] = 0.0
+            if phase not in self._order:
+                self._order.append(phase)
+        self._phases[phase] += ms
+
+    def end_frame(self) -> None:
+        """Termine la frame : historique, moyennes lissées, ligne CSV."""
+        now = time.perf_counter()
+        frame_ms = (now - self._frame_t0) * 1000.0
+        self._frame_t0 = now
+        self._last     = now
+        self._frame_no += 1
+        self._frames.append(frame_ms)
+
+        for name in self._order:
+            ms  = self._phases.get(name, 0.0)
+            old = self._avg.get(name, ms)
+            self._avg[name] = old + (ms - old) * 0.1
+
+        if self._csv is not None:
+            self._csv_row(frame_ms)
+        self._phases.clear()
+
+    # ── Overlay ───────────────────────────────────────────────────────────────
+
+    def handle_event(self, event) -> None:
+        """À appeler pour chaque événement pygame de la boucle principale."""
+        if event.type == pygame.KEYDOWN and event.key == TOGGLE_KEY:
+            self.visible = not self.visible
+        elif event.type == pygame.JOYBUTTONDOWN:
+            self._pressed.add(event.button)
+            if event.button in TOGGLE_BUTTONS and all(b in self._pressed for b in TOGGLE_BUTTONS):
+                self.visible = not self.visible
+        elif event.type == pygame.JOYBUTTONUP:
+            self._pressed.discard(event.button)
+
+    def fps(self) -> float:
+        if not self._frames:
+            return 0.0
+        return 1000.0 * len(self._frames) / max(1e-6, sum(self._frames))
+
+    def draw(self, screen) -> None:
+        """Dessine l'overlay en haut à gauche s'il est activé."""
+        if not self.visible:
+            return
+        if self._font is None:
+            self._font = pygame.font.SysFont("Courier New", 10)
+
+        now = time.perf_counter()
+        if now - self._text_t >= TEXT_REFRESH:
+            self._text_t = now
+            self._render_lines()
+
+        line_h = self._font.get_linesize()
+        hist_h = 24
+        box_w  = 130
+        box_h  = 4 + len(self._lines) * line_h + hist_h + 6
+        pygame.draw.rect(screen, (10, 10, 10), (2, 2, box_w, box_h))
+        pygame.draw.rect(screen, (90, 90, 90), (2, 2, box_w, box_h), 1)
+
+        y = 4
+        for surf in self._lines:
+            screen.blit(surf, (6, y))
+            y += line_h
+        self._draw_histogram(screen, 6, y + 2, box_w - 8, hist_h)
+
+    def _render_lines(self) -> None:
+        frames = sorted(self._frames)
+        worst  = frames[-1] if frames else 0.0
+        lines  = [f"FPS {self.fps():5.1f}   max {worst:5.1f} ms"]
+        lines += [f"{name:<8} {self._avg.get(name, 0.0):6.2f} ms" for name in self._order]
+        self._lines = [self._font.render(t, True, (230, 230, 230)) for t in lines]
+
+    def _draw_histogram(self, screen, x, y, w, h) -> None:
+        counts = [0] * (len(HIST_BINS) + 1)
+        for ms in self._frames:
+            i = 0
+            while i < len(HIST_BINS) and ms > HIST_BINS[i]:
+                i += 1
+            counts[i] += 1
+        peak  = max(1, max(counts))
+        bar_w = w // len(counts)
+        for i, c in enumerate(counts):
+            bh  = int((h - 1) * c / peak)
+            col = (80, 200, 80) if i < 2 else (220, 180, 40) if i < 4 else (220, 60, 60)
+            pygame.draw.rect(screen, col, (x + i * bar_w, y + h - bh, bar_w - 2, bh))
+
+    # ── Export CSV ────────────────────────────────────────────────────────────
+
+    def start_csv(self, path) -> None:
+        """Ajoute une ligne par frame au fichier CSV `path`."""
+        self.stop_csv()
+        self._csv      = open(path, "a", encoding="utf-8")
+        self._csv_cols = None
+
+    def stop_csv(self) -> None:
+        """Écrit les lignes en attente et ferme le fichier CSV."""
+        if self._csv is None:
+            return
+        self._csv_flush()
+        self._csv.close()
+        self._csv = None
+
+    def _csv_row(self, frame_ms: float) -> None:
+        if self._csv_cols is None:
+            # Colonnes fixées à la première frame enregistrée
+            self._csv_cols = list(self._order)
+            self._csv_rows.append(
+                "frame,time_s,frame_ms," + ",".join(f"{c}_ms" for c in self._csv_cols))
+        values = ",".join(f"{self._phases.get(c, 0.0):.3f}" for c in self._csv_cols)
+        self._csv_rows.append(f"{self._frame_no},{time.time():.3f},{frame_ms:.3f},{values}")
+        if len(self._csv_rows) >= _CSV_BATCH:
+            self._csv_flush()
+
+    def _csv_flush(self) -> None:
+        if self._csv_rows:
+            self._csv.write("\n".join(self._csv_rows) + "\n")
+            self._csv.flush()
+            self._csv_rows.clear()
+
+    def __del__(self):
+        try:
+            self.stop_csv()
+        except Exception:
+            pass
@@ -10,6 +10,8 @@ import collections
 
 from config import *
 from quit_combo import QuitCombo
+from frame_profiler import FrameProfiler
+from input_map import InputMap
 import sound_manager
 
 _PLAYER_LABELS = ['J1', 'J2', 'IA1', 'IA2']
@@ -179,40 +181,37 @@ class Bonus:
 
 # ── Helpers de contrôle (joueurs humains) ───────────────────────────────────
 
-def _get_p1_dir(keys, joystick):
-    if joystick:
-        try:
-            ax = joystick.get_axis(0)
-            ay = joystick.get_axis(1)
-            if ax < -AXIS_DEAD: return -1,  0
-            if ax >  AXIS_DEAD: return  1,  0
-            if ay < -AXIS_DEAD: return  0, -1
-            if ay >  AXIS_DEAD: return  0,  1
-        except Exception:
-            pass
-        try:
-            hx, hy = joystick.get_hat(0)
-            if hx != 0 or hy != 0:
-                return hx, -hy
-        except Exception:
-            pass
-    if keys[pygame.K_z]:  return  0, -1
-    if keys[pygame.K_s]:  return  0,  1
-    if keys[pygame.K_q]:  return -1,  0
-    if keys[pygame.K_d]:  return  1,  0
-    return None
-
-
-def _get_p2_dir(keys, p2_btns):
-    if BTN_B in p2_btns: return  1,  0
-    if BTN_A in p2_btns: return  0,  1
-    if BTN_Y in p2_btns: return -1,  0
-    if BTN_X in p2_btns: return  0, -1
-    if keys[pygame.K_o]:  return  0, -1
-    if keys[pygame.K_l]:  return  0,  1
-    if keys[pygame.K_k]:  return -1,  0
-    if keys[pygame.K_m]:  return  1,  0
-    return None
+def _bindings(has_p2_joy):
+    """Table des actions des joueurs humains (voir input_map.py).
+
+    Sans seconde manette, J2 utilise les boutons ABXY de la première.
+    """
+    j2 = 1 if has_p2_joy else 0
+    return {
+        'p1_left':  {'keys': [pygame.K_q], 'axis': (0, -1), 'hat': (-1,  0), 'joy': 0},
+        'p1_right': {'keys': [pygame.K_d], 'axis': (0,  1), 'hat': ( 1,  0), 'joy': 0},
+        'p1_up':    {'keys': [pygame.K_z], 'axis': (1, -1), 'hat': ( 0,  1), 'joy': 0},
+        'p1_down':  {'keys': [pygame.K_s], 'axis': (1,  1), 'hat': ( 0, -1), 'joy': 0},
+        'p1_bomb':  {'keys': [pygame.K_e], 'btn': BTN_P1_BOMB, 'joy': 0},
+        'p2_right': {'keys': [pygame.K_m], 'btn': BTN_B, 'joy': j2},
+        'p2_down':  {'keys': [pygame.K_l], 'btn': BTN_A, 'joy': j2},
+        'p2_left':  {'keys': [pygame.K_k], 'btn': BTN_Y, 'joy': j2},
+        'p2_up':    {'keys': [pygame.K_o], 'btn': BTN_X, 'joy': j2},
+        'p2_bomb':  {'keys': [pygame.K_p], 'btn': BTN_P2_BOMB, 'joy': j2},
+    }
+
+
+# Actions de déplacement par joueur humain → (dx, dy), dans l'ordre de priorité
+_DIR_ACTIONS = (
+    {'p1_left': (-1, 0), 'p1_right': (1, 0), 'p1_up': (0, -1), 'p1_down': (0, 1)},
+    {'p2_right': (1, 0), 'p2_down': (0, 1), 'p2_left': (-1, 0), 'p2_up': (0, -1)},
+)
+_BOMB_ACTIONS = ('p1_bomb', 'p2_bomb')
+
+
+def _get_dir(inp, idx):
+    name = inp.first_held(_DIR_ACTIONS[idx])
+    return _DIR_ACTIONS[idx][name] if name else None
 
 
 def _is_blocked(col, row, grid, players, bombs, exclude_player=-1):
@@ -825,14 +824,14 @@ def _draw_ui(surface, players, font):
 
 # ── Boucle principale ─────────────────────────────────────────────────────────
 
-def run(screen, joysticks):
+def run(screen, joysticks, ai_players=(2, 3)):
+    """`ai_players` : indices des joueurs pilotés par l'IA (benchmark : les 4)."""
     clock  = pygame.time.Clock()
     f_sm   = pygame.font.SysFont("Arial", 11, bold=True)
     f_ui   = pygame.font.SysFont("Arial", 10, bold=True)
     sounds = sound_manager.BombermanSounds()
 
-    joy_p1     = joysticks[0] if len(joysticks) > 0 else None
-    has_p2_joy = len(joysticks) > 1
+    inp = InputMap(_bindings(len(joysticks) > 1), axis_dead=AXIS_DEAD)
 
     grid, theme = _make_grid()
     players = [
@@ -842,89 +841,54 @@ def run(screen, joysticks):
         Player(1,          ROWS - 2,   P4_COLOR),   # IA2 bas-gauche
     ]
     # Ralentir les IA pour qu'elles soient jouables
-    for idx in (2, 3):
+    for idx in ai_players:
         players[idx].move_cooldown = AI_MOVE_COOLDOWN
     bombs      = []
     explosions = []
     bonuses    = []
 
-    # Machines à états pour les IA (indices 2 et 3)
-    ai_states = {2: AIState(), 3: AIState()}
+    # Machines à états pour les IA (indices 2 et 3 par défaut)
+    ai_states = {idx: AIState() for idx in ai_players}
 
     # Suivi de l'ordre d'élimination (groupes de morts simultanées)
     elimination_order = []
 
-    p1_btns = set()
-    p2_btns = set()
-    bomb_press = [False, False, False, False]
-
     quit_combo = QuitCombo()
+    prof       = FrameProfiler()
+    inp.subscribe(quit_combo.handle_event)
+    inp.subscribe(prof.handle_event)
     t          = 0.0
     rain_timer = 0.0   # compte à rebours avant la prochaine bombe de pluie
 
     while True:
         dt = clock.tick(FPS) / 1000.0
+        prof.mark("wait")
         t += dt
 
-        bomb_press = [False, False, False, False]
-
-        events = pygame.event.get()
-        for e in events:
-            quit_combo.handle_event(e)
-
+        for e in inp.poll():
             if e.type == pygame.QUIT:
                 return None
-
-            if e.type == pygame.KEYDOWN:
-                if e.key == pygame.K_ESCAPE:
-                    return None
-                if e.key == pygame.K_e:
-                    bomb_press[0] = True
-                if e.key == pygame.K_p:
-                    bomb_press[1] = True
-
-            if e.type == pygame.JOYBUTTONDOWN:
-                joy_idx = getattr(e, 'joy', 0)
-                if joy_idx == 0:
-                    p1_btns.add(e.button)
-                    if not has_p2_joy:
-                        p2_btns.add(e.button)
-                else:
-                    p2_btns.add(e.button)
-
-                if joy_idx == 0 and e.button == BTN_P1_BOMB:
-                    bomb_press[0] = True
-                if (joy_idx == 1 or not has_p2_joy) and e.button == BTN_P2_BOMB:
-                    bomb_press[1] = True
-
-            if e.type == pygame.JOYBUTTONUP:
-                joy_idx = getattr(e, 'joy', 0)
-                if joy_idx == 0:
-                    p1_btns.discard(e.button)
-                    if not has_p2_joy:
-                        p2_btns.discard(e.button)
-                else:
-                    p2_btns.discard(e.button)
-
-        keys = pygame.key.get_pressed()
+            if e.type == pygame.KEYDOWN and e.key == pygame.K_ESCAPE:
+                return None
+        prof.mark("input")
 
         # ── Déplacement joueurs humains (J1 et J2) ───────────────────────────
         for idx in range(2):
             p = players[idx]
-            if not p.alive:
+            if not p.alive or idx in ai_players:
                 continue
             p.move_cd = max(0.0, p.move_cd - dt)
             p.bomb_cd = max(0.0, p.bomb_cd - dt)
 
             if p.move_cd <= 0.0:
-                d = _get_p1_dir(keys, joy_p1) if idx == 0 else _get_p2_dir(keys, p2_btns)
+                d = _get_dir(inp, idx)
                 if d:
                     nc, nr = p.col + d[0], p.row + d[1]
                     if not _is_blocked(nc, nr, grid, players, bombs, idx):
                         p.col, p.row = nc, nr
                     p.move_cd = p.move_cooldown
 
-            if bomb_press[idx] and p.bomb_cd <= 0.0 and p.active_bombs < p.max_bombs:
+            if inp.pressed(_BOMB_ACTIONS[idx]) and p.bomb_cd <= 0.0 and p.active_bombs < p.max_bombs:
                 if not any(b.col == p.col and b.row == p.row for b in bombs):
                     bombs.append(Bomb(p.col, p.row, idx, p.bomb_range))
                     p.active_bombs += 1
@@ -932,7 +896,7 @@ def run(screen, joysticks):
                     sounds.play('bomb_place')
 
         # ── Déplacement joueurs IA (IA1 et IA2) ─────────────────────────────
-        for idx in range(2, 4):
+        for idx in ai_players:
             p = players[idx]
             if not p.alive:
                 continue
@@ -1059,6 +1023,8 @@ def run(screen, joysticks):
                 rankings.append(group)
             return rankings
 
+        prof.mark("update")
+
         # ── Rendu ────────────────────────────────────────────────────────────
         screen.fill(BG_COLOR)
         _draw_grid(screen, grid, explosions, theme)
@@ -1083,5 +1049,9 @@ def run(screen, joysticks):
 
         if quit_combo.update_and_draw(screen):
             return None
+        prof.mark("render")
 
+        prof.draw(screen)
         pygame.display.flip()
+        prof.mark("flip")
+        prof.end_frame()
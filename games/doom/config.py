@@ -11,7 +11,15 @@ HALF_H        = RENDER_H // 2
 
 # Raycaster
 N_RAYS        = RENDER_W
-MAX_DDA_STEPS = 28
+MAX_DDA_STEPS = 256   # portée de vue en cases (le DDA s'arrête dès que tous les rayons ont touché)
+
+# Murs texturés (engine/textures.py) ; False → couleurs unies WALL_COLORS
+TEXTURED_WALLS = True
+TEX_SIZE       = 32    # côté des textures (puissance de 2)
+FLOOR_CASTING  = False # sol / plafond texturés en perspective (sinon dégradés)
+
+# Sprites ennemis (engine/sprites.py, PNG optionnels dans sprites/)
+SPRITE_SIZE    = 32
 
 # Camera plane half-length : tan(FOV/2) où FOV ≈ 66°
 # tan(33°) ≈ 0.6494
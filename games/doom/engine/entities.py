@@ -115,13 +115,13 @@ class Enemy:
 
         dx   = self.x - player.x
         dy   = self.y - player.y
-        det  = player.dx * player.py - player.dy * player.px
-        ty   = (-player.dy * dx + player.dx * dy) / det
+        det  = player.px * player.dy - player.dx * player.py
+        ty   = (-player.py * dx + player.px * dy) / det
 
         if ty <= 0.05:
             return False
 
-        tx      = (player.py * dx - player.px * dy) / det
+        tx      = (player.dy * dx - player.dx * dy) / det
         sc_x    = int(RENDER_W / 2 * (1.0 + tx / ty))
         sp_half = abs(int(RENDER_H / ty)) // 2
 
@@ -34,6 +34,23 @@ class Player:
         self.px = -self.dy * CAM_PLANE
         self.py =  self.dx * CAM_PLANE
 
+    # ── Interpolation (rendu entre deux pas de simulation) ────────────────
+
+    def pose(self) -> tuple:
+        return self.x, self.y, self.angle
+
+    def interpolated(self, prev_pose: tuple, alpha: float) -> "Player":
+        """Copie du joueur à mi-chemin entre `prev_pose` et la pose actuelle."""
+        view = Player.__new__(Player)
+        for name in Player.__slots__:
+            setattr(view, name, getattr(self, name))
+        x0, y0, a0 = prev_pose
+        view.x     = x0 + (self.x - x0) * alpha
+        view.y     = y0 + (self.y - y0) * alpha
+        view.angle = a0 + (self.angle - a0) * alpha
+        view._refresh_dir()
+        return view
+
     # ── Mise à jour ───────────────────────────────────────────────────────
 
     def update(self, grid, dt: float, fwd: float, side: float, turn: float):
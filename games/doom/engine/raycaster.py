@@ -5,6 +5,9 @@ cast_rays(player, grid)
   → wall_type   int8[N]      type de mur touché (0 si rien)
   → side        int8[N]      0 = face EW, 1 = face NS (NS = plus sombre)
   → wall_x      float32[N]   position fractionnaire sur la face [0, 1)
+
+Les rayons qui ont touché sortent du calcul à chaque pas (compaction) : le
+coût suit le nombre de cases traversées, pas N_RAYS × MAX_DDA_STEPS.
 """
 import numpy as np
 from config import N_RAYS, MAX_DDA_STEPS
@@ -45,39 +48,64 @@ def cast_rays(player, grid):
                    (player.y - my) * ddy,
                    (my + 1.0 - player.y) * ddy).astype(np.float32)
 
-    # DDA loop (entièrement numpy, toutes les colonnes à la fois)
-    hit       = np.zeros(N, dtype=bool)
+    # Grille bordée d'une case de mur, aplatie : le hors-carte devient une
+    # case ordinaire (valeur de la case voisine, 1 si vide) et un pas n'est
+    # plus qu'une addition sur l'index plat (±1 en X, ±largeur en Y).
+    padded = np.pad(grid, 1, mode="edge")
+    padded[0, :]  = np.where(padded[0, :]  > 0, padded[0, :],  1)
+    padded[-1, :] = np.where(padded[-1, :] > 0, padded[-1, :], 1)
+    padded[:, 0]  = np.where(padded[:, 0]  > 0, padded[:, 0],  1)
+    padded[:, -1] = np.where(padded[:, -1] > 0, padded[:, -1], 1)
+    cells  = padded.ravel()
+    stride = MAP_W + 2
+
+    # DDA compacté : seuls les rayons encore en vol avancent. Chaque pas
+    # retire les rayons qui viennent de toucher (valeurs finales écrites à
+    # leur index) : le travail suit le nombre de cases traversées.
     side      = np.zeros(N, dtype=np.int8)
     wall_type = np.zeros(N, dtype=np.int8)
-
-    for _ in range(MAX_DDA_STEPS):
-        if hit.all():
+    end_sdx   = sdx.copy()
+    end_sdy   = sdy.copy()
+
+    idx    = np.arange(N)                                  # rayons en vol
+    pos    = (my + 1) * stride + (mx + 1)                  # index plat
+    a_sdx, a_sdy, a_ddx, a_ddy = sdx, sdy, ddx, ddy
+    a_sx, a_sy = step_x, step_y * stride
+    a_side = side
+
+    # Tout rayon atteint la bordure en MAP_W + MAP_H pas au plus :
+    # MAX_DDA_STEPS ne borne que la portée de vue.
+    for _ in range(min(MAX_DDA_STEPS, MAP_W + MAP_H)):
+        go_x = a_sdx < a_sdy
+        go_y = ~go_x
+        np.add(a_sdx, a_ddx, out=a_sdx, where=go_x)
+        np.add(a_sdy, a_ddy, out=a_sdy, where=go_y)
+        pos += np.where(go_x, a_sx, a_sy)
+        a_side = go_y.view(np.int8)                        # 0 = face EW, 1 = face NS
+
+        cell = cells[pos]
+        hit  = cell > 0
+        if not hit.any():
+            continue
+
+        done = idx[hit]
+        side[done]      = a_side[hit]
+        wall_type[done] = cell[hit]
+        end_sdx[done]   = a_sdx[hit]
+        end_sdy[done]   = a_sdy[hit]
+
+        keep = np.flatnonzero(~hit)
+        if keep.size == 0:
             break
-
-        alive = ~hit
-        go_x  = alive & (sdx < sdy)
-        go_y  = alive & ~go_x
-
-        # Avancer en X
-        sdx = np.where(go_x, sdx + ddx, sdx)
-        mx  = np.where(go_x, mx + step_x, mx)
-        side = np.where(go_x, 0, side).astype(np.int8)
-
-        # Avancer en Y
-        sdy = np.where(go_y, sdy + ddy, sdy)
-        my  = np.where(go_y, my + step_y, my)
-        side = np.where(go_y, 1, side).astype(np.int8)
-
-        # Clamp hors-carte → mur fictif
-        cx = np.clip(mx, 0, MAP_W - 1)
-        cy = np.clip(my, 0, MAP_H - 1)
-
-        cell   = grid[cy, cx].astype(np.int8)
-        new_hit = alive & ((cell > 0) |
-                           (mx < 0) | (mx >= MAP_W) |
-                           (my < 0) | (my >= MAP_H))
-        wall_type = np.where(new_hit, np.where(cell > 0, cell, 1), wall_type).astype(np.int8)
-        hit |= new_hit
+        idx, pos, a_side = idx[keep], pos[keep], a_side[keep]
+        a_sdx, a_sdy, a_ddx, a_ddy = a_sdx[keep], a_sdy[keep], a_ddx[keep], a_ddy[keep]
+        a_sx, a_sy = a_sx[keep], a_sy[keep]
+    else:
+        # Rayons encore en vol après MAX_DDA_STEPS : pas de mur (type 0)
+        side[idx]    = a_side
+        end_sdx[idx] = a_sdx
+        end_sdy[idx] = a_sdy
+    sdx, sdy = end_sdx, end_sdy
 
     # Distance perpendiculaire (évite l'effet fish-eye)
     perp = np.where(side == 0, sdx - ddx, sdy - ddy).astype(np.float32)
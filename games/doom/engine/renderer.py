@@ -1,22 +1,60 @@
 """Rendu du frame complet :
-  - plafond / sol (gradient)
-  - murs (vectorisé numpy via surfarray)
-  - sprites enemies (billboard)
+  - plafond / sol (dégradés, ou projetés en perspective si FLOOR_CASTING)
+  - murs texturés (vectorisé numpy, voir engine/textures.py)
+  - sprites ennemis (billboards RGBA, voir engine/sprites.py)
   - HUD (santé, munitions, arme)
+
+Murs sans allocation par frame : tous les tableaux (framebuffer uint8,
+index de texels, masque des spans) sont alloués une fois par init() et
+remplis avec des ufuncs `out=`. L'ombrage (face NS + brouillard) est
+pré-calculé dans une table de texels par niveau de luminosité : chaque pixel
+de mur est un simple `take` dans cette table. Le framebuffer est envoyé
+sur la surface par un seul `surfarray.blit_array`.
+
+Sol / plafond projetés (FLOOR_CASTING) : la distance au sol de chaque ligne
+écran, son niveau de brouillard et distance × coordonnée caméra de chaque
+pixel sont tabulés une fois par résolution. Par frame, seule la pose du
+joueur s'applique (deux multiplications-additions par pixel) avant le
+`take` dans la table de texels pré-ombrés du sol et du plafond.
 """
+import types
+
 import pygame
 import numpy as np
+import overlay_pool
 from config import (
     SCREEN_WIDTH, SCREEN_HEIGHT, RENDER_W, RENDER_H, HALF_H,
-    COL_CEILING, COL_FLOOR, WALL_COLORS,
+    COL_CEILING, COL_FLOOR, WALL_COLORS, TEXTURED_WALLS, TEX_SIZE, SPRITE_SIZE,
+    FLOOR_CASTING,
 )
+from engine import sprites, textures
+
+SHADE_LEVELS = 32    # niveaux de luminosité de la table de texels
+FOG_DIST     = 9.0   # distance (cases) du brouillard maximal (-75 %)
 
 # ── Surfaces internes ─────────────────────────────────────────────────────────
 _buf  = None   # surface 240×160 (render buffer)
+_lut  = None   # texels pré-ombrés uint8[SHADE_LEVELS·8·TEX·TEX, 3]
+_sprites = None   # sprites ennemis uint8[état, S, S, 4] (engine/sprites.py)
+_flat_lut = None  # sol / plafond pré-ombrés uint8[SHADE_LEVELS·2·TEX·TEX, 3]
+
+# ── Buffers persistants (alloués par init(), réutilisés à chaque frame) ──────
+_fb    = None   # framebuffer uint8 (W, H, 3)
+_texel = None   # texels des murs uint8 (W, H, 3)
+_idx   = None   # index dans _lut, intp (W, H)
+_vf    = None   # coordonnée v de texture, float32 (W, H)
+_mask  = None   # pixels de mur, bool (W, H)
+_mtmp  = None   # bool (W, H)
+_zbuf  = None   # distance de mur par colonne, float32 (W,)
+_col   = None   # tableaux par colonne (W,), voir _alloc_columns()
+_flat  = None   # tables par ligne + buffers du sol / plafond (FLOOR_CASTING)
 
 # ── Indices pré-calculés ──────────────────────────────────────────────────────
 _Y   = np.arange(RENDER_H, dtype=np.float32)          # (H,)
 _Y2D = _Y[np.newaxis, :]                               # (1, H) pour broadcast
+_YI  = np.arange(RENDER_H, dtype=np.int32)[np.newaxis, :]
+_SP_X = np.arange(RENDER_W, dtype=np.int32)            # colonnes écran (sprites)
+_SP_Y = np.arange(RENDER_H, dtype=np.int32)            # lignes écran (sprites)
 
 # Gradient plafond : sombre en haut, clair vers l'horizon
 _CEIL_T = (_Y[:HALF_H] / max(HALF_H - 1, 1)).astype(np.float32)  # 0→1
@@ -34,6 +72,9 @@ _FLOOR_COL = np.array([
     (COL_FLOOR[2] * (1.0 - _FLOOR_T * 0.55)).clip(0, 255),
 ], dtype=np.uint8).T   # shape (RENDER_H-HALF_H, 3)
 
+# Fond plafond + sol d'une colonne, shape (H, 3)
+_BG_COL = np.concatenate([_CEIL_COL, _FLOOR_COL])
+
 # Couleurs de mur pour les 5 types, shape (5+1, 3) indexé par wall_type
 _WPAL = np.zeros((8, 3), dtype=np.float32)
 for _wt, _wc in WALL_COLORS.items():
@@ -42,49 +83,166 @@ for _wt, _wc in WALL_COLORS.items():
 
 
 def init():
-    """Initialise les surfaces internes (appeler après pygame.init)."""
-    global _buf
+    """Initialise les surfaces et buffers internes (appeler après pygame.init)."""
+    global _buf, _lut, _sprites, _flat_lut
+    global _fb, _texel, _idx, _vf, _mask, _mtmp, _zbuf, _col, _flat
     _buf = pygame.Surface((RENDER_W, RENDER_H))
+    if _lut is None:
+        if TEXTURED_WALLS:
+            tex = textures.build()
+        else:
+            tex = np.broadcast_to(_WPAL[:, None, None, :], (8, TEX_SIZE, TEX_SIZE, 3))
+        _lut = _shade_lut(tex)
+    if FLOOR_CASTING and _flat_lut is None:
+        _flat_lut = _shade_lut(textures.build_flats())
+    if _sprites is None:
+        _sprites = sprites.build()
+    W, H = RENDER_W, RENDER_H
+    _fb    = np.empty((W, H, 3), dtype=np.uint8)
+    _texel = np.empty((W, H, 3), dtype=np.uint8)
+    _idx   = np.empty((W, H), dtype=np.intp)
+    _vf    = np.empty((W, H), dtype=np.float32)
+    _mask  = np.empty((W, H), dtype=bool)
+    _mtmp  = np.empty((W, H), dtype=bool)
+    _zbuf  = np.empty(W, dtype=np.float32)
+    _col   = _alloc_columns(W)
+    _flat  = _alloc_flats(W, H) if FLOOR_CASTING else None
+
+
+def _shade_lut(tex):
+    """Texels de chaque (niveau d'ombre, type, u, v), aplatis en (N, 3)."""
+    levels = np.linspace(0.0, 1.0, SHADE_LEVELS, dtype=np.float32)
+    lut = tex[np.newaxis].astype(np.float32) * levels[:, None, None, None, None]
+    return lut.astype(np.uint8).reshape(-1, 3)
+
+
+def _alloc_columns(W):
+    f = lambda: np.empty(W, dtype=np.float32)
+    i = lambda: np.empty(W, dtype=np.int32)
+    return types.SimpleNamespace(
+        f=f(), shade=f(), fog=f(), vstep=f(),
+        h=i(), half=i(), top0=i(), top=i(), bot=i(),
+        wt=i(), u=i(), base=i(), tmp=i(),
+    )
+
+
+def _alloc_flats(W, H):
+    """Tables du sol / plafond pour cette résolution, et buffers de frame."""
+    y    = np.arange(H, dtype=np.float32)
+    dist = (HALF_H / np.abs(y + 0.5 - HALF_H)).astype(np.float32)   # (H,) cases
+    cam  = 2.0 * np.arange(W, dtype=np.float32) / W - 1.0            # comme le raycaster
+    fog  = np.clip(dist / FOG_DIST, 0.0, 1.0)
+    lvl  = ((1.0 - 0.75 * fog) * (SHADE_LEVELS - 1) + 0.5).astype(np.intp)
+    kind = (y < HALF_H).astype(np.intp)                               # 0 sol, 1 plafond
+    return types.SimpleNamespace(
+        dist     = dist,
+        cam_dist = (cam[:, np.newaxis] * dist[np.newaxis, :]).astype(np.float32),  # (W, H)
+        base     = (lvl * 2 + kind) * TEX_SIZE * TEX_SIZE,           # (H,) index dans _flat_lut
+        row      = np.empty(H, dtype=np.float32),
+        fx       = np.empty((W, H), dtype=np.float32),
+        fy       = np.empty((W, H), dtype=np.float32),
+        iu       = np.empty((W, H), dtype=np.intp),
+        iv       = np.empty((W, H), dtype=np.intp),
+    )
+
+
+def _flats(player):
+    """Remplit _fb avec le sol et le plafond projetés depuis la pose du joueur."""
+    f, T = _flat, TEX_SIZE
+
+    # Point du sol vu par chaque pixel : pos + dist·dir + dist·cam·plan
+    for out, pos, d, plane in ((f.fx, player.x, player.dx, player.px),
+                               (f.fy, player.y, player.dy, player.py)):
+        np.multiply(f.cam_dist, plane, out=out)
+        np.multiply(f.dist, d, out=f.row)
+        f.row += pos
+        out += f.row
+        out *= T
+
+    # Texel (u, v) répété tous les 1 case, index dans _flat_lut
+    np.copyto(f.iu, f.fx, casting="unsafe")
+    np.copyto(f.iv, f.fy, casting="unsafe")
+    np.bitwise_and(f.iu, T - 1, out=f.iu)
+    np.bitwise_and(f.iv, T - 1, out=f.iv)
+    f.iu *= T
+    f.iu += f.iv
+    f.iu += f.base
+    np.take(_flat_lut, f.iu, axis=0, out=_fb, mode="clip")
+
+
+def _walls(perp_dist, wall_type, side, wall_x):
+    """Remplit _fb (fond déjà copié) avec les spans de mur de chaque colonne."""
+    c, T = _col, TEX_SIZE
+
+    # Hauteur et span vertical de chaque colonne
+    np.divide(RENDER_H, perp_dist, out=c.f)
+    np.minimum(c.f, RENDER_H * 4, out=c.f)
+    np.copyto(c.h, c.f, casting="unsafe")
+    np.maximum(c.h, 0, out=c.h)
+    np.right_shift(c.h, 1, out=c.half)                   # wall_h // 2
+    np.subtract(HALF_H, c.half, out=c.top0)              # sommet non clampé
+    np.maximum(c.top0, 0, out=c.top)
+    np.add(HALF_H, c.half, out=c.bot)
+    np.minimum(c.bot, RENDER_H, out=c.bot)
+
+    # Niveau d'ombre : face NS assombrie ×0.5, brouillard jusqu'à -75 %
+    np.multiply(perp_dist, 1.0 / FOG_DIST, out=c.fog)
+    np.clip(c.fog, 0.0, 1.0, out=c.fog)
+    np.multiply(c.fog, -0.75, out=c.fog)
+    c.fog += 1.0
+    np.multiply(side, -0.5, out=c.shade)
+    c.shade += 1.0
+    c.shade *= c.fog
+    c.shade *= SHADE_LEVELS - 1
+    c.shade += 0.5
+
+    # Index de base dans _lut : ((niveau·8 + type)·T + u)·T
+    np.copyto(c.base, c.shade, casting="unsafe")
+    np.clip(wall_type, 0, 7, out=c.wt)
+    np.multiply(wall_x, T, out=c.f)
+    np.copyto(c.u, c.f, casting="unsafe")
+    np.minimum(c.u, T - 1, out=c.u)
+    c.base *= 8
+    c.base += c.wt
+    c.base *= T
+    c.base += c.u
+    c.base *= T
+
+    # v : pas vertical TEX / hauteur, origine au sommet non clampé
+    np.maximum(c.h, 1, out=c.tmp)
+    np.divide(T, c.tmp, out=c.vstep)
+    np.subtract(_Y2D, c.top0[:, np.newaxis], out=_vf)
+    np.multiply(_vf, c.vstep[:, np.newaxis], out=_vf)
+    np.copyto(_idx, _vf, casting="unsafe")
+    np.clip(_idx, 0, T - 1, out=_idx)
+    np.add(_idx, c.base[:, np.newaxis], out=_idx)
+    np.take(_lut, _idx, axis=0, out=_texel, mode="clip")
+
+    # Span [top, bot) de chaque colonne
+    np.greater_equal(_YI, c.top[:, np.newaxis], out=_mask)
+    np.less(_YI, c.bot[:, np.newaxis], out=_mtmp)
+    np.logical_and(_mask, _mtmp, out=_mask)
+    np.copyto(_fb, _texel, where=_mask[:, :, np.newaxis])
 
 
 def render_frame(screen: pygame.Surface, player, perp_dist, wall_type,
-                 side, entities, gun_kick: float = 0.0,
+                 side, wall_x, entities, gun_kick: float = 0.0,
                  hurt_alpha: int = 0):
     """Rendu complet d'un frame puis blit ×2 sur screen."""
     assert _buf is not None, "Appeler renderer.init() d'abord"
 
-    # ── Pixel buffer ──────────────────────────────────────────────────────
-    px = pygame.surfarray.pixels3d(_buf)   # shape (W, H, 3)
-
-    # Plafond / sol (broadcast sur toutes les colonnes)
-    px[:, :HALF_H, :] = _CEIL_COL[np.newaxis, :, :]   # (1,HALF_H,3)→(W,H,3)
-    px[:, HALF_H:, :] = _FLOOR_COL[np.newaxis, :, :]
-
-    # ── Murs ──────────────────────────────────────────────────────────────
-    wall_h = np.clip((RENDER_H / perp_dist).astype(np.int32), 0, RENDER_H * 4)
-    wtop   = np.maximum(HALF_H - wall_h // 2, 0)           # (W,)
-    wbot   = np.minimum(HALF_H + wall_h // 2, RENDER_H)    # (W,)
-
-    # Couleur de base par type de mur
-    wt_safe = np.clip(wall_type.astype(np.int32), 0, 7)
-    base    = _WPAL[wt_safe]                                # (W, 3)
-
-    # Assombrir face NS + brouillard de distance
-    darken = np.where(side == 1, 0.5, 1.0)[:, np.newaxis]  # (W, 1)
-    fog    = np.clip(perp_dist / 9.0, 0.0, 1.0)[:, np.newaxis]
-    col    = (base * darken * (1.0 - fog * 0.75)).astype(np.uint8)  # (W, 3)
-
-    # Masque boolean (W, H) → où dessiner le mur
-    mask = (_Y2D >= wtop[:, np.newaxis]) & (_Y2D < wbot[:, np.newaxis])  # (W,H)
-    px[:] = np.where(mask[:, :, np.newaxis], col[:, np.newaxis, :], px)
+    # ── Framebuffer : plafond / sol, murs puis sprites ───────────────────
+    if _flat is not None:
+        _flats(player)
+    else:
+        _fb[:] = _BG_COL[np.newaxis, :, :]
+    _walls(perp_dist, wall_type, side, wall_x)
 
     # Z-buffer pour les sprites (distance de mur par colonne)
-    z_buf = perp_dist.copy()
+    np.copyto(_zbuf, perp_dist, casting="same_kind")
+    _draw_sprites(player, entities, _zbuf)
 
-    del px   # libérer le lock surfarray
-
-    # ── Sprites ennemis ───────────────────────────────────────────────────
-    _draw_sprites(player, entities, z_buf)
+    pygame.surfarray.blit_array(_buf, _fb)
 
     # ── Scale ×2 ──────────────────────────────────────────────────────────
     pygame.transform.scale(_buf, (SCREEN_WIDTH, SCREEN_HEIGHT), screen)
@@ -96,69 +254,54 @@ def render_frame(screen: pygame.Surface, player, perp_dist, wall_type,
 # ── Sprites ───────────────────────────────────────────────────────────────────
 
 def _draw_sprites(player, entities, z_buf):
-    """Billboard sprites pour les ennemis (tri peintre, de plus loin au plus proche)."""
+    """Billboards des ennemis dans _fb, du plus loin au plus proche.
+
+    Projection de tous les ennemis en une passe numpy ; puis, par sprite,
+    une tranche de texture (colonnes × lignes) copiée avec un masque
+    alpha ∧ colonnes devant le mur (z-buffer). Coût par sprite, pas par colonne.
+    """
     alive = [e for e in entities if not e.dead]
     if not alive:
         return
 
-    det = player.dx * player.py - player.dy * player.px  # = CAM_PLANE
-
-    # Trier par distance décroissante (peindre les plus lointains d'abord)
-    alive.sort(key=lambda e: (e.x - player.x)**2 + (e.y - player.y)**2,
-               reverse=True)
+    pos   = np.array([(e.x, e.y) for e in alive], dtype=np.float32)
+    state = np.array([e.state for e in alive], dtype=np.int32)
+    spx   = pos[:, 0] - player.x
+    spy   = pos[:, 1] - player.y
 
-    for ent in alive:
-        # Vecteur joueur → sprite dans le repère monde
-        spx = ent.x - player.x
-        spy = ent.y - player.y
+    # Transformation dans l'espace caméra (ty = profondeur, même mesure que z_buf)
+    det = player.px * player.dy - player.dx * player.py  # = -CAM_PLANE
+    tx  = ( player.dy * spx - player.dx * spy) / det
+    ty  = (-player.py * spx + player.px * spy) / det
 
-        # Transformation dans l'espace caméra
-        tx  = ( player.py * spx - player.px * spy) / det
-        ty  = (-player.dy * spx + player.dx * spy) / det
-
-        if ty <= 0.05:
-            continue    # derrière la caméra
-
-        sc_x = int(RENDER_W / 2 * (1.0 + tx / ty))
-        sp_h = abs(int(RENDER_H / ty))
-        sp_w = sp_h
-
-        draw_y_start = max(0, HALF_H - sp_h // 2)
-        draw_y_end   = min(RENDER_H, HALF_H + sp_h // 2)
-        draw_x_start = max(0, sc_x - sp_w // 2)
-        draw_x_end   = min(RENDER_W, sc_x + sp_w // 2)
-
-        if draw_x_end <= draw_x_start or draw_y_end <= draw_y_start:
+    front = np.flatnonzero(ty > 0.05)            # devant la caméra
+    if front.size == 0:
+        return
+    front = front[np.argsort(-ty[front])]        # tri peintre
+    sc_x  = (RENDER_W / 2 * (1.0 + tx[front] / ty[front])).astype(np.int32)
+    sp_h  = np.abs(RENDER_H / ty[front]).astype(np.int32)
+    left  = sc_x - sp_h // 2
+    top   = HALF_H - sp_h // 2
+    x0    = np.maximum(left, 0)
+    x1    = np.minimum(sc_x + sp_h // 2, RENDER_W)
+    y0    = np.maximum(top, 0)
+    y1    = np.minimum(HALF_H + sp_h // 2, RENDER_H)
+
+    S = SPRITE_SIZE
+    for k in np.flatnonzero((x1 > x0) & (y1 > y0)):
+        i = front[k]
+        cx0, cx1, cy0, cy1 = int(x0[k]), int(x1[k]), int(y0[k]), int(y1[k])
+        vis = z_buf[cx0:cx1] > ty[i]             # colonnes non masquées par un mur
+        if not vis.any():
             continue
-
-        color = _sprite_color(ent)
-
-        # Vérification z_buffer colonne par colonne
-        for sx in range(draw_x_start, draw_x_end):
-            if sx < 0 or sx >= RENDER_W:
-                continue
-            if ty >= z_buf[sx]:
-                continue   # mur devant
-            # Ratio vertical pour l'effet corps-centre-tête
-            _draw_sprite_col(_buf, sx, draw_y_start, draw_y_end, sp_h, color)
-
-
-def _sprite_color(ent):
-    from engine.entities import Enemy
-    if ent.state == Enemy.CHASE:
-        return (220, 180, 30)    # jaune = alerte
-    if ent.state == Enemy.ATTACK:
-        return (220, 70, 30)     # orange = attaque
-    return (60, 180, 60)          # vert = idle
-
-
-def _draw_sprite_col(surf, sx, y0, y1, sp_h, color):
-    """Dessine une colonne du sprite avec un dégradé corps/tête simple."""
-    # Tête : quart supérieur, légèrement plus clair
-    mid   = y0 + sp_h // 4
-    tc    = tuple(min(255, c + 40) for c in color)
-    pygame.draw.line(surf, tc,  (sx, y0), (sx, min(mid, y1 - 1)))
-    pygame.draw.line(surf, color, (sx, min(mid, y1 - 1) + 1), (sx, y1 - 1))
+        h   = int(sp_h[k])
+        u   = (_SP_X[cx0:cx1] - left[k]) * S // h
+        v   = (_SP_Y[cy0:cy1] - top[k]) * S // h
+        img = _sprites[min(state[i], len(_sprites) - 1)]
+        slab = img.take(u, axis=0).take(v, axis=1)                  # (w, h, 4)
+        mask = slab[:, :, 3] >= 128
+        mask &= vis[:, np.newaxis]
+        np.copyto(_fb[cx0:cx1, cy0:cy1], slab[:, :, :3], where=mask[:, :, np.newaxis])
 
 
 # ── HUD ───────────────────────────────────────────────────────────────────────
@@ -180,9 +323,7 @@ def _draw_hud(screen: pygame.Surface, player, gun_kick: float, hurt_alpha: int):
 
     # ── Overlay rouge si blessé ───────────────────────────────────────────
     if hurt_alpha > 0:
-        hurt = pygame.Surface((SW, SH), pygame.SRCALPHA)
-        hurt.fill((180, 20, 20, min(hurt_alpha, 160)))
-        screen.blit(hurt, (0, 0))
+        overlay_pool.fill(screen, (180, 20, 20, min(hurt_alpha, 160)))
 
     # ── Bande HUD en bas ─────────────────────────────────────────────────
     hud_rect = pygame.Rect(0, SH - 36, SW, 36)
@@ -0,0 +1,65 @@
+"""Sprites des ennemis RGBA (numpy), générés ou chargés une fois à l'init.
+
+build() → uint8[3, SPRITE_SIZE, SPRITE_SIZE, 4] indexé [état, u, v] :
+  état = Enemy.IDLE / CHASE / ATTACK, u = colonne, v = ligne (0 = haut),
+  canal 3 = alpha (< 128 → transparent). Même ordre d'axes que surfarray.
+
+Une image `sprites/enemy_<idle|chase|attack>.png` (dossier du jeu, avec
+transparence) remplace le sprite procédural de cet état ; elle est
+redimensionnée à SPRITE_SIZE.
+"""
+import os
+
+import numpy as np
+import pygame
+from config import SPRITE_SIZE
+
+S = SPRITE_SIZE
+
+_STATES = ("idle", "chase", "attack")
+_COLORS = (
+    ( 60, 180,  60),   # vert   = idle
+    (220, 180,  30),   # jaune  = alerte
+    (220,  70,  30),   # orange = attaque
+)
+_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "sprites")
+
+
+def _silhouette():
+    """Masques (corps, tête) d'une silhouette de S×S, indexés [u, v]."""
+    u, v = np.meshgrid(np.arange(S), np.arange(S), indexing="ij")
+    c    = S / 2 - 0.5
+    head = (u - c) ** 2 + (v - S * 0.16) ** 2 <= (S * 0.15) ** 2
+    torso = (np.abs(u - c) < S * 0.22) & (v >= S * 0.30) & (v < S * 0.72)
+    arms  = (np.abs(u - c) < S * 0.40) & (v >= S * 0.34) & (v < S * 0.46)
+    legs  = (np.abs(np.abs(u - c) - S * 0.12) < S * 0.08) & (v >= S * 0.72)
+    return torso | arms | legs, head, u
+
+
+def _procedural(color):
+    body, head, u = _silhouette()
+    # Relief : bords plus sombres, tête plus claire (comme l'ancien dégradé)
+    light = 1.0 - 0.35 * np.abs(u - S / 2) / (S / 2)
+    base  = np.array(color, dtype=np.float32)
+    img   = np.zeros((S, S, 4), dtype=np.uint8)
+    img[..., :3] = np.clip(base * light[..., np.newaxis], 0, 255)
+    img[head, :3] = np.clip(base + 40, 0, 255)
+    img[..., 3] = np.where(body | head, 255, 0)
+    return img
+
+
+def _load(path):
+    surf = pygame.transform.scale(pygame.image.load(path), (S, S))
+    img  = np.empty((S, S, 4), dtype=np.uint8)
+    img[..., :3] = pygame.surfarray.array3d(surf)
+    img[..., 3]  = pygame.surfarray.array_alpha(surf)
+    return img
+
+
+def build():
+    """Sprite de chaque état : PNG s'il existe, sinon procédural."""
+    out = np.empty((len(_STATES), S, S, 4), dtype=np.uint8)
+    for i, (name, color) in enumerate(zip(_STATES, _COLORS)):
+        path = os.path.join(_DIR, f"enemy_{name}.png")
+        out[i] = _load(path) if os.path.exists(path) else _procedural(color)
+    return out
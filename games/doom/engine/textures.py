@@ -0,0 +1,111 @@
+"""Textures murales procédurales (numpy), générées une fois à l'init.
+
+build() → uint8[8, TEX_SIZE, TEX_SIZE, 3] indexé [type, u, v] :
+  u = position horizontale sur la face (wall_x), v = hauteur (0 = haut).
+Même ordre d'axes que surfarray (x, y), pour l'indexation du renderer.
+
+  1 = brique   2 = pierre/mousse   3 = métal riveté   4 = or   5 = porte
+Type 0 (pas de mur) reste noir. Couleurs de base : WALL_COLORS.
+
+build_flats() → uint8[2, TEX_SIZE, TEX_SIZE, 3] : 0 = dalles du sol,
+1 = panneaux du plafond (FLOOR_CASTING), teintés par COL_FLOOR / COL_CEILING.
+"""
+import numpy as np
+from config import TEX_SIZE, WALL_COLORS, COL_FLOOR, COL_CEILING
+
+T = TEX_SIZE
+
+
+def _grid():
+    """Coordonnées (u, v) entières, shape (T, T) chacune."""
+    return np.meshgrid(np.arange(T), np.arange(T), indexing="ij")
+
+
+def _value_noise(rng, cells: int):
+    """Bruit lisse [0, 1] : grille aléatoire cells×cells interpolée (bilinéaire)."""
+    g  = rng.random((cells + 1, cells + 1))
+    t  = np.arange(T) * cells / T
+    i  = t.astype(np.int32)
+    f  = t - i
+    a  = g[i][:, i] * (1 - f)[None, :] + g[i][:, i + 1] * f[None, :]
+    b  = g[i + 1][:, i] * (1 - f)[None, :] + g[i + 1][:, i + 1] * f[None, :]
+    return a * (1 - f)[:, None] + b * f[:, None]
+
+
+def _brick(rng, u, v):
+    row    = v // 8
+    joint  = (u + (row % 2) * 8) % 16 == 0
+    mortar = (v % 8 == 0) | joint
+    shade  = 0.85 + 0.3 * rng.random((T // 16 + 2, T // 8))[((u + (row % 2) * 8) // 16), row]
+    light  = shade * (0.9 + 0.1 * rng.random((T, T)))
+    return np.where(mortar, 0.45, light)
+
+
+def _stone(rng, u, v):
+    n = 0.6 * _value_noise(rng, 4) + 0.4 * _value_noise(rng, 8)
+    cracks = np.abs(_value_noise(rng, 3) - 0.5) < 0.03
+    return np.where(cracks, 0.4, 0.65 + 0.55 * n)
+
+
+def _metal(rng, u, v):
+    panel  = ((u % 16 == 0) | (v % 16 == 0)) * -0.35
+    edge   = ((u % 16 == 15) | (v % 16 == 15)) * 0.2
+    rivet  = np.isin(u % 16, (3, 12)) & np.isin(v % 16, (3, 12))
+    brush  = 0.06 * rng.random(T)[None, :].repeat(T, axis=0)
+    return np.where(rivet, 1.35, 0.9 + panel + edge + brush)
+
+
+def _gold(rng, u, v):
+    diamond = (np.abs((u % 16) - 8) + np.abs((v % 16) - 8)) < 5
+    band    = (v % 16 < 2)
+    shine   = 0.15 * np.cos((u + v) * np.pi / T)
+    return np.where(band, 0.6, np.where(diamond, 1.25, 0.95)) + shine
+
+
+def _door(rng, u, v):
+    plank  = np.where(u % 8 == 0, 0.55, 0.9 + 0.15 * _value_noise(rng, 6))
+    bars   = (v // 2 == 3) | (v // 2 == T // 2 - 4)
+    handle = (np.abs(u - T * 3 // 4) <= 1) & (np.abs(v - T // 2) <= 1)
+    return np.where(handle, 1.5, np.where(bars, 0.5, plank))
+
+
+_PATTERNS = {1: _brick, 2: _stone, 3: _metal, 4: _gold, 5: _door}
+
+
+def build():
+    """Texture de chaque type de mur, déterministe (graine fixe)."""
+    rng  = np.random.default_rng(0)
+    u, v = _grid()
+    tex  = np.zeros((8, T, T, 3), dtype=np.uint8)
+    for wt, pattern in _PATTERNS.items():
+        light = pattern(rng, u, v)[:, :, np.newaxis]
+        tex[wt] = np.clip(np.array(WALL_COLORS[wt], dtype=np.float32) * light, 0, 255)
+    return tex
+
+
+# ── Sol / plafond ─────────────────────────────────────────────────────────────
+
+_FLAT_GAIN = 2.2   # COL_FLOOR / COL_CEILING sont des couleurs de fond sombres
+
+
+def _flagstones(rng, u, v):
+    joint = (u % 16 == 0) | (v % 16 == 0)
+    tile  = 0.8 + 0.3 * rng.random((T // 16, T // 16))[u // 16, v // 16]
+    return np.where(joint, 0.5, tile * (0.8 + 0.3 * _value_noise(rng, 8)))
+
+
+def _panels(rng, u, v):
+    seam  = (u % 8 == 0) | (v % 8 == 0)
+    light = (u % 16 == 12) & (v % 16 == 12)
+    return np.where(light, 2.5, np.where(seam, 0.6, 0.95 + 0.1 * _value_noise(rng, 4)))
+
+
+def build_flats():
+    """Textures du sol et du plafond, déterministes (graine fixe)."""
+    rng  = np.random.default_rng(1)
+    u, v = _grid()
+    tex  = np.zeros((2, T, T, 3), dtype=np.uint8)
+    for i, (pattern, color) in enumerate(((_flagstones, COL_FLOOR), (_panels, COL_CEILING))):
+        light = pattern(rng, u, v)[:, :, np.newaxis] * _FLAT_GAIN
+        tex[i] = np.clip(np.array(color, dtype=np.float32) * light, 0, 255)
+    return tex
@@ -21,6 +21,8 @@ from engine.entities import Enemy
 from engine.raycaster import cast_rays
 from engine import renderer
 from quit_combo import QuitCombo
+from frame_profiler import FrameProfiler
+from fixed_step import FixedStep
 
 
 def run(screen: pygame.Surface, joysticks: list):
@@ -29,6 +31,7 @@ def run(screen: pygame.Surface, joysticks: list):
     renderer.init()
     clock   = pygame.time.Clock()
     qc      = QuitCombo()
+    prof    = FrameProfiler()
     joy     = joysticks[0] if joysticks else None
 
     player  = Player(*PLAYER_START, PLAYER_START_ANGLE)
@@ -37,12 +40,17 @@ def run(screen: pygame.Surface, joysticks: list):
     gun_kick   = 0.0     # animation de recul arme [0, 1]
     mmap_alpha = 0       # minimap (toggle)
 
+    step       = FixedStep(FPS)
+    prev_pose  = player.pose()
+
     while True:
-        dt     = min(clock.tick(FPS) / 1000.0, 0.05)
+        dt     = clock.tick(FPS) / 1000.0
+        prof.mark("wait")
         events = pygame.event.get()
 
         for e in events:
             qc.handle_event(e)
+            prof.handle_event(e)
 
         if qc.update_and_draw(screen):
             return None
@@ -51,8 +59,9 @@ def run(screen: pygame.Surface, joysticks: list):
         keys   = pygame.key.get_pressed()
         fwd, side, turn = _read_movement(keys, joy)
         fired  = _read_fire(keys, joy, events)
+        prof.mark("input")
 
-        # ── Tir ───────────────────────────────────────────────────────────
+        # ── Tir (sur la pose simulée, pas la pose interpolée) ─────────────
         if fired and player.try_fire():
             gun_kick = 1.0
             # Raycaster pour le z-buffer de détection
@@ -61,17 +70,17 @@ def run(screen: pygame.Surface, joysticks: list):
                 if not ent.dead and ent.is_hit_by_shot(player, perp_dist):
                     ent.take_damage(BULLET_DAMAGE)
                     break   # 1 ennemi par tir
-        else:
-            # Raycaster normal
-            perp_dist, wall_type, side_arr, wall_x = cast_rays(player, GRID)
 
-        # ── Mise à jour ───────────────────────────────────────────────────
-        player.update(GRID, dt, fwd, side, turn)
+        # ── Mise à jour (pas fixe) ────────────────────────────────────────
+        for _ in step.advance(dt):
+            prev_pose = player.pose()
+            player.update(GRID, step.dt, fwd, side, turn)
 
-        for ent in enemies:
-            ent.update(GRID, player, dt)
+            for ent in enemies:
+                ent.update(GRID, player, step.dt)
 
-        gun_kick = max(0.0, gun_kick - dt * 4.0)   # rebond rapide
+            gun_kick = max(0.0, gun_kick - step.dt * 4.0)   # rebond rapide
+        prof.mark("update")
 
         # ── Conditions de fin ─────────────────────────────────────────────
         if player.dead:
@@ -79,10 +88,15 @@ def run(screen: pygame.Surface, joysticks: list):
         if all(e.dead for e in enemies):
             return 'win'
 
+        # ── Raycast sur la pose interpolée ────────────────────────────────
+        view = player.interpolated(prev_pose, step.alpha)
+        perp_dist, wall_type, side_arr, wall_x = cast_rays(view, GRID)
+        prof.mark("raycast")
+
         # ── Rendu ─────────────────────────────────────────────────────────
         hurt_alpha = int(player.hurt_timer / 0.3 * 140) if player.hurt_timer > 0 else 0
-        renderer.render_frame(screen, player, perp_dist, wall_type, side_arr,
-                              enemies, gun_kick, hurt_alpha)
+        renderer.render_frame(screen, view, perp_dist, wall_type, side_arr,
+                              wall_x, enemies, gun_kick, hurt_alpha)
 
         # Mini-map (debug) – activée par SELECT seul (btn 12) maintenu
         if joy and joy.get_button(BTN_SELECT):
@@ -90,8 +104,12 @@ def run(screen: pygame.Surface, joysticks: list):
 
         # Réticule
         _draw_crosshair(screen)
+        prof.mark("render")
 
+        prof.draw(screen)
         pygame.display.flip()
+        prof.mark("flip")
+        prof.end_frame()
 
 
 # ── Input helpers ─────────────────────────────────────────────────────────────
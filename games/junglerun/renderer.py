@@ -6,6 +6,9 @@ appliqué via un offset sur les éléments de gameplay (le ciel reste fixe).
 import math
 import pygame
 
+import font_cache
+import overlay_pool
+from fixed_step import lerp
 from config import (
     VIEW_W, VIEW_H,
     SKY_TOP, SKY_BOTTOM,
@@ -35,12 +38,18 @@ def _get_sky() -> pygame.Surface:
 
 
 def draw(surf: pygame.Surface, world: World, player_color, font_hud,
-         label: str) -> None:
-    """Dessine une viewport complète pour un joueur dans `surf`."""
+         label: str, alpha: float = 1.0) -> None:
+    """Dessine une viewport complète pour un joueur dans `surf`.
+
+    `alpha` : interpolation entre les deux derniers pas de simulation.
+    """
     surf.blit(_get_sky(), (0, 0))
 
+    scroll_x = lerp(world.prev_scroll_x, world.scroll_x, alpha)
+    player_y = lerp(world.prev_player_y, world.player.y, alpha)
+
     # Silhouettes de feuillage en parallax (fond léger).
-    _draw_canopy(surf, world.scroll_x)
+    _draw_canopy(surf, scroll_x)
 
     # Shake éventuel (séisme).
     sx = sy = 0
@@ -54,7 +63,7 @@ def draw(surf: pygame.Surface, world: World, player_color, font_hud,
 
     # ── Plateformes ──────────────────────────────────────────────────────────
     for plat in world.platforms:
-        x = int(plat.x - world.scroll_x) + sx
+        x = int(plat.x - scroll_x) + sx
         y = int(plat.y) + sy
         w = int(plat.w)
         h = int(plat.h)
@@ -84,13 +93,13 @@ def draw(surf: pygame.Surface, world: World, player_color, font_hud,
 
         # Rocher (obstacle).
         if plat.rock is not None:
-            ox = int(plat.rock - world.scroll_x) + sx
+            ox = int(plat.rock - scroll_x) + sx
             pygame.draw.rect(surf, ROCK_COLOR, (ox - 7, y - 14, 14, 14))
             pygame.draw.rect(surf, (50, 45, 40), (ox - 7, y - 14, 14, 14), 1)
 
         # Branche basse (au-dessus de la plateforme).
         if plat.branch_x is not None:
-            ox = int(plat.branch_x - world.scroll_x) + sx
+            ox = int(plat.branch_x - scroll_x) + sx
             pygame.draw.rect(surf, BRANCH_COLOR, (ox - 11, y - 38, 22, 6))
             # Petites feuilles pour souligner le danger en haut.
             pygame.draw.circle(surf, (100, 160, 80), (ox - 14, y - 35), 4)
@@ -98,13 +107,13 @@ def draw(surf: pygame.Surface, world: World, player_color, font_hud,
 
         # Plume (pickup).
         if plat.feather is not None:
-            ox = int(plat.feather - world.scroll_x) + sx
+            ox = int(plat.feather - scroll_x) + sx
             oy = y - 24 + int(math.sin(world.elapsed * 5.0) * 3)
             _draw_feather(surf, ox, oy)
 
     # ── Joueur ───────────────────────────────────────────────────────────────
     px = PLAYER_SCREEN_X + sx
-    py = int(world.player.y) + sy
+    py = int(player_y) + sy
     color = player_color
     # Clignote si vient d'utiliser plume.
     if world.player.flash_t > 0 and int(world.player.flash_t * 30) % 2 == 0:
@@ -117,14 +126,11 @@ def draw(surf: pygame.Surface, world: World, player_color, font_hud,
 
     # Bouclier plume actif → halo doré autour.
     if world.player.shield:
-        halo = pygame.Surface((PLAYER_W + 12, PLAYER_H + 12), pygame.SRCALPHA)
-        pygame.draw.ellipse(halo, (255, 230, 120, 110), halo.get_rect())
+        halo = overlay_pool.ellipse((PLAYER_W + 12, PLAYER_H + 12), (255, 230, 120, 110))
         surf.blit(halo, (px - PLAYER_W // 2 - 6, py - 6))
 
     # ── HUD ──────────────────────────────────────────────────────────────────
-    hud_bg = pygame.Surface((VIEW_W, 18), pygame.SRCALPHA)
-    hud_bg.fill((0, 0, 0, 110))
-    surf.blit(hud_bg, (0, 0))
+    overlay_pool.fill(surf, (0, 0, 0, 110), (0, 0, VIEW_W, 18))
     txt = font_hud.render(f"{label}  ·  {world.distance} m", True, TEXT_COLOR)
     surf.blit(txt, (6, 2))
     if world.player.shield:
@@ -135,11 +141,9 @@ def draw(surf: pygame.Surface, world: World, player_color, font_hud,
 
     # ── Mort ─────────────────────────────────────────────────────────────────
     if not world.player.alive:
-        overlay = pygame.Surface((VIEW_W, VIEW_H), pygame.SRCALPHA)
-        overlay.fill(DEAD_OVERLAY)
-        surf.blit(overlay, (0, 0))
-        big = pygame.font.SysFont("Arial", 26, bold=True).render(
-            f"{label} – MORT", True, (240, 90, 90))
+        overlay_pool.fill(surf, DEAD_OVERLAY)
+        big = font_cache.render(font_cache.get_font("Arial", 26, bold=True),
+                                f"{label} – MORT", (240, 90, 90))
         surf.blit(big, (VIEW_W // 2 - big.get_width() // 2,
                         VIEW_H // 2 - big.get_height() // 2 - 8))
         sub = font_hud.render(f"distance : {world.distance} m", True, (220, 220, 220))
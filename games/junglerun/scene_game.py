@@ -15,6 +15,7 @@ from config import (
     J1_DPAD_BTNS, J2_FACE_BTNS, J1_KEYS, J2_KEYS, AXIS_DEAD,
 )
 from quit_combo import QuitCombo
+from fixed_step import FixedStep
 from world import World
 from renderer import draw as draw_world
 
@@ -68,13 +69,16 @@ def run(screen, joysticks):
 
     # Petite intro "GO" pour stabiliser l'affichage.
     _show_go(screen, font_hud)
+    step = FixedStep(FPS)
 
+    # Sauts en attente : gardés tant qu'aucun pas de simulation ne les a
+    # consommés (une frame courte peut n'exécuter aucun pas).
+    jump1 = False
+    jump2 = False
     while True:
         dt = clock.tick(FPS) / 1000.0
         events = pygame.event.get()
 
-        jump1 = False
-        jump2 = False
         for e in events:
             quit_combo.handle_event(e)
             if e.type == pygame.QUIT:
@@ -94,12 +98,15 @@ def run(screen, joysticks):
             if _is_j2_jump_event(e):
                 jump2 = True
 
-        world1.update(dt, jump1)
-        world2.update(dt, jump2)
+        # Simulation à pas fixe ; un saut n'est consommé que par le premier pas.
+        for _ in step.advance(dt):
+            world1.update(step.dt, jump1)
+            world2.update(step.dt, jump2)
+            jump1 = jump2 = False
 
-        # Rendu.
-        draw_world(surf1, world1, PLAYER_J1, font_hud, "J1")
-        draw_world(surf2, world2, PLAYER_J2, font_hud, "J2")
+        # Rendu (interpolé entre les deux derniers pas).
+        draw_world(surf1, world1, PLAYER_J1, font_hud, "J1", step.alpha)
+        draw_world(surf2, world2, PLAYER_J2, font_hud, "J2", step.alpha)
 
         screen.blit(surf1, (0, 0))
         pygame.draw.rect(screen, SEPARATOR_COL, (0, VIEW_H, SCREEN_WIDTH, SEPARATOR_H))
@@ -67,6 +67,9 @@ class World:
         self.shake_mag = 0.0
         self._spawn_x = 0.0          # prochaine x à laquelle générer
         self._initial_setup()
+        # État au pas précédent (interpolation du rendu).
+        self.prev_scroll_x = self.scroll_x
+        self.prev_player_y = self.player.y
 
     # ── Génération ───────────────────────────────────────────────────────────
     def _initial_setup(self):
@@ -119,6 +122,8 @@ class World:
 
     # ── Update ───────────────────────────────────────────────────────────────
     def update(self, dt: float, jump_pressed: bool):
+        self.prev_scroll_x = self.scroll_x
+        self.prev_player_y = self.player.y
         if not self.player.alive:
             # Le joueur tombe encore mais le monde ne scrolle plus.
             self._update_dead_fall(dt)
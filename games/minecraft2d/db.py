@@ -15,12 +15,19 @@ Schéma :
 On applique ces deltas après generate(seed) pour retrouver l'état exact.
 
 "players" stocke la position et l'inventaire de chaque joueur (JSON).
+
+Les sauvegardes en cours de partie (save_block*, save_player) passent par
+`persist` : exécutées sur le thread d'écriture avec une connexion ouverte une
+seule fois. Les autres fonctions (menu, chargement) restent synchrones et
+commencent par `persist.flush()` via init() pour relire un état à jour.
 """
 import sqlite3
 import json
 import os
 from datetime import datetime
 
+import persist
+
 _DB_PATH = os.path.join(os.path.dirname(__file__), "worlds.db")
 MAX_WORLDS = 4
 
@@ -33,6 +40,7 @@ def _connect():
 
 def init():
     """Crée les tables si elles n'existent pas encore."""
+    persist.flush()   # sauvegardes en attente d'abord
     with _connect() as conn:
         conn.execute("""
             CREATE TABLE IF NOT EXISTS worlds (
@@ -136,12 +144,10 @@ def save_block(world_id, col, row, tile):
     Enregistre un delta de bloc.
     tile = TILE_AIR signifie "miné".
     """
-    init()
-    with _connect() as conn:
-        conn.execute("""
-            INSERT OR REPLACE INTO blocks (world_id, col, row, tile)
-            VALUES (?, ?, ?, ?)
-        """, (world_id, col, row, tile))
+    persist.submit_db(_DB_PATH, lambda conn: conn.execute("""
+        INSERT OR REPLACE INTO blocks (world_id, col, row, tile)
+        VALUES (?, ?, ?, ?)
+    """, (world_id, col, row, tile)))
 
 
 def save_blocks_batch(world_id, changes):
@@ -151,12 +157,11 @@ def save_blocks_batch(world_id, changes):
     """
     if not changes:
         return
-    init()
-    with _connect() as conn:
-        conn.executemany("""
-            INSERT OR REPLACE INTO blocks (world_id, col, row, tile)
-            VALUES (?, ?, ?, ?)
-        """, [(world_id, c, r, t) for c, r, t in changes])
+    rows = [(world_id, c, r, t) for c, r, t in changes]
+    persist.submit_db(_DB_PATH, lambda conn: conn.executemany("""
+        INSERT OR REPLACE INTO blocks (world_id, col, row, tile)
+        VALUES (?, ?, ?, ?)
+    """, rows))
 
 
 # ── Persistance joueurs ───────────────────────────────────────────────────────
@@ -167,8 +172,9 @@ def save_player(world_id, player_idx, x, y, inventory, flag=None, familiar=None)
     inventory : instance de scenes.game.inventory.Inventory
     flag      : (flag_x, flag_y) en tuiles ou None
     familiar  : dict {type, hp, egg} ou None
+    Sérialisé tout de suite (l'inventaire continue de changer), écrit en
+    arrière-plan ; deux sauvegardes du même joueur en attente fusionnent.
     """
-    init()
     # Sérialisation JSON de l'inventaire
     resources_json = json.dumps(inventory.resources)
     # equip : clés converties en str pour JSON ({0: [...]} → {"0": [...]})
@@ -181,13 +187,13 @@ def save_player(world_id, player_idx, x, y, inventory, flag=None, familiar=None)
     equip_json = json.dumps(equip_raw)
     flag_x = flag[0] if flag else None
     flag_y = flag[1] if flag else None
-    with _connect() as conn:
-        conn.execute("""
-            INSERT OR REPLACE INTO players
-                (world_id, player_idx, x, y, tool, resources, equip, flag_x, flag_y)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (world_id, player_idx, x, y, inventory.tool,
-              resources_json, equip_json, flag_x, flag_y))
+    row = (world_id, player_idx, x, y, inventory.tool,
+           resources_json, equip_json, flag_x, flag_y)
+    persist.submit_db(_DB_PATH, lambda conn: conn.execute("""
+        INSERT OR REPLACE INTO players
+            (world_id, player_idx, x, y, tool, resources, equip, flag_x, flag_y)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, row), key=("player", world_id, player_idx))
 
 
 def load_players(world_id):
@@ -16,8 +16,12 @@ from config import (
 )
 
 import db as _db
+import lazy_import
 from scenes import select as scene_select
-from scenes.game import run as _game_run
+
+# Boucle de jeu (~120 ms d'import : mobs, caméra, craft…) chargée en fond
+# pendant l'écran de sélection, voir main()
+_game = lazy_import.module("scenes.game")
 
 # ── Palette Minecraft ─────────────────────────────────────────────────────────
 _MC_GREEN  = ( 90, 180,  30)   # herbe / logo vert
@@ -197,12 +201,13 @@ def main():
     screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
     pygame.display.set_caption("Minecraft 2D – 2 Joueurs")
 
+    lazy_import.prefetch("scenes.game")
     _db.init()
 
     result = scene_select.run(screen, joysticks)
     if result is not None:
         slot_id, seed = result
-        _game_run(screen, joysticks, slot_id, seed)
+        _game.run(screen, joysticks, slot_id, seed)
 
     pygame.quit()
 
@@ -6,6 +6,8 @@ import threading
 import queue as _queue
 import pygame
 
+import mem_budget
+
 from config import (
     SCREEN_WIDTH, SCREEN_HEIGHT, TILE_SIZE, ROWS,
     TILE_AIR, TILE_COLORS, TILE_CHEST, TILE_LAVA, TILE_WATER, TILE_TORCH,
@@ -682,6 +684,10 @@ class ChunkCache:
         self._ready_q = _queue.Queue() # worker → main : (cx, cy, tile_array)
         self._worker  = threading.Thread(target=self._worker_loop, daemon=True)
         self._worker.start()
+        mem_budget.register("minecraft2d.chunks", self._mem_stats, self._cache.clear)
+
+    def _mem_stats(self):
+        return len(self._cache), mem_budget.surfaces_bytes(self._cache)
 
     # ── Thread de calcul ──────────────────────────────────────────────────────
     # Seul endroit où le worker tourne : pas de pygame, uniquement world.get().
@@ -12,6 +12,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..',
 from config import *
 from world import generate
 from quit_combo import QuitCombo
+from frame_profiler import FrameProfiler
 import db as _db
 import sounds as _sounds
 import music_player as _music
@@ -35,6 +36,7 @@ def run(screen, joysticks, world_id, seed):
     """Lance la partie. Retourne True (retour menu) ou None (quitter)."""
     clock      = pygame.time.Clock()
     quit_combo = QuitCombo()
+    prof       = FrameProfiler()
     font_sm    = pygame.font.SysFont("Arial", 9)
     font_med   = pygame.font.SysFont("Arial", 11, bold=True)
 
@@ -392,6 +394,7 @@ def run(screen, joysticks, world_id, seed):
     # ─────────────────────────────────────────────────────────────────────────
     while True:
         dt = min(clock.tick(FPS) / 1000.0, 0.05)
+        prof.mark("wait")
         _day_time[0] = (_day_time[0] + dt / DAY_CYCLE_DURATION) % 1.0
         _sky_c = sky_color(_day_time[0]); _is_nite = is_night(_day_time[0])
         _last_flush[0] += dt
@@ -428,6 +431,8 @@ def run(screen, joysticks, world_id, seed):
                     mob_mgr._mobs.append(_gm)
                     loot_notifs.append(["[DEBUG] Gorgone spawned !", 2.5, (0, 240, 100)])
             quit_combo.handle_event(e)
+            prof.handle_event(e)
+        prof.mark("input")
 
         for i, player in enumerate(players):
             player.inventory.ensure_valid_tool()
@@ -630,6 +635,7 @@ def run(screen, joysticks, world_id, seed):
         # Vérifier si la Gorgone est morte
         _check_gorgon_dead()
 
+        prof.mark("players")
         _mob_cd[0] -= dt
         if _mob_cd[0] <= 0:
             mob_mgr.spawn_around(list({int(p.x) for p in players}), _is_nite); _mob_cd[0] = 6.0
@@ -655,6 +661,7 @@ def run(screen, joysticks, world_id, seed):
         proj_mgr.update(dt, world, mob_mgr, loot_notifs, players, chunks, _queue)
         fam_mgr.update(dt, players, world, mob_mgr, loot_notifs)
 
+        prof.mark("mobs")
         # ── Tick liquides (lave + eau) : itère seulement world.mods ──────
         _liquid_cd[0] -= dt
         if _liquid_cd[0] <= 0:
@@ -739,6 +746,7 @@ def run(screen, joysticks, world_id, seed):
             shared_cam.follow((players[0].px() + players[1].px()) // 2,
                               (players[0].py() + players[1].py()) // 2, dt)
 
+        prof.mark("world")
         screen.fill(_sky_c)
         chunks.flush_ready()   # intègre les chunks calculés par le worker thread
         if is_split:
@@ -791,5 +799,9 @@ def run(screen, joysticks, world_id, seed):
             _notif_bg_surf[0].fill((0, 0, 0, int(_na * 0.7)))
             _nx = SCREEN_WIDTH // 2 - _nbg_w // 2; _ny = SCREEN_HEIGHT // 3
             screen.blit(_notif_bg_surf[0], (_nx, _ny)); screen.blit(_lbl, (_nx + _p, _ny + _p))
+        prof.mark("render")
 
+        prof.draw(screen)
         pygame.display.flip()
+        prof.mark("flip")
+        prof.end_frame()
@@ -3,6 +3,10 @@ Génération du monde infini – accès procédural tile par tile.
 Seules les modifications joueurs (mine/pose) sont stockées dans un dict.
 """
 import random
+import sys
+
+import mem_budget
+
 from config import (
     ROWS,
     TILE_AIR, TILE_DIRT, TILE_STONE, TILE_GRASS, TILE_SAND, TILE_WOOD, TILE_COAL,
@@ -41,6 +45,18 @@ class World:
         self.seed = int(seed) & 0xFFFF_FFFF
         self.mods = {}    # {(col, row): tile}
         self._struct_cache = {}   # {col_anchor: {(col, row): tile}} – structures déjà calculées
+        mem_budget.register("minecraft2d.structures", self._struct_stats, self._struct_evict)
+
+    # ── Budget mémoire ────────────────────────────────────────────────────
+
+    def _struct_stats(self):
+        # Copie : le worker des chunks remplit le cache en parallèle
+        structs = list(self._struct_cache.values())
+        return len(structs), sys.getsizeof(self._struct_cache) + sum(map(sys.getsizeof, structs))
+
+    def _struct_evict(self):
+        # Structures déterministes (graine) : recalculées à la demande
+        self._struct_cache = {}
 
     # ── Biomes ────────────────────────────────────────────────────────────
 
@@ -60,8 +76,9 @@ class World:
 
     def _structure_at(self, anchor_col):
         """Retourne le dict {(col, row): tile} de la structure ancrée en anchor_col, ou {}."""
-        if anchor_col in self._struct_cache:
-            return self._struct_cache[anchor_col]
+        cached = self._struct_cache.get(anchor_col)   # get() : le cache peut être évincé entre-temps
+        if cached is not None:
+            return cached
 
         result = {}
         biome = self.biome_at(anchor_col)
@@ -94,8 +111,9 @@ class World:
     def _dungeon_at(self, anchor_col):
         """Retourne le dict {(col, row): tile} du donjon ancré en anchor_col, ou {}."""
         key = ("dng", anchor_col)
-        if key in self._struct_cache:
-            return self._struct_cache[key]
+        cached = self._struct_cache.get(key)
+        if cached is not None:
+            return cached
 
         result = {}
         tag_seed = 0xD0C
@@ -10,6 +10,7 @@ import pygame
 import config
 import scores as scores_io
 from quit_combo import QuitCombo
+from fixed_step import FixedStep
 
 # Import du logger pour debug Odroid
 try:
@@ -92,6 +93,7 @@ def _run_game(screen, level_id, scores_state):
         scene = GameScene(screen, level_id)
         clock = pygame.time.Clock()
         quit_combo = QuitCombo()
+        step = FixedStep(config.FPS)
         result = None
         while result is None:
             dt = clock.tick(config.FPS) / 1000.0
@@ -100,8 +102,12 @@ def _run_game(screen, level_id, scores_state):
                     return "quit"
                 quit_combo.handle_event(event)
                 scene.handle_event(event)
-            result = scene.update(dt)
-            scene.render()
+            # Physique à pas fixe, rendu interpolé
+            for _ in step.advance(dt):
+                result = scene.update(step.dt)
+                if result is not None:
+                    break
+            scene.render(step.alpha)
             if quit_combo.update_and_draw(screen):
                 return "menu"
             pygame.display.flip()
@@ -3,6 +3,9 @@ import random
 import pygame
 
 import config
+import font_cache
+import overlay_pool
+from fixed_step import lerp
 from bike import Bike
 from terrain import Terrain
 from hazards import HazardManager
@@ -89,6 +92,7 @@ class GameScene:
         self.cam_y = 0.0
         self.wheel_spin = 0.0  # angle radians, suit la distance parcourue
         self._last_bike_x = self.bike.x
+        self._prev_pose = self._pose()   # pose au pas précédent (interpolation)
         sw, sh = screen.get_size()
         self._sky = _build_sky(sw, sh, self.biome)
         self._clouds = _build_clouds(sw, sh, self.biome)
@@ -176,7 +180,11 @@ class GameScene:
                     self.input_throttle = False
                     self.input_brake = False
 
+    def _pose(self):
+        return self.bike.x, self.bike.y, self.bike.angle, self.cam_x, self.cam_y
+
     def update(self, dt):
+        self._prev_pose = self._pose()
         if self.want_quit:
             return {"quit": True}
 
@@ -196,6 +204,7 @@ class GameScene:
         if self.want_reset:
             self.want_reset = False
             self.bike.reset_to(self.last_checkpoint)
+            self._prev_pose = self._pose()   # téléportation : pas d'interpolation
 
         if self.finished:
             return None
@@ -204,6 +213,7 @@ class GameScene:
             self.crash_timer += dt
             if self.crash_timer >= 0.6:
                 self.bike.reset_to(self.last_checkpoint)
+                self._prev_pose = self._pose()
                 self.crash_timer = 0.0
         else:
             self.bike.set_inputs(self.input_throttle, self.input_brake, self.input_lean)
@@ -244,15 +254,20 @@ class GameScene:
 
         return None
 
-    def render(self):
+    def render(self, alpha=1.0):
+        """`alpha` : interpolation entre les deux derniers pas de simulation."""
         sw, sh = self.screen.get_size()
-        # Screen shake : offset caméra (ambiant biome + hazard transitoire).
-        # On swap cam_x/cam_y le temps du rendu pour que tous les renderers en bénéficient.
+        # Pose interpolée (moto + caméra) et screen shake : offset caméra
+        # (ambiant biome + hazard transitoire). On swap les valeurs le temps
+        # du rendu pour que tous les renderers en bénéficient.
+        real_pose = self._pose()
+        bx, by, ba, icx, icy = (lerp(p, c, alpha) for p, c in zip(self._prev_pose, real_pose))
+        self.bike.x, self.bike.y, self.bike.angle = bx, by, ba
+        self.cam_x, self.cam_y = icx, icy
         shake_amp = self.biome_fx["shake"] * 1.5 + self.hazards.shake_intensity * 4.0
-        real_cx, real_cy = self.cam_x, self.cam_y
         if shake_amp > 0.05:
-            self.cam_x = real_cx + math.sin(self._shake_phase * 47.0) * shake_amp
-            self.cam_y = real_cy + math.cos(self._shake_phase * 53.0) * shake_amp
+            self.cam_x = icx + math.sin(self._shake_phase * 47.0) * shake_amp
+            self.cam_y = icy + math.cos(self._shake_phase * 53.0) * shake_amp
 
         self._render_background()
         self.terrain.render(self.screen, self.cam_x, self.cam_y)
@@ -264,11 +279,9 @@ class GameScene:
         if self.biome_fx["sky_pulse"]:
             pulse = 0.5 + 0.5 * math.sin(self._shake_phase * 1.6)
             alpha = int(20 + 35 * pulse)
-            overlay = pygame.Surface((sw, sh), pygame.SRCALPHA)
-            overlay.fill((180, 40, 20, alpha))
-            self.screen.blit(overlay, (0, 0))
+            overlay_pool.fill(self.screen, (180, 40, 20, alpha))
 
-        self.cam_x, self.cam_y = real_cx, real_cy
+        self.bike.x, self.bike.y, self.bike.angle, self.cam_x, self.cam_y = real_pose
 
         self._render_hud()
         if self.countdown > 0 or self.go_hold < 0.5:
@@ -290,9 +303,10 @@ class GameScene:
         scale = 1.6 - frac * 0.6  # 1.6 → 1.0
         alpha = max(60, min(255, int(80 + 175 * frac)))
         size = max(8, int(base_size * scale))
-        font = pygame.font.SysFont("Arial", size, bold=True)
-        text = font.render(label, True, color)
-        shadow = font.render(label, True, (20, 20, 30))
+        # Une police par taille d'animation, créée une seule fois pour toute la session
+        font = font_cache.get_font("Arial", size, bold=True)
+        text = font_cache.render(font, label, color)
+        shadow = font_cache.render(font, label, (20, 20, 30))
         text.set_alpha(alpha)
         shadow.set_alpha(alpha)
         cx = (sw - text.get_width()) // 2
@@ -2,6 +2,7 @@ import json
 from pathlib import Path
 
 from logger import log
+import persist
 
 import config
 
@@ -29,10 +30,9 @@ def load():
 
 
 def save(state):
+    # Écriture atomique en arrière-plan : la frame ne bloque pas sur le disque
     try:
-        _SCORE_PATH.parent.mkdir(parents=True, exist_ok=True)
-        with _SCORE_PATH.open("w", encoding="utf-8") as f:
-            json.dump(state, f, indent=2)
+        persist.save_json(_SCORE_PATH, state)
     except Exception as e:
         log(f"[motodash] scores save failed: {e}", "error")
 
@@ -1,6 +1,13 @@
 import sqlite3
 from config import DB_PATH
 
+import persist
+
+# Les écritures de progression (vu / capturé / préférences) passent par
+# `persist` : exécutées en arrière-plan sur une connexion longue durée, un
+# commit par lot. Les lectures d'état modifiable commencent par
+# persist.flush() pour voir les écritures encore en attente.
+
 def get_connection():
     return sqlite3.connect(DB_PATH)
 
@@ -43,6 +50,7 @@ def add_caught_column():
         conn.close()
 
 def get_pokemon_list(conn, max_pokedex_id=None, include_mew=False):
+    persist.flush()
     cur = conn.cursor()
     query = "SELECT pokedex_id, name_fr, name_en, sprite_regular, sprite_shiny, caught, is_shiny, times_caught, seen FROM pokemon"
     conditions = []
@@ -72,37 +80,41 @@ def get_pokemon_data(conn, pokedex_id):
     return None
 
 def update_pokemon_seen_status(conn, pokedex_id):
-    cur = conn.cursor()
-    cur.execute("UPDATE pokemon SET seen = 1 WHERE pokedex_id = ?", (pokedex_id,))
-    conn.commit()
+    persist.submit_db(DB_PATH, lambda c: c.execute(
+        "UPDATE pokemon SET seen = 1 WHERE pokedex_id = ?", (pokedex_id,)))
 
 def update_pokemon_caught_status(conn, pokedex_id, caught, is_shiny=False):
-    cur = conn.cursor()
     # A caught pokemon is also a seen pokemon.
     if is_shiny:
-        cur.execute("UPDATE pokemon SET caught = ?, is_shiny = ?, times_caught = times_caught + 1, seen = 1 WHERE pokedex_id = ?", (caught, True, pokedex_id))
+        query = "UPDATE pokemon SET caught = ?, is_shiny = ?, times_caught = times_caught + 1, seen = 1 WHERE pokedex_id = ?"
+        params = (caught, True, pokedex_id)
     else:
         # If the capture is not shiny, we update 'caught' and increment the counter,
         # preserving the existing value of 'is_shiny'.
-        cur.execute("UPDATE pokemon SET caught = ?, times_caught = times_caught + 1, seen = 1 WHERE pokedex_id = ?", (caught, pokedex_id))
-    conn.commit()
+        query = "UPDATE pokemon SET caught = ?, times_caught = times_caught + 1, seen = 1 WHERE pokedex_id = ?"
+        params = (caught, pokedex_id)
+    persist.submit_db(DB_PATH, lambda c: c.execute(query, params))
 
 def get_caught_pokemon_count(conn):
+    persist.flush()
     cur = conn.cursor()
     cur.execute("SELECT COUNT(*) FROM pokemon WHERE caught = 1")
     return cur.fetchone()[0]
 
 def get_shiny_pokemon_count(conn):
+    persist.flush()
     cur = conn.cursor()
     cur.execute("SELECT COUNT(*) FROM pokemon WHERE is_shiny = 1")
     return cur.fetchone()[0]
 
 def get_seen_pokemon_count(conn):
+    persist.flush()
     cur = conn.cursor()
     cur.execute("SELECT COUNT(*) FROM pokemon WHERE seen = 1")
     return cur.fetchone()[0]
 
 def mew_is_unlocked(conn):
+    persist.flush()
     cur = conn.cursor()
     cur.execute("SELECT COUNT(*) FROM pokemon WHERE caught = 1 AND pokedex_id < 151")
     return cur.fetchone()[0] >= 150
@@ -120,12 +132,14 @@ def create_user_preferences_table():
     conn.close()
 
 def get_user_preference(conn, key):
+    persist.flush()
     cur = conn.cursor()
     cur.execute("SELECT value FROM user_preferences WHERE key=?", (key,))
     row = cur.fetchone()
     return row[0] if row else None
 
 def set_user_preference(conn, key, value):
-    cur = conn.cursor()
-    cur.execute("INSERT OR REPLACE INTO user_preferences (key, value) VALUES (?, ?)", (key, value))
-    conn.commit()
+    # Deux valeurs en attente pour la même clé : seule la dernière est écrite
+    persist.submit_db(DB_PATH, lambda c: c.execute(
+        "INSERT OR REPLACE INTO user_preferences (key, value) VALUES (?, ?)", (key, value)),
+        key=("pref", key))
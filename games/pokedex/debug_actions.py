@@ -6,6 +6,7 @@ import shutil
 import glob
 from pathlib import Path
 from datetime import datetime
+import persist
 from config import GENERATION_THRESHOLDS
 from db import get_caught_pokemon_count, get_seen_pokemon_count
 
@@ -33,6 +34,7 @@ def update_and_restart(game_state):
         print("--- Git pull successful ---")
         print(result.stdout)
         pygame.time.wait(1500)
+        persist.close()   # execv skips atexit: write pending saves first
         os.execv(sys.executable, ['python'] + sys.argv)
     except Exception as e:
         draw_message(f"Update failed: {e}", color=(255, 100, 100))
@@ -61,17 +63,20 @@ def reset_game_state(game_state):
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_filename = f"pokedex_{timestamp}.bk"
         backup_path = game_state.BASE_DIR / backup_filename
+        persist.flush()   # queued seen/caught/preference writes go into the backup
         shutil.copyfile(db_path, backup_path)
         draw_message(f"Backup created: {backup_filename}")
         pygame.time.wait(1000)
 
         # --- Reset Game State ---
         draw_message("Resetting game state...")
+        persist.flush()   # no queued write may land after the reset
         with game_state.conn:
             game_state.conn.execute("UPDATE pokemon SET caught=0, is_shiny=0, seen=0, times_caught=0")
             game_state.conn.execute("DELETE FROM user_preferences")
         draw_message("Reset complete. Restarting...")
         pygame.time.wait(2000)
+        persist.close()
         os.execv(sys.executable, ['python'] + sys.argv)
     except Exception as e:
         draw_message(f"Reset failed: {e}", color=(255, 100, 100))
@@ -90,6 +95,7 @@ def go_to_next_milestone(game_state):
         pygame.display.flip()
 
     try:
+        persist.flush()   # milestone queries and updates see every queued write
         caught_count = get_seen_pokemon_count(game_state.conn)
         next_threshold = -1
         current_gen = None
@@ -156,6 +162,7 @@ def go_to_next_milestone(game_state):
 
         draw_message(f"Done. Caught: {target_caught_count}. Restarting...")
         pygame.time.wait(2000)
+        persist.close()
         os.execv(sys.executable, ['python'] + sys.argv)
 
     except Exception as e:
@@ -1,5 +1,6 @@
 import pygame
 from pathlib import Path
+import font_cache
 from sprites import load_sprite, apply_shadow_effect
 from ui import draw_list_view, draw_detail_view, draw_general_stats
 from config import STATS_FONT_SIZE
@@ -71,7 +72,7 @@ def update_animations(game_state):
                         game_state.evolution_scroll_direction *= -1
 
 def render(game_state):
-    stats_font = pygame.font.SysFont("Arial", STATS_FONT_SIZE, bold=True) # Define stats_font here
+    stats_font = font_cache.get_font("Arial", STATS_FONT_SIZE, bold=True) # Police partagée, créée une fois
     if game_state.state == "list":
         draw_list_view(game_state.screen, game_state.pokemon_list, game_state.selected_index, game_state.scroll_offset, game_state.max_visible_items, game_state.current_sprite, game_state.font, game_state.list_view_background, game_state)
         draw_general_stats(game_state.screen, game_state, stats_font) # Call draw_general_stats
@@ -2,6 +2,7 @@ import pygame
 import random
 from pathlib import Path
 from config import SCREEN_WIDTH, SCREEN_HEIGHT
+import asset_pack
 from db import get_pokemon_data
 from sprites import load_sprite
 from transitions import play_spiral_cubes_transition
@@ -34,12 +35,11 @@ class EncounterHandler:
 
         stadium_path = self.game_state.BASE_DIR / "app/data/assets" / selected_region_name.lower() / "stadium"
         background_image_path = random.choice(list(stadium_path.glob('*.png'))) if stadium_path.is_dir() and any(stadium_path.glob('*.png')) else None
-        if background_image_path:
-            background_image = pygame.image.load(background_image_path).convert()
-        else:
-            fallback_path = self.game_state.BASE_DIR / "app/data/assets/out.png"
-            background_image = pygame.image.load(fallback_path).convert()
-        background_image = pygame.transform.scale(background_image, (SCREEN_WIDTH, SCREEN_HEIGHT))
+        if not background_image_path:
+            background_image_path = self.game_state.BASE_DIR / "app/data/assets/out.png"
+        # Fond pré-redimensionné à la taille écran dans l'archive d'assets
+        background_image = asset_pack.load(background_image_path, (SCREEN_WIDTH, SCREEN_HEIGHT),
+                                           alpha=False, smooth=False)
 
         # 2. Pre-render the initial combat scene
         combat_scene_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
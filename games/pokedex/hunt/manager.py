@@ -2,6 +2,7 @@ import pygame
 import random
 from pathlib import Path
 from config import SHINY_RATE, REGIONS, REGION_MUSIC
+import asset_pack
 from db import get_caught_pokemon_count, get_seen_pokemon_count, update_pokemon_seen_status
 from .region_selection import RegionSelectionHandler
 from .encounter import EncounterHandler
@@ -37,7 +38,7 @@ class HuntManager:
         if attack_sprites_path.is_dir():
             for sprite_file in attack_sprites_path.glob("*.png"):
                 try:
-                    self.game_state.attack_sprites[sprite_file.name] = pygame.image.load(sprite_file).convert_alpha()
+                    self.game_state.attack_sprites[sprite_file.name] = asset_pack.load(sprite_file)
                 except pygame.error as e:
                     print(f"Warning: Could not load attack sprite {sprite_file.name}: {e}")
 
@@ -9,7 +9,9 @@ import controls
 import catch_game
 import stabilize_game
 from sprites import load_sprite
-import hunt # Import the new hunt module
+import lazy_import
+# Hunt (combat, capture, rencontres) chargé en fond au démarrage, voir main.py
+hunt = lazy_import.module("hunt")
 
 # --- Debug combination state for keyboard ---
 _keyboard_debug_combo_start_time = {}
@@ -1,3 +1,5 @@
+import sys, os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 import pygame
 from state import GameState
 from game_logic import update_sprite, render, update_animations
@@ -7,17 +9,17 @@ import controls # Import the controls module
 from db import add_caught_column, create_user_preferences_table, get_user_preference
 from ui import create_list_view_background
 import dresseur_selection
-import sys, os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 from logger import log
 from quit_combo import QuitCombo
 import music_player
+import lazy_import
 
 def main():
     create_user_preferences_table()
     add_caught_column()
     log("[Pokemon] GameState init...")
     game_state = GameState()
+    lazy_import.prefetch("hunt")   # pendant l'affichage de la liste
     log(f"[Pokemon] Demarrage, state={game_state.state!r}, joysticks={len(game_state.joysticks)}")
     game_state.list_view_background = create_list_view_background()
     game_state.play_next_menu_song()  # Start music
@@ -1,15 +1,22 @@
 import pygame
 from pathlib import Path
 from config import TYPE_ICONS_DIR
+import asset_pack
+import mem_budget
 
 sprite_cache = {}
+type_icon_cache = {}  # (type, taille) -> Surface ; l'icône est redemandée à chaque frame
+
+mem_budget.register("pokedex.sprites",
+                    lambda: (len(sprite_cache), mem_budget.surfaces_bytes(sprite_cache)),
+                    sprite_cache.clear)
 
 def load_sprite(path):
     if not path or not Path(path).exists():
         return None
     if path not in sprite_cache:
         try:
-            img = pygame.image.load(str(path)).convert_alpha()
+            img = asset_pack.load(path)  # pixels pré-décodés si l'archive est à jour
             sprite_cache[path] = img
         except Exception as e:
             print(f"[ERREUR] Impossible de charger {path} : {e}")
@@ -20,8 +27,7 @@ def load_pokeball_sprites(size):
     BASE_DIR = Path.cwd()
     POKEBALL_PATH = BASE_DIR / "app" / "data" / "assets" / "pokeball.png"
     try:
-        pokeball_img = pygame.image.load(POKEBALL_PATH)
-        pokeball_img = pygame.transform.scale(pokeball_img, (size, size))
+        pokeball_img = asset_pack.load(POKEBALL_PATH, (size, size), smooth=False)
         pokeball_grayscale_img = pokeball_img.copy()
         # Convertir en niveaux de gris
         for x in range(pokeball_grayscale_img.get_width()):
@@ -37,18 +43,20 @@ def load_masterball_sprite(size):
     BASE_DIR = Path.cwd()
     MASTERBALL_PATH = BASE_DIR / "app" / "data" / "assets" / "masterball.png"
     try:
-        masterball_img = pygame.image.load(MASTERBALL_PATH)
-        masterball_img = pygame.transform.scale(masterball_img, (size, size))
+        masterball_img = asset_pack.load(MASTERBALL_PATH, (size, size), smooth=False)
         return masterball_img
     except pygame.error:
         return None
 
 def load_type_icon(type_name, size):
+    key = (type_name, size)
+    if key in type_icon_cache:
+        return type_icon_cache[key]
     BASE_DIR = Path.cwd()
     icon_path = BASE_DIR / TYPE_ICONS_DIR / f"{type_name.lower()}.png"
     try:
-        icon_img = pygame.image.load(icon_path)
-        icon_img = pygame.transform.scale(icon_img, (size, size))
+        icon_img = asset_pack.load(icon_path, (size, size), smooth=False)
+        type_icon_cache[key] = icon_img
         return icon_img
     except pygame.error:
         print(f"Warning: Could not load type icon for {type_name} at {icon_path}")
@@ -10,6 +10,7 @@ _root = _os.path.abspath(_os.path.join(_os.path.dirname(_os.path.abspath(__file_
 if _root not in sys.path:
     sys.path.insert(0, _root)
 import music_player
+import mem_budget
 
 class GameState:
     def __init__(self):
@@ -62,6 +63,9 @@ class GameState:
         self.scroll_accel_time = 2000
         self.last_scroll_time = 0
         self.sprite_cache = {}
+        mem_budget.register("pokedex.display_sprites",
+                            lambda: (len(self.sprite_cache), mem_budget.surfaces_bytes(self.sprite_cache)),
+                            self.sprite_cache.clear)
         self.list_view_background = None
         self.message = None
         self.message_timer = 0
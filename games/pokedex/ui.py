@@ -1,6 +1,7 @@
 import db
 import pygame
 import math
+import font_cache
 from config import SCREEN_WIDTH, SCREEN_HEIGHT, FONT_SIZE, LIST_VERTICAL_OFFSET, STATS_AREA_HEIGHT, REGIONS, STATS_FONT_SIZE
 from sprites import load_pokeball_sprites, load_masterball_sprite, load_type_icon
 
@@ -15,7 +16,7 @@ pokeball_img, pokeball_grayscale_img = load_pokeball_sprites(FONT_SIZE)
 masterball_img = load_masterball_sprite(FONT_SIZE)
 
 def draw_text(surface, text, x, y, font, color=(0,0,0)):
-    img = font.render(text, True, color)
+    img = font_cache.render(font, text, color)  # libellés rendus une seule fois
     surface.blit(img, (x, y))
 
 def draw_pokemon_style_text(surface, text, center_pos, font, text_color, outline_color, outline_width=2, with_frame=False):
@@ -185,8 +186,8 @@ def draw_list_view(screen, pokemon_list, selected_index, scroll_offset, max_visi
         if seen:
             region = get_region_from_id(pid)
             if region:
-                small_font = pygame.font.SysFont("Arial", 16, bold=True)
-                region_text_surface = small_font.render(region, True, (100, 100, 100))
+                small_font = font_cache.get_font("Arial", 16, bold=True)
+                region_text_surface = font_cache.render(small_font, region, (100, 100, 100))
 
                 # Calculate x position for right alignment
                 text_x = (210 + 250) - region_text_surface.get_width() - 10 # 10 pixels padding from the right edge
@@ -205,8 +206,8 @@ def draw_list_view(screen, pokemon_list, selected_index, scroll_offset, max_visi
             count_text = f"{display_count:02d}"
 
             # Crée une petite bulle pour le compteur
-            bubble_font = pygame.font.SysFont("Arial", 16, bold=True)
-            text_surface = bubble_font.render(count_text, True, (255, 255, 255))
+            bubble_font = font_cache.get_font("Arial", 16, bold=True)
+            text_surface = font_cache.render(bubble_font, count_text, (255, 255, 255))
 
             # Positionne la bulle en bas à droite du panneau de droite (210,5,250,250)
             # Le panneau de droite a une largeur de 250 et une hauteur de 250, et commence à x=210, y=5
@@ -243,7 +244,7 @@ def draw_general_stats(screen, game_state, stats_font):
 
     stats_font_size = 14
     try:
-        stats_font = pygame.font.SysFont("Arial", stats_font_size, bold=True)
+        stats_font = font_cache.get_font("Arial", stats_font_size, bold=True)
     except:
         pass # Use default font
 
@@ -281,7 +282,7 @@ def draw_detail_view(game_state):
     is_shiny = selected_pokemon[6]
     seen = selected_pokemon[8]
 
-    small_font = pygame.font.SysFont("Arial", FONT_SIZE - 2)
+    small_font = font_cache.get_font("Arial", FONT_SIZE - 2)
     # Fond dégradé vertical
     for y in range(SCREEN_HEIGHT):
         r = 200
@@ -390,7 +391,7 @@ def draw_detail_view(game_state):
     # Display game_state.message if active
     if game_state.message and pygame.time.get_ticks() < game_state.message_timer:
         try:
-            big_font = pygame.font.Font(None, 40)
+            big_font = font_cache.get_font(None, 40)
         except:
             big_font = font # Fallback
 
@@ -28,16 +28,16 @@ BALL_MAX_SPEED = 480  # plafond px/s
 WIN_SCORE     = 7
 
 # ── Contrôles ────────────────────────────────────────────────────────────────
-#   J1 : flèches haut/bas  (+ hat joystick / axe 1)
+#   J1 : flèches haut/bas  (+ hat / axe 1 de la manette 0 uniquement)
 #   J2 : touche N = descendre, touche M = monter  (identique à Shifter A/B)
 #        bouton 0 (A manette) = descendre, bouton 1 (B manette) = monter
 CTRL = {
-    'up_j1':   {'keys': [pygame.K_UP],   'hat': (0,  1), 'axis': (1, -1)},
-    'down_j1': {'keys': [pygame.K_DOWN], 'hat': (0, -1), 'axis': (1,  1)},
+    'up_j1':   {'keys': [pygame.K_UP],   'hat': (0,  1), 'axis': (1, -1), 'joy': 0},
+    'down_j1': {'keys': [pygame.K_DOWN], 'hat': (0, -1), 'axis': (1,  1), 'joy': 0},
     'up_j2':   {'keys': [pygame.K_m],    'btn': 1},   # B
     'down_j2': {'keys': [pygame.K_n],    'btn': 0},   # A
     'quit':    {'keys': [pygame.K_ESCAPE]},
-    'confirm': {'keys': [pygame.K_RETURN, pygame.K_SPACE], 'btn': 0},
+    'confirm': {'keys': [pygame.K_RETURN, pygame.K_SPACE, pygame.K_n], 'btn': [0, 1, 2, 3]},
 }
 
 AXIS_DEAD = 0.3
@@ -7,9 +7,9 @@ import pygame
 from config import (
     SCREEN_WIDTH, SCREEN_HEIGHT, FPS,
     BG_COLOR, PADDLE_J1, PADDLE_J2, TEXT_COLOR,
-    CTRL,
 )
 from quit_combo import QuitCombo
+from engine.input import controls
 
 
 def run(screen, winner: int, joysticks) -> bool:
@@ -18,9 +18,9 @@ def run(screen, winner: int, joysticks) -> bool:
     font_md = pygame.font.SysFont("Arial", 16, bold=True)
     font_sm = pygame.font.SysFont("Arial", 11)
 
-    joystick = joysticks[0] if joysticks else None
-    btn_held = set()
     quit     = QuitCombo()
+    inp      = controls()
+    inp.subscribe(quit.handle_event)
 
     col   = (PADDLE_J1, PADDLE_J2)[winner]
     name  = f"Joueur {winner + 1}"
@@ -29,22 +29,9 @@ def run(screen, winner: int, joysticks) -> bool:
     while True:
         dt     = clock.tick(FPS) / 1000.0
         anim  += dt
-        events = pygame.event.get()
-
-        for e in events:
-            quit.handle_event(e)
-            if e.type == pygame.JOYBUTTONDOWN:
-                btn_held.add(e.button)
-            if e.type == pygame.JOYBUTTONUP:
-                btn_held.discard(e.button)
-
-            if e.type == pygame.KEYDOWN:
-                if e.key in (pygame.K_RETURN, pygame.K_SPACE, pygame.K_n):
-                    return True
-
-            if e.type == pygame.JOYBUTTONDOWN:
-                if e.button in (0, 1, 2, 3):   # n'importe quel bouton → rejouer
-                    return True
+        inp.poll()
+        if inp.pressed('confirm'):   # A/B/X/Y ou Entrée → rejouer
+            return True
 
         import math
         screen.fill(BG_COLOR)
@@ -1,8 +1,9 @@
 """
 Synthèse procédurale de son moteur – Shifter
 =============================================
-Aucun fichier audio ni numpy requis.
-Compatible Python 3.8+ (Odroid Go Advance).
+Aucun fichier audio requis : les waveforms sont synthétisées avec le
+module partagé `synth` (NumPy) et relues depuis son cache PCM disque aux
+lancements suivants. Compatible Python 3.8+ (Odroid Go Advance).
 
 Principe
 --------
@@ -24,10 +25,12 @@ Types de moteur
 """
 from __future__ import annotations
 
-import math
-import array as _array
+import numpy as np
 import pygame
 
+import mem_budget
+import synth
+
 # ── Paramètres ────────────────────────────────────────────────────────────────
 # _RPM_STEP DOIT être un diviseur de 1000 pour que les clés du dict
 # soient alignées avec _nearest() (qui arrondit au multiple de _RPM_STEP).
@@ -56,46 +59,32 @@ def _fund_freq(rpm: float, etype: str) -> float:
     return rpm / 60.0 * 2.0        # 4-cyl   : 4 cyl → 2 allumages/tour
 
 
-def _make_sound(rpm: float, etype: str, sr: int, _vol_unused: float = 1.0) -> pygame.mixer.Sound:
-    """Génère un cycle complet (loop seamless) et retourne un Sound pygame.
+def _engine_cycle(sr: int, rpm: float, etype: str):
+    """Recette `synth` : un cycle complet de la waveform (loop seamless)."""
+    freq = _fund_freq(rpm, etype)
+    n    = max(16, int(sr / freq))
+    t    = synth.cycle(n)
+    if etype == 'v8':
+        return (0.45 * np.sin(t)
+                + 0.28 * np.sin(2.0 * t)
+                + 0.14 * np.sin(3.0 * t)
+                + 0.08 * np.sin(4.0 * t)
+                + 0.18 * np.sin(0.5 * t))   # sub-harmonique grondant
+    if etype == 'rotary':
+        return sum((0.55 / k) * np.sin(k * t + k * 0.3) for k in range(1, 7))
+    # 4-cyl : série de Fourier + micro-texture déterministe
+    v = sum((0.65 / k) * np.sin(k * t) for k in range(1, _NUM_HARM + 1))
+    return v + 0.02 * np.sin(t * 17.3)
 
-    Utilise uniquement math + array – aucune dépendance externe.
-    Buffer PCM : int16 signé, stéréo entrelacé (L R L R …).
-    """
-    freq  = _fund_freq(rpm, etype)
-    n     = max(16, int(sr / freq))
-    tau   = 2.0 * math.pi
-
-    # ── Génération des échantillons flottants ─────────────────────────────────
-    samples = []
-    for i in range(n):
-        t = tau * i / n
-        if etype == 'v8':
-            v = (0.45 * math.sin(t)
-                 + 0.28 * math.sin(2.0 * t)
-                 + 0.14 * math.sin(3.0 * t)
-                 + 0.08 * math.sin(4.0 * t)
-                 + 0.18 * math.sin(0.5 * t))   # sub-harmonique grondant
-        elif etype == 'rotary':
-            v = sum((0.55 / k) * math.sin(k * t + k * 0.3) for k in range(1, 7))
-        else:
-            # 4-cyl : série de Fourier + micro-texture déterministe
-            v = sum((0.65 / k) * math.sin(k * t) for k in range(1, _NUM_HARM + 1))
-            v += 0.02 * math.sin(t * 17.3)
-        samples.append(v)
 
-    # ── Normalisation + conversion int16 stéréo ───────────────────────────────
-    peak  = max(abs(s) for s in samples) or 1.0
-    # vol ignoré ici : le buffer est généré à pleine amplitude (32767).
-    # Le volume est contrôlé au niveau du canal pygame (Channel.set_volume).
-    scale = 32767.0 / peak
-    buf   = _array.array('h')          # signed short = int16
-    for s in samples:
-        val = int(max(-32768.0, min(32767.0, s * scale)))
-        buf.append(val)   # canal L
-        buf.append(val)   # canal R
+def _make_sound(rpm: float, etype: str, sr: int, _vol_unused: float = 1.0) -> pygame.mixer.Sound:
+    """Sound pygame d'un cycle moteur, synthétisé ou relu depuis le cache PCM.
 
-    return pygame.mixer.Sound(buffer=buf)
+    `sr` est ignoré : `synth` utilise la fréquence réelle du mixer.
+    Le buffer est généré à pleine amplitude (32767) ; le volume est contrôlé
+    au niveau du canal pygame (Channel.set_volume).
+    """
+    return synth.sound(_engine_cycle, float(rpm), etype)
 
 
 # ── Classe principale ─────────────────────────────────────────────────────────
@@ -145,6 +134,8 @@ class EngineSound:
 
             self._bake(max_rpm)
             self._ok = True
+            # Sons indispensables pendant la course : comptés, jamais évincés
+            mem_budget.register(f"shifter.engine_sound.{channels[0]}", self._mem_stats)
         except Exception as exc:
             print(f"[EngineSound] init failed: {exc}")
 
@@ -157,6 +148,9 @@ class EngineSound:
             rpm += _RPM_STEP
         self._max = rpm - _RPM_STEP
 
+    def _mem_stats(self) -> tuple:
+        return len(self._sounds), sum(map(mem_budget.sound_bytes, self._sounds.values()))
+
     def _nearest(self, rpm: float) -> int:
         """Arrondit un RPM au palier le plus proche de la bibliothèque."""
         target = max(1000.0, min(float(self._max), rpm))
@@ -13,9 +13,12 @@ import pygame
 from config import SCREEN_WIDTH, SCREEN_HEIGHT, FPS
 
 import scene_select
-import scene_race
-import scene_result
 import music_player
+import lazy_import
+
+# Course et résultats chargés en fond pendant le splash (voir main())
+scene_race   = lazy_import.module("scene_race")
+scene_result = lazy_import.module("scene_result")
 
 _AUDIO_DIR = os.path.join(os.path.dirname(__file__), 'asset', 'audio')
 _MENU_DIR  = os.path.join(_AUDIO_DIR, 'menu')
@@ -44,6 +47,7 @@ def main():
         screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("Shifter – Drag Race 2J")
         log("[Shifter] fenêtre créée")
+        lazy_import.prefetch("scene_race", "scene_result")
 
         # ── Écran d'accueil ───────────────────────────────────────────────────
         music_player.load_folder(_MENU_DIR)
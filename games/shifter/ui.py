@@ -5,6 +5,11 @@ import pygame
 import math
 from pathlib import Path
 
+import asset_pack
+import font_cache
+import mem_budget
+import overlay_pool
+
 # ── Sprites véhicules ─────────────────────────────────────────────────────────
 
 _SPRITE_CACHE: dict = {}
@@ -28,7 +33,7 @@ def load_car_sprite(sprite_cfg: dict, target_w: int = 160) -> "pygame.Surface":
         return _SPRITE_CACHE[key]
 
     path = Path("asset/sprite") / sprite_cfg["sheet"]
-    sheet = pygame.image.load(str(path)).convert_alpha()
+    sheet = asset_pack.load(path)
 
     corner = sheet.get_at((0, 0))
     if corner.a == 255 and corner.r > 240 and corner.g > 240 and corner.b > 240:
@@ -108,6 +113,9 @@ def draw_car(surf: pygame.Surface, cx: int, cy: int, body_color, scale: float =
 # ── Décor / route scrollante ──────────────────────────────────────────────────
 
 _BG_CACHE: dict = {}
+mem_budget.register("shifter.backgrounds",
+                    lambda: (len(_BG_CACHE), mem_budget.surfaces_bytes(_BG_CACHE)),
+                    _BG_CACHE.clear)
 
 
 def _load_bg_strip(panel_w: int, panel_h: int, environment: str = "tokio1") -> list:
@@ -125,10 +133,10 @@ def _load_bg_strip(panel_w: int, panel_h: int, environment: str = "tokio1") -> l
     names = ["start-back.jpg", "mid-back.jpg", "end-back.jpg"]
     surfs = []
     for name in names:
-        img = pygame.image.load(str(base / name)).convert()
-        iw, ih = img.get_size()
+        # Taille lue dans l'index : la variante redimensionnée vient directement de l'archive
+        iw, ih = asset_pack.native_size(base / name)
         scaled_w = max(panel_w, int(iw * panel_h / ih))
-        surfs.append(pygame.transform.smoothscale(img, (scaled_w, panel_h)))
+        surfs.append(asset_pack.load(base / name, (scaled_w, panel_h), alpha=False))
 
     _BG_CACHE[key] = surfs
     return surfs
@@ -300,9 +308,7 @@ _SG  = 500   # SHIFT_GOOD RPM
 
 def _hud_bg(surf: pygame.Surface, ox: int, tint=(0, 0, 0, 195)):
     """Fond semi-transparent de la bande HUD."""
-    bg = pygame.Surface((_H_W, _H_H), pygame.SRCALPHA)
-    bg.fill(tint)
-    surf.blit(bg, (ox, 0))
+    overlay_pool.fill(surf, tint, (ox, 0, _H_W, _H_H))
 
 
 def _arc_gauge(surf, cx, cy, r, rpm, max_rpm, opt_rpm, accent_col,
@@ -750,8 +756,8 @@ class StartLights:
 
         if self.phase == 'green' and self._go_flash > 0:
             self._go_flash -= 0.02
-            go_font = pygame.font.SysFont("Arial", 28, bold=True)
-            t = go_font.render("GO!", True, (80, 255, 80))
+            go_font = font_cache.get_font("Arial", 28, bold=True)
+            t = font_cache.render(go_font, "GO!", (80, 255, 80))
             surf.blit(t, (lx - t.get_width() // 2, ly + r + 6))
 
     @property
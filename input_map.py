@@ -0,0 +1,168 @@
+"""Module partagé – couche d'entrées : un seul relevé par frame, masque d'actions.
+
+Les boucles de jeu parcouraient la liste d'événements plusieurs fois par
+frame (QuitCombo, profiler, jeu) et interrogeaient la manette action par
+action (`get_axis` / `get_hat` dans de longues suites de `if`). Ici, une
+table de correspondance (action -> sources) est compilée une fois ; chaque
+frame, `poll()` :
+
+- lit les événements une seule fois et les passe aux abonnés
+  (`subscribe(quit_combo.handle_event)`…) ;
+- tient à jour boutons, axes et chapeaux à partir des événements JOY* ;
+- lit le clavier une fois (`key.get_pressed()`) ;
+- calcule les masques `held` (maintenu), `pressed` (front montant) et
+  `released` (front descendant) : un bit par action.
+
+Un appui + relâchement entre deux frames compte quand même dans `pressed`.
+Une touche déjà maintenue au premier `poll()` (venue de la scène précédente)
+n'est pas un appui.
+
+Table (même forme que CTRL de Pong) :
+
+    BINDINGS = {
+        'up':   {'keys': [pygame.K_UP], 'hat': (0, 1), 'axis': (1, -1)},
+        'bomb': {'keys': [pygame.K_e],  'btn': 4, 'joy': 0},
+    }
+
+- 'keys' : touches clavier ;
+- 'btn'  : bouton (ou liste de boutons) ;
+- 'hat'  : direction du chapeau 0, (x, y) comparé composante par composante
+  (les diagonales comptent pour les deux directions) ;
+- 'axis' : (axe, -1 | 1), actif au-delà de la zone morte ;
+- 'joy'  : limite boutons / chapeau / axes à cette manette (défaut : toutes).
+
+Usage :
+
+    inp = InputMap(BINDINGS, axis_dead=0.3)
+    inp.subscribe(quit_combo.handle_event)
+    while True:
+        events = inp.poll()          # à la place de pygame.event.get()
+        if inp.held('up'): ...
+        if inp.pressed('bomb'): ...
+"""
+
+import pygame
+
+_SOURCES = ("keys", "btn", "hat", "axis")
+
+
+class InputMap:
+    """Masque d'actions par frame, construit à partir d'une table."""
+
+    def __init__(self, bindings: dict, axis_dead: float = 0.5):
+        self.actions   = tuple(bindings)
+        self.bits      = {name: 1 << i for i, name in enumerate(self.actions)}
+        self.axis_dead = axis_dead
+        self.held_mask     = 0
+        self.pressed_mask  = 0
+        self.released_mask = 0
+
+        self._subs     = []
+        self._keys     = []   # (touche, bit)
+        self._key_bits = {}   # touche -> bits (événements KEYDOWN)
+        self._btn_bits = {}   # (manette | None, bouton) -> bits
+        self._hat_bits = []   # (manette | None, (x, y), bit)
+        self._axis_bits = []  # (manette | None, axe, sens, bit)
+        self._buttons  = set()   # (manette, bouton) maintenus
+        self._hats     = {}      # manette -> (x, y) du chapeau 0
+        self._axes     = {}      # (manette, axe) -> valeur
+        self._polled   = False   # 1er relevé : ce qui est déjà maintenu n'est pas un appui
+        self._compile(bindings)
+
+    def _compile(self, bindings: dict) -> None:
+        for name, spec in bindings.items():
+            unknown = set(spec) - set(_SOURCES) - {"joy"}
+            if unknown:
+                raise ValueError(f"action '{name}' : sources inconnues {sorted(unknown)}")
+            bit = self.bits[name]
+            joy = spec.get("joy")
+            for k in spec.get("keys", ()):
+                self._keys.append((k, bit))
+                self._key_bits[k] = self._key_bits.get(k, 0) | bit
+            btns = spec.get("btn", ())
+            for b in (btns,) if isinstance(btns, int) else btns:
+                self._btn_bits[(joy, b)] = self._btn_bits.get((joy, b), 0) | bit
+            if "hat" in spec:
+                self._hat_bits.append((joy, spec["hat"], bit))
+            if "axis" in spec:
+                axis, sign = spec["axis"]
+                self._axis_bits.append((joy, axis, sign, bit))
+
+    # ── Abonnés ───────────────────────────────────────────────────────────────
+
+    def subscribe(self, handler) -> None:
+        """`handler(event)` sera appelé pour chaque événement relevé."""
+        self._subs.append(handler)
+
+    # ── Relevé de la frame ────────────────────────────────────────────────────
+
+    def poll(self) -> list:
+        """Relève les événements de la frame, met à jour les masques, les retourne."""
+        events  = pygame.event.get()
+        latched = 0
+        for e in events:
+            t = e.type
+            if t == pygame.JOYBUTTONDOWN:
+                joy = getattr(e, "joy", 0)
+                self._buttons.add((joy, e.button))
+                latched |= self._button_mask(joy, e.button)
+            elif t == pygame.JOYBUTTONUP:
+                self._buttons.discard((getattr(e, "joy", 0), e.button))
+            elif t == pygame.JOYAXISMOTION:
+                self._axes[(getattr(e, "joy", 0), e.axis)] = e.value
+            elif t == pygame.JOYHATMOTION and e.hat == 0:
+                self._hats[getattr(e, "joy", 0)] = e.value
+            elif t == pygame.KEYDOWN:
+                latched |= self._key_bits.get(e.key, 0)
+            for handler in self._subs:
+                handler(e)
+
+        held = 0
+        keys = pygame.key.get_pressed()
+        for k, bit in self._keys:
+            if keys[k]:
+                held |= bit
+        for joy, b in self._buttons:
+            held |= self._button_mask(joy, b)
+        for joy, want, bit in self._hat_bits:
+            if any(_hat_match(v, want) for j, v in self._hats.items() if joy in (None, j)):
+                held |= bit
+        dead = self.axis_dead
+        for joy, axis, sign, bit in self._axis_bits:
+            for (j, a), v in self._axes.items():
+                if a == axis and joy in (None, j) and v * sign > dead:
+                    held |= bit
+                    break
+
+        prev = self.held_mask if self._polled else held
+        self._polled = True
+        self.held_mask     = held
+        self.pressed_mask  = (held & ~prev) | latched
+        self.released_mask = prev & ~held
+        return events
+
+    def _button_mask(self, joy, button) -> int:
+        return self._btn_bits.get((None, button), 0) | self._btn_bits.get((joy, button), 0)
+
+    # ── Lecture ───────────────────────────────────────────────────────────────
+
+    def held(self, action: str) -> bool:
+        return bool(self.held_mask & self.bits[action])
+
+    def pressed(self, action: str) -> bool:
+        return bool(self.pressed_mask & self.bits[action])
+
+    def released(self, action: str) -> bool:
+        return bool(self.released_mask & self.bits[action])
+
+    def first_held(self, actions):
+        """Première action maintenue de `actions` (ordre de priorité), ou None."""
+        for name in actions:
+            if self.held_mask & self.bits[name]:
+                return name
+        return None
+
+
+def _hat_match(value, want) -> bool:
+    """Chaque composante non nulle de `want` doit être celle du chapeau."""
+    return all(w == 0 or v == w for v, w in zip(value, want)) and any(want)
@@ -0,0 +1,396 @@
+"""
+Enregistrement / rejeu des entrées d'une session de jeu.
+========================================================
+Un ralentissement vu sur l'Odroid est difficile à reproduire sur un PC :
+les entrées, le temps et les tirages aléatoires diffèrent. Ce module
+enregistre tout ce qui rend une partie non déterministe, puis le rejoue
+à l'identique sous le driver vidéo `dummy` pour profiler sur desktop.
+
+Enregistré, dans l'ordre exact des appels du thread principal :
+
+- `pygame.event.get()`            (type + attributs de chaque événement)
+- `pygame.key.get_pressed()`      (scancodes enfoncés)
+- `pygame.joystick.get_count()`, `Joystick(i)` et ses `get_axis/button/hat`
+- `Clock.tick()` et `pygame.time.get_ticks()`
+- une graine unique passée à `random.seed()` (et numpy) avant l'import du
+  jeu : `World(seed)` de Minecraft2D, le `random` de Bomberman et le
+  `World.rng` de Jungle Run en dérivent tous.
+
+Les appels sont regroupés par frame (délimitée par `display.flip/update`,
+avec la durée réelle de la frame), sérialisés avec `marshal` et compressés
+en gzip : quelques Ko par minute de jeu.
+
+Enregistrer : `python main.py --record` → un fichier par jeu lancé dans
+`recordings/` (à côté de debug.log).
+
+Rejouer :
+    python input_recorder.py recordings/doom-20250101-120000.pgir
+
+Le rejeu tourne sans attente (les `tick()` renvoient les dt enregistrés) et
+affiche les temps de frame enregistrés vs rejoués. Si le jeu diverge (appel
+inattendu), `ReplayDesync` indique la frame fautive. Les sauvegardes
+(minecraft.db, scores…) ne sont pas dans le fichier : copier celles de la
+console pour rejouer une partie chargée depuis un slot.
+"""
+import gzip
+import marshal
+import os
+import random
+import sys
+import threading
+import time
+from pathlib import Path
+
+from logger import LOG_PATH, log
+
+MAGIC          = b"PGIR1\n"
+RECORDINGS_DIR = LOG_PATH.parent / "recordings"
+
+# Types d'attributs d'événement sérialisables (les autres sont ignorés)
+_PLAIN = (int, float, str, bool, type(None))
+
+
+class ReplayEnd(Exception):
+    """Fin du fichier atteinte : le rejeu est terminé."""
+
+
+class ReplayDesync(Exception):
+    """Le jeu rejoué ne fait plus les mêmes appels que pendant l'enregistrement."""
+
+
+def recording_path(game: dict) -> Path:
+    """Chemin du prochain enregistrement pour `game`."""
+    name = Path(game["path"]).name
+    return RECORDINGS_DIR / f"{name}-{time.strftime('%Y%m%d-%H%M%S')}.pgir"
+
+
+# ── Base commune ──────────────────────────────────────────────────────────────
+
+class _Session:
+    """Remplace les fonctions pygame concernées ; `uninstall()` les restaure."""
+
+    def __init__(self):
+        self._saved = []
+        self._owner = None   # seul le thread principal du jeu est enregistré
+
+    def _patch(self, module, name, value) -> None:
+        self._saved.append((module, name, getattr(module, name)))
+        setattr(module, name, value)
+
+    def _mine(self) -> bool:
+        return threading.get_ident() == self._owner
+
+    def install(self) -> None:
+        import pygame
+        self._owner = threading.get_ident()
+        self._seed_rngs()
+        self._install(pygame)
+
+    def uninstall(self) -> None:
+        for module, name, value in reversed(self._saved):
+            setattr(module, name, value)
+        self._saved.clear()
+        self._close()
+
+    def _seed_rngs(self) -> None:
+        random.seed(self.seed)
+        if "numpy" in sys.modules:
+            sys.modules["numpy"].random.seed(self.seed)
+
+
+def _encode_event(e) -> tuple:
+    attrs = {k: v for k, v in e.dict.items()
+             if isinstance(v, _PLAIN) or (isinstance(v, tuple) and all(isinstance(x, _PLAIN) for x in v))}
+    return (e.type, attrs)
+
+
+# ── Enregistrement ────────────────────────────────────────────────────────────
+
+class Recorder(_Session):
+    """Enregistre les entrées d'un jeu dans `path` (gzip + marshal)."""
+
+    def __init__(self, path, game: dict):
+        super().__init__()
+        self.path   = Path(path)
+        self.seed   = random.SystemRandom().randrange(1 << 32)
+        self.frames = 0
+        self._calls = []                 # appels de la frame en cours
+        self._last  = time.perf_counter()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file  = gzip.open(self.path, "wb", compresslevel=6)
+        self._file.write(MAGIC)
+        marshal.dump({
+            "title":   game.get("title"),
+            "game":    Path(game["path"]).name,
+            "seed":    self.seed,
+            "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+        }, self._file)
+
+    def _install(self, pygame) -> None:
+        calls = self._calls
+        rec   = self
+
+        def wrap(fn, code, encode=lambda v: v):
+            def recorded(*args, **kwargs):
+                value = fn(*args, **kwargs)
+                if rec._mine():
+                    calls.append((code, encode(value)))
+                return value
+            return recorded
+
+        ev, key, tm, joy, disp = pygame.event, pygame.key, pygame.time, pygame.joystick, pygame.display
+        self._patch(ev, "get", wrap(ev.get, "e", lambda evs: [_encode_event(e) for e in evs]))
+        self._patch(key, "get_pressed", wrap(
+            key.get_pressed, "k", lambda keys: tuple(i for i, down in enumerate(keys) if down)))
+        self._patch(tm, "get_ticks", wrap(tm.get_ticks, "g"))
+        self._patch(joy, "get_count", wrap(joy.get_count, "n"))
+
+        real_clock = tm.Clock
+
+        class _RecClock:
+            def __init__(self):
+                self._clock = real_clock()
+                self.tick   = wrap(self._clock.tick, "t")
+                self.tick_busy_loop = wrap(self._clock.tick_busy_loop, "t")
+
+            def __getattr__(self, name):
+                return getattr(self._clock, name)
+
+        real_joystick = joy.Joystick
+
+        class _RecJoystick:
+            def __init__(self, index):
+                self._joy = real_joystick(index)
+                self.get_axis   = wrap(self._joy.get_axis, "a", lambda v: round(v, 4))
+                self.get_button = wrap(self._joy.get_button, "b")
+                self.get_hat    = wrap(self._joy.get_hat, "h")
+                if rec._mine():
+                    j = self._joy
+                    calls.append(("j", (index, j.get_name(), j.get_numaxes(),
+                                        j.get_numbuttons(), j.get_numhats(), j.get_instance_id())))
+
+            def __getattr__(self, name):
+                return getattr(self._joy, name)
+
+        self._patch(tm, "Clock", _RecClock)
+        self._patch(joy, "Joystick", _RecJoystick)
+        self._patch(disp, "flip", self._frame_hook(disp.flip))
+        self._patch(disp, "update", self._frame_hook(disp.update))
+
+    def _frame_hook(self, fn):
+        def hooked(*args, **kwargs):
+            value = fn(*args, **kwargs)
+            if self._mine():
+                now = time.perf_counter()
+                self._calls.append(("f", round((now - self._last) * 1000.0, 2)))
+                self._last = now
+                marshal.dump(self._calls, self._file)
+                self._calls.clear()
+                self.frames += 1
+            return value
+        return hooked
+
+    def _close(self) -> None:
+        if self._calls:
+            marshal.dump(self._calls, self._file)
+            self._calls.clear()
+        self._file.close()
+        size = self.path.stat().st_size / 1024
+        log(f"[Record] {self.frames} frames → {self.path.name} ({size:.0f} Ko)")
+
+
+# ── Rejeu ─────────────────────────────────────────────────────────────────────
+
+class Replayer(_Session):
+    """Rejoue un fichier `.pgir` à la place des vraies entrées."""
+
+    def __init__(self, path):
+        super().__init__()
+        self.path      = Path(path)
+        self._file     = gzip.open(self.path, "rb")
+        if self._file.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{self.path} n'est pas un enregistrement d'entrées")
+        self.meta      = marshal.load(self._file)
+        self.seed      = self.meta["seed"]
+        self.frames    = 0
+        self.recorded  = []              # ms par frame sur la console
+        self.replayed  = []              # ms par frame pendant le rejeu
+        self._calls    = []
+        self._pos      = 0
+        self._last     = None
+
+    def _next(self, code):
+        if self._pos >= len(self._calls):
+            try:
+                self._calls = marshal.load(self._file)
+            except EOFError:
+                raise ReplayEnd from None
+            self._pos = 0
+        got, value = self._calls[self._pos]
+        if got != code:
+            raise ReplayDesync(f"frame {self.frames} : appel '{code}' attendu, '{got}' enregistré")
+        self._pos += 1
+        return value
+
+    def _install(self, pygame) -> None:
+        rep = self
+
+        def replay(fn, code, decode=lambda v: v):
+            def replayed(*args, **kwargs):
+                if not rep._mine():
+                    return fn(*args, **kwargs)
+                return decode(rep._next(code))
+            return replayed
+
+        def events(evs):
+            return [pygame.event.Event(t, attrs) for t, attrs in evs]
+
+        def keys(pressed):
+            state = [False] * 512
+            for i in pressed:
+                state[i] = True
+            return pygame.key.ScancodeWrapper(state)
+
+        ev, key, tm, joy, disp = pygame.event, pygame.key, pygame.time, pygame.joystick, pygame.display
+        self._patch(ev, "get", replay(ev.get, "e", events))
+        self._patch(ev, "pump", lambda: None)
+        self._patch(ev, "clear", lambda *a, **k: None)
+        self._patch(key, "get_pressed", replay(key.get_pressed, "k", keys))
+        self._patch(tm, "get_ticks", replay(tm.get_ticks, "g"))
+        self._patch(tm, "wait", lambda ms: 0)
+        self._patch(tm, "delay", lambda ms: 0)
+        self._patch(joy, "get_count", replay(joy.get_count, "n"))
+
+        class _ReplayClock:
+            def __init__(self):
+                self._dt = 0
+
+            def tick(self, framerate=0):
+                self._dt = rep._next("t")
+                return self._dt
+
+            tick_busy_loop = tick
+
+            def get_time(self):
+                return self._dt
+
+            get_rawtime = get_time
+
+            def get_fps(self):
+                return 1000.0 / self._dt if self._dt else 0.0
+
+        class _ReplayJoystick:
+            def __init__(self, index):
+                (_, self._name, self._axes, self._buttons,
+                 self._hats, self._instance) = rep._next("j")
+
+            def init(self):
+                pass
+
+            def quit(self):
+                pass
+
+            def get_init(self):
+                return True
+
+            def get_id(self):
+                return self._instance
+
+            def get_instance_id(self):
+                return self._instance
+
+            def get_name(self):
+                return self._name
+
+            def get_numaxes(self):
+                return self._axes
+
+            def get_numbuttons(self):
+                return self._buttons
+
+            def get_numhats(self):
+                return self._hats
+
+            def get_axis(self, i):
+                return rep._next("a")
+
+            def get_button(self, i):
+                return rep._next("b")
+
+            def get_hat(self, i):
+                return tuple(rep._next("h"))
+
+            def rumble(self, *args):
+                return False
+
+            def stop_rumble(self):
+                pass
+
+        self._patch(tm, "Clock", _ReplayClock)
+        self._patch(joy, "Joystick", _ReplayJoystick)
+        self._patch(disp, "flip", self._frame_hook(disp.flip))
+        self._patch(disp, "update", self._frame_hook(disp.update))
+
+    def _frame_hook(self, fn):
+        def hooked(*args, **kwargs):
+            value = fn(*args, **kwargs)
+            if self._mine():
+                now = time.perf_counter()
+                self.recorded.append(self._next("f"))
+                if self._last is not None:
+                    self.replayed.append((now - self._last) * 1000.0)
+                self._last = now
+                self.frames += 1
+            return value
+        return hooked
+
+    def _close(self) -> None:
+        self._file.close()
+
+    def report(self) -> str:
+        """Temps de frame console vs rejeu (moyenne, p95, max)."""
+        def stats(values):
+            if not values:
+                return "—"
+            s = sorted(values)
+            p95 = s[min(len(s) - 1, int(len(s) * 0.95))]
+            return f"moy {sum(s) / len(s):6.2f}  p95 {p95:6.2f}  max {s[-1]:6.2f} ms"
+        return (f"{self.meta['title']} : {self.frames} frames rejouées\n"
+                f"  console : {stats(self.recorded)}\n"
+                f"  rejeu   : {stats(self.replayed)}")
+
+
+# ── Ligne de commande ─────────────────────────────────────────────────────────
+
+def main(argv=None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Rejoue un enregistrement d'entrées (.pgir).")
+    parser.add_argument("recording", help="fichier .pgir produit par main.py --record")
+    parser.add_argument("--window", action="store_true",
+                        help="afficher la fenêtre au lieu du driver vidéo dummy")
+    args = parser.parse_args(argv)
+
+    if not args.window:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+    import pygame
+    import main as launcher_main
+
+    replayer = Replayer(Path(args.recording).resolve())
+    name = replayer.meta["game"]
+    game = next((g for g in launcher_main.GAMES if Path(g["path"]).name == name), None)
+    if game is None:
+        print(f"Jeu '{name}' introuvable dans main.GAMES", file=sys.stderr)
+        return 1
+
+    print(f"Rejeu de {args.recording} (graine {replayer.seed}, enregistré le {replayer.meta['created']})")
+    pygame.init()   # launch_game part d'un pygame actif (celui du launcher)
+    launcher_main.launch_game(game, session=replayer)
+    print(replayer.report())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
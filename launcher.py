@@ -1,8 +1,17 @@
 import pygame
 import os
+import queue
 import socket
+import threading
+from collections import OrderedDict
 from pathlib import Path
 
+import asset_pack
+import cover_cache
+import font_cache
+import mem_budget
+import overlay_pool
+
 
 # Couleurs
 BG_COLOR = (18, 18, 18)
@@ -24,6 +33,12 @@ IMG_W = 135
 IMG_H = 148
 HEADER_H = 36
 
+# Fonds plein écran : sélection + 2 voisins, chargés à la demande
+BG_NEIGHBOURS = 1                       # voisins de chaque côté
+BG_CACHE_BYTES = 4 * 480 * 320 * 4      # plafond mémoire du LRU (~2,4 Mo)
+# Posté par le thread de chargement : réveille la boucle si elle est en veille
+BG_READY_EVENT = pygame.USEREVENT + 11
+
 
 class Launcher:
     def __init__(self, screen, games, base_dir):
@@ -37,12 +52,16 @@ class Launcher:
         self.font_placeholder = pygame.font.SysFont("Arial", 36, bold=True)
         self.font_badge = pygame.font.SysFont("Arial", 10, bold=True)
         self.images = self._load_images()
-        self.bg_images = self._load_bg_images()
         self.visible_games = self._compute_visible()
+        self.bg_images = _BackgroundLoader(self._load_bg, BG_CACHE_BYTES)
+        self._prefetch_bgs()
         self._axis_moved = False
         # Carousel : position actuelle du scroll (pixels), interpolée vers la cible
         self._scroll_x = 0.0  # démarre centré sur le 1er jeu
         self._ip = self._get_ip()
+        # Rendu incrémental : zones à redessiner + état affiché au dernier rendu
+        self._dirty = [self.screen.get_rect()]
+        self._drawn_state = None
 
     def _compute_visible(self):
         if self.show_beta:
@@ -60,41 +79,82 @@ class Launcher:
         except Exception:
             return "no network"
 
+    def restore(self, selected: int, show_beta: bool):
+        """Restaure la sélection (retour d'un jeu en mode zygote), sans animation."""
+        self.show_beta = show_beta
+        self.visible_games = self._compute_visible()
+        self.selected = max(0, min(selected, len(self.visible_games) - 1))
+        self._scroll_x = float(self.selected * (TILE_W + TILE_GAP))
+
     def update(self, dt: float):
         """Anime le scroll du carousel vers la tuile sélectionnée."""
+        self._prefetch_bgs()
         step = TILE_W + TILE_GAP
         target = self.selected * step
         self._scroll_x += (target - self._scroll_x) * min(1.0, 14.0 * dt)
+        if abs(target - self._scroll_x) < 0.5:
+            self._scroll_x = float(target)   # fin d'animation : plus rien ne bouge
+        self._track_changes()
+
+    def is_idle(self) -> bool:
+        """True si rien n'est à redessiner et que le carousel est au repos."""
+        return not self._dirty and self._scroll_x == self.selected * (TILE_W + TILE_GAP)
+
+    def invalidate(self, rect=None):
+        """Marque une zone (tout l'écran par défaut) à redessiner."""
+        self._dirty.append(pygame.Rect(rect) if rect else self.screen.get_rect())
+
+    def _track_changes(self):
+        """Compare l'état courant au dernier rendu et en déduit les zones sales."""
+        w, h = self.screen.get_size()
+        game = self.visible_games[self.selected] if self.visible_games else None
+        has_bg = game is not None and self.bg_images.get(game) is not None
+        state = (self.selected, self.show_beta, has_bg, int(self._scroll_x))
+        prev, self._drawn_state = self._drawn_state, state
+        if prev is None or prev[:3] != state[:3]:
+            self.invalidate()
+        elif prev[3] != state[3]:
+            # Scroll seul : l'en-tête ne change pas
+            self.invalidate((0, HEADER_H + 1, w, h - HEADER_H - 1))
 
     def _load_images(self):
         images = {}
         for game in self.games:
-            img = None
-            img_path = game.get("image")
-            if img_path and os.path.exists(img_path):
-                try:
-                    raw = pygame.image.load(img_path).convert()
-                    img = self._cover_crop(raw, IMG_W, IMG_H)
-                except Exception:
-                    pass
-            images[game["title"]] = img
+            images[game["title"]] = self._load_cover(game.get("image"), IMG_W, IMG_H)
         return images
 
-    def _load_bg_images(self):
-        """Charge une version plein-écran de chaque cover pour le fond."""
+    def _load_bg(self, game):
+        """Charge la version plein-écran d'une cover (thread de chargement)."""
         sw, sh = self.screen.get_size()
-        bgs = {}
-        for game in self.games:
-            bg = None
-            img_path = game.get("image")
-            if img_path and os.path.exists(img_path):
-                try:
-                    raw = pygame.image.load(img_path).convert()
-                    bg = self._cover_crop(raw, sw, sh)
-                except Exception:
-                    pass
-            bgs[game["title"]] = bg
-        return bgs
+        return self._load_cover(game.get("image"), sw, sh)
+
+    def _prefetch_bgs(self):
+        """Demande le fond du jeu sélectionné puis ceux de ses voisins."""
+        n = len(self.visible_games)
+        if n == 0:
+            return
+        wanted = [self.selected]
+        for d in range(1, BG_NEIGHBOURS + 1):
+            wanted += [(self.selected + d) % n, (self.selected - d) % n]
+        self.bg_images.prefetch([self.visible_games[i] for i in wanted])
+
+    def close(self):
+        """Arrête le thread de chargement des fonds (avant pygame.quit())."""
+        self.bg_images.close()
+
+    def _load_cover(self, img_path, tw: int, th: int):
+        """Cover recadrée à (tw, th), servie par le cache disque si à jour."""
+        if not img_path or not os.path.exists(img_path):
+            return None
+
+        def build():
+            raw = asset_pack.load(img_path, alpha=False)
+            return self._cover_crop(raw, tw, th)
+
+        try:
+            return cover_cache.load(img_path, (tw, th), build)
+        except Exception:
+            return None
 
     @staticmethod
     def _cover_crop(surf: pygame.Surface, tw: int, th: int) -> pygame.Surface:
@@ -169,6 +229,20 @@ class Launcher:
         return None
 
     def render(self):
+        """Redessine les zones sales et retourne leur liste (vide si rien à faire).
+
+        À passer ensuite à `pygame.display.update(rects)`.
+        """
+        if not self._dirty:
+            return []
+        dirty, self._dirty = self._dirty, []
+        region = dirty[0].unionall(dirty[1:])
+        self.screen.set_clip(region)
+        self._draw(region)
+        self.screen.set_clip(None)
+        return [region]
+
+    def _draw(self, region: pygame.Rect):
         w, h = self.screen.get_size()
 
         if not self.visible_games:
@@ -181,12 +255,10 @@ class Launcher:
         self.selected = max(0, min(self.selected, len(self.visible_games) - 1))
 
         # ── Fond : cover du jeu sélectionné ───────────────────────────────────
-        bg = self.bg_images.get(self.visible_games[self.selected]["title"])
+        bg = self.bg_images.get(self.visible_games[self.selected])
         if bg:
             self.screen.blit(bg, (0, 0))
-            overlay = pygame.Surface((w, h), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 175))
-            self.screen.blit(overlay, (0, 0))
+            overlay_pool.fill(self.screen, (0, 0, 0, 175))
         else:
             self.screen.fill(BG_COLOR)
 
@@ -205,7 +277,7 @@ class Launcher:
 
         # Zone de clip : toute la zone sous le header (cache les débordements)
         clip_rect = pygame.Rect(0, HEADER_H, w, h - HEADER_H)
-        self.screen.set_clip(clip_rect)
+        self.screen.set_clip(clip_rect.clip(region))
 
         for i, g in enumerate(self.visible_games):
             x = center_x + i * step - int(self._scroll_x)
@@ -266,7 +338,7 @@ class Launcher:
                      badge_rect.y + (badge_h - badge_surf.get_height()) // 2),
                 )
 
-        self.screen.set_clip(None)
+        self.screen.set_clip(region)
 
         # ── Dégradés bords gauche/droite (effet profondeur carousel) ──────────
         FADE_W = 48
@@ -281,13 +353,13 @@ class Launcher:
             self.screen.blit(fade, (0 if side == 'left' else w - FADE_W, HEADER_H))
 
         # ── Flèches indicatrices ──────────────────────────────────────────────
-        arrow_font = pygame.font.SysFont("Arial", 20, bold=True)
+        arrow_font = font_cache.get_font("Arial", 20, bold=True)
         arrow_y    = HEADER_H + (h - HEADER_H) // 2 - 10
         if self.selected > 0:
-            a = arrow_font.render("◄", True, (180, 180, 180))
+            a = font_cache.render(arrow_font, "◄", (180, 180, 180))
             self.screen.blit(a, (6, arrow_y))
         if self.selected < len(self.visible_games) - 1:
-            a = arrow_font.render("►", True, (180, 180, 180))
+            a = font_cache.render(arrow_font, "►", (180, 180, 180))
             self.screen.blit(a, (w - a.get_width() - 6, arrow_y))
 
         # ── Indicateurs de position (points) ──────────────────────────────────
@@ -304,10 +376,100 @@ class Launcher:
                 pygame.draw.circle(self.screen, col, (cx, dot_y), dot_r)
 
         # ── Indication de navigation ───────────────────────────────────────────
-        hint_font = pygame.font.SysFont("Arial", 11)
-        hint = hint_font.render("◄ ► naviguer    A/Entrée sélectionner    B/Échap quitter", True, (100, 100, 100))
+        hint_font = font_cache.get_font("Arial", 11)
+        hint = font_cache.render(hint_font, "◄ ► naviguer    A/Entrée sélectionner    B/Échap quitter", (100, 100, 100))
         self.screen.blit(hint, ((w - hint.get_width()) // 2, h - hint.get_height() - 4))
 
         # ── IP en bas à gauche (discret) ────────────────────────────────────
-        ip_surf = hint_font.render(self._ip, True, (55, 55, 55))
+        ip_surf = font_cache.render(hint_font, self._ip, (55, 55, 55))
         self.screen.blit(ip_surf, (4, h - ip_surf.get_height() - 4))
+
+
+class _BackgroundLoader:
+    """LRU des fonds plein écran, décodés sur un thread de chargement.
+
+    Seuls les jeux demandés via `prefetch()` sont chargés ; une demande
+    devenue obsolète (l'utilisateur a déjà scrollé plus loin) est ignorée.
+    La mémoire est plafonnée à `max_bytes` : les fonds les moins récemment
+    demandés sont évincés en premier.
+    """
+
+    def __init__(self, load, max_bytes: int):
+        self._load      = load            # game -> Surface | None
+        self._max_bytes = max_bytes
+        self._lru       = OrderedDict()   # title -> (Surface | None, octets)
+        self._bytes     = 0
+        self._wanted    = []              # titres demandés, par priorité
+        self._pending   = set()
+        self._lock      = threading.Lock()
+        self._queue     = queue.Queue()
+        self._thread    = threading.Thread(target=self._worker, name="launcher-bg", daemon=True)
+        self._thread.start()
+        mem_budget.register("launcher.backgrounds", self.stats, self.evict)
+
+    def stats(self) -> tuple:
+        with self._lock:
+            return len(self._lru), self._bytes
+
+    def evict(self) -> None:
+        """Oublie tous les fonds ; le prochain `prefetch()` les recharge."""
+        with self._lock:
+            self._lru.clear()
+            self._bytes  = 0
+            self._wanted = []
+
+    def get(self, game):
+        """Retourne le fond s'il est déjà chargé, sinon None."""
+        with self._lock:
+            entry = self._lru.get(game["title"])
+            if entry is None:
+                return None
+            self._lru.move_to_end(game["title"])
+            return entry[0]
+
+    def prefetch(self, games) -> None:
+        """Déclare les fonds utiles (par priorité) et lance ceux manquants."""
+        titles = [g["title"] for g in games]
+        with self._lock:
+            if titles == self._wanted:
+                return
+            self._wanted = titles
+            # Les fonds demandés deviennent les plus récents (dernier = premier servi)
+            for t in reversed(titles):
+                if t in self._lru:
+                    self._lru.move_to_end(t)
+            for g in games:
+                t = g["title"]
+                if t not in self._lru and t not in self._pending:
+                    self._pending.add(t)
+                    self._queue.put(g)
+
+    def close(self) -> None:
+        mem_budget.unregister("launcher.backgrounds")
+        self._queue.put(None)
+        self._thread.join(timeout=2.0)
+
+    def _worker(self) -> None:
+        while True:
+            game = self._queue.get()
+            if game is None:
+                return
+            title = game["title"]
+            with self._lock:
+                stale = title not in self._wanted
+                if stale:
+                    self._pending.discard(title)
+            if stale:
+                continue
+
+            surf = self._load(game)
+            size = surf.get_bytesize() * surf.get_width() * surf.get_height() if surf else 0
+
+            with self._lock:
+                self._pending.discard(title)
+                self._lru[title] = (surf, size)
+                pygame.event.post(pygame.event.Event(BG_READY_EVENT, title=title))
+                self._bytes += size
+                while self._bytes > self._max_bytes and len(self._lru) > 1:
+                    _, (_, old_size) = self._lru.popitem(last=False)
+                    self._bytes -= old_size
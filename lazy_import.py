@@ -0,0 +1,164 @@
+"""Module partagé – imports paresseux et rapport de temps d'import par jeu.
+
+`main.launch_game` importe le `main` du jeu, qui importait aussitôt toutes
+ses scènes, renderers et sons : l'écran noir durait le temps de tout charger,
+même ce qui ne sert qu'après le menu. Ici :
+
+- `module(name)` renvoie un proxy : le vrai import n'a lieu qu'au premier
+  accès à un attribut (`scene.run(...)`) ;
+- `prefetch(*names)` importe ces modules dans un thread de fond pendant que
+  le splash / l'écran de sélection tourne. Si le jeu en a besoin avant la
+  fin, l'import sur le thread principal attend simplement le verrou du
+  module (import déjà à moitié fait, jamais deux fois) ;
+- `join()` attend les imports de fond : main.py l'appelle avant de nettoyer
+  `sys.modules`, pour qu'un import en retard n'y réinsère pas un module.
+
+Un module importé en fond ne doit rien faire d'autre que définir des
+fonctions / constantes (aucun appel pygame au niveau module).
+
+    import lazy_import
+    _game = lazy_import.module("scenes.game")
+    lazy_import.prefetch("scenes.game")      # après l'ouverture de la fenêtre
+    ...
+    _game.run(screen, joysticks, slot_id, seed)
+
+Rapport `-X importtime` (un sous-processus par jeu, modules du launcher déjà
+chargés comme dans main.py) :
+
+    python lazy_import.py                    # tous les jeux
+    python lazy_import.py Doom "Minecraft 2D" --top 15
+"""
+
+import importlib
+import os
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+from logger import log
+
+BASE_DIR = Path(__file__).resolve().parent
+_MARKER  = "── import du jeu ──"
+
+_threads = []
+
+
+# ── Imports paresseux ─────────────────────────────────────────────────────────
+
+class _LazyModule:
+    """Proxy de module : importe `name` au premier accès à un attribut."""
+
+    def __init__(self, name: str):
+        self._name = name
+        self._mod  = None
+
+    def __getattr__(self, attr):
+        mod = self._mod
+        if mod is None:
+            mod = self._mod = importlib.import_module(self._name)
+        return getattr(mod, attr)
+
+    def __repr__(self):
+        state = "chargé" if self._mod is not None else "différé"
+        return f"<module paresseux '{self._name}' ({state})>"
+
+
+def module(name: str) -> _LazyModule:
+    """Module `name`, importé seulement au premier usage."""
+    return _LazyModule(name)
+
+
+def prefetch(*names: str) -> None:
+    """Importe `names` dans l'ordre, sur un thread de fond."""
+    t = threading.Thread(target=_prefetch_loop, args=(names,),
+                         name="lazy-import", daemon=True)
+    _threads.append(t)
+    t.start()
+
+
+def join(timeout: float = 10.0) -> None:
+    """Attend la fin des imports de fond en cours."""
+    while _threads:
+        _threads.pop().join(timeout)
+
+
+def _prefetch_loop(names) -> None:
+    for name in names:
+        try:
+            importlib.import_module(name)
+        except Exception as exc:
+            # L'import sera retenté (et l'erreur levée) au premier usage
+            log(f"[LazyImport] préchargement '{name}' impossible : {exc}", "warning")
+            return
+
+
+# ── Rapport -X importtime ─────────────────────────────────────────────────────
+
+# Exécuté dans le sous-processus : charge les modules du launcher (main.py
+# sans lancer main()), reproduit le chdir / sys.path de launch_game, puis
+# importe le point d'entrée du jeu.
+_PROBE = """
+import os, runpy, sys
+runpy.run_path(sys.argv[1], run_name="_launcher")
+os.chdir(sys.argv[2])
+sys.path.insert(0, sys.argv[2])
+sys.stderr.write(sys.argv[4] + "\\n")
+sys.stderr.flush()
+__import__(sys.argv[3])
+"""
+
+
+def import_times(game: dict):
+    """[(module, self µs, cumulé µs)] des modules importés par le jeu."""
+    env = dict(os.environ,
+               SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy",
+               PYGAME_HIDE_SUPPORT_PROMPT="1")
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _PROBE,
+         str(BASE_DIR / "main.py"), game["path"], game.get("entry", "main"), _MARKER],
+        cwd=BASE_DIR, env=env, capture_output=True, text=True)
+    lines = proc.stderr.splitlines()
+    if _MARKER not in lines:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1] if proc.stderr.strip()
+                           else f"code {proc.returncode}")
+    rows = []
+    for line in lines[lines.index(_MARKER) + 1:]:
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumul_us, name = line[len("import time:"):].split("|")
+        if self_us.strip().isdigit():   # saute la ligne d'en-tête
+            # nom précédé d'un espace, puis 2 espaces par niveau d'imbrication
+            rows.append((name[1:].rstrip(), int(self_us), int(cumul_us)))
+    return rows
+
+
+def report(game: dict, top: int = 10) -> str:
+    """Total d'import du jeu + les `top` modules les plus coûteux (cumulé)."""
+    rows  = import_times(game)
+    total = sum(cum for name, _, cum in rows if not name.startswith(" "))
+    out   = [f"{game['title']} : {total / 1000:.0f} ms, {len(rows)} modules"]
+    for name, self_us, cum_us in sorted(rows, key=lambda r: r[2], reverse=True)[:top]:
+        out.append(f"  {cum_us / 1000:8.1f} ms  (propre {self_us / 1000:6.1f})  {name.strip()}")
+    return "\n".join(out)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    ap = argparse.ArgumentParser(description="Temps d'import (-X importtime) de chaque jeu.")
+    ap.add_argument("titles", nargs="*", help="titres des jeux (défaut : tous)")
+    ap.add_argument("--top", type=int, default=10, help="modules affichés par jeu")
+    args = ap.parse_args()
+
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    from main import GAMES
+    wanted = {t.lower() for t in args.titles}
+    for game in GAMES:
+        if wanted and game["title"].lower() not in wanted:
+            continue
+        try:
+            print(report(game, args.top))
+        except RuntimeError as exc:
+            print(f"{game['title']} : échec ({exc})")
+        print()
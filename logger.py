@@ -3,21 +3,57 @@ Module de logging partagé – écrit dans debug.log à la racine du projet.
 Usage :
     from logger import log
     log("mon message")
+
+Écriture asynchrone : `log()` formate la ligne et la pousse dans une queue,
+un thread d'écriture la vide par lots. Le disque (carte SD sur Odroid) n'est
+donc plus touché à chaque appel depuis la boucle de jeu.
+
+- niveau ≥ warning : `log()` attend que la ligne soit écrite et flushée
+  (comme avant, la dernière ligne avant un crash n'est jamais perdue) ;
+- autres niveaux   : flush par lot, au plus tard FLUSH_INTERVAL secondes ;
+- `flush()`        : force l'écriture de tout ce qui est en attente
+  (appelé aussi à la sortie du processus et avant un fork) ;
+- `dump_recent()`  : recopie dans debug.log les RING_SIZE derniers messages
+  (contexte d'un crash ou d'un sys.exit() intercepté).
 """
+import atexit
 import logging
 import os
+import queue
+import sys
+import threading
+import time
+from collections import deque
 from pathlib import Path
 
 LOG_PATH = Path(__file__).parent / "debug.log"
 
+FLUSH_INTERVAL = 0.5   # secondes max entre deux flush disque
+RING_SIZE      = 200   # messages récents gardés en mémoire pour dump_recent()
+FLUSH_TIMEOUT  = 2.0   # attente max de flush() si le thread est bloqué
+
+
+class _QueueHandler(logging.Handler):
+    """Formate sur le thread appelant puis délègue l'écriture au thread dédié."""
+
+    def emit(self, record):
+        try:
+            line = self.format(record)
+        except Exception:
+            self.handleError(record)
+            return
+        _recent.append(line)
+        _queue.put((record.levelno, line))
+
+
+_recent = deque(maxlen=RING_SIZE)
+_queue  = queue.SimpleQueue()
+
 logging.basicConfig(
     level=logging.DEBUG,
     format="%(asctime)s  %(levelname)-7s  %(message)s",
     datefmt="%H:%M:%S",
-    handlers=[
-        logging.FileHandler(LOG_PATH, encoding="utf-8"),
-        logging.StreamHandler(),   # garde aussi l'affichage console
-    ],
+    handlers=[_QueueHandler()],
 )
 
 _logger = logging.getLogger("launcher")
@@ -25,6 +61,102 @@ _logger = logging.getLogger("launcher")
 
 def log(msg: str, level: str = "info"):
     getattr(_logger, level.lower(), _logger.info)(msg)
-    # Forcer l'écriture immédiate sur disque (utile sur Odroid)
-    for h in _logger.handlers + logging.root.handlers:
-        h.flush()
+    # Warnings / erreurs : écriture immédiate sur disque (utile sur Odroid)
+    if level.lower() in ("warning", "error", "critical"):
+        flush()
+
+
+def flush() -> None:
+    """Bloque jusqu'à ce que tous les messages en attente soient sur disque."""
+    if not _writer.is_alive():
+        return
+    done = threading.Event()
+    _queue.put(done)
+    done.wait(FLUSH_TIMEOUT)
+
+
+def dump_recent(reason: str) -> None:
+    """Écrit le bloc des derniers messages dans debug.log puis flush."""
+    lines = list(_recent)
+    block = "\n".join(
+        [f"──── {len(lines)} derniers messages ({reason}) ────", *lines, "────"])
+    _queue.put((logging.ERROR, block))
+    flush()
+
+
+# ── Thread d'écriture ─────────────────────────────────────────────────────────
+
+def _writer_loop(q):
+    try:
+        f = open(LOG_PATH, "a", encoding="utf-8")
+    except OSError:
+        f = None
+    last_flush = time.monotonic()
+    pending    = False
+
+    while True:
+        try:
+            item = q.get(timeout=FLUSH_INTERVAL)
+        except queue.Empty:
+            item = None
+
+        # Vide tout ce qui est déjà en queue : un seul write par lot
+        lines, waiters, urgent = [], [], False
+        while item is not None:
+            if isinstance(item, threading.Event):
+                waiters.append(item)
+            else:
+                levelno, line = item
+                lines.append(line)
+                urgent = urgent or levelno >= logging.WARNING
+            try:
+                item = q.get_nowait()
+            except queue.Empty:
+                item = None
+
+        if lines:
+            text = "\n".join(lines) + "\n"
+            if f is not None:
+                f.write(text)
+            sys.stderr.write(text)   # garde aussi l'affichage console
+            pending = True
+
+        now = time.monotonic()
+        if pending and (urgent or waiters or now - last_flush >= FLUSH_INTERVAL):
+            if f is not None:
+                f.flush()
+            sys.stderr.flush()
+            last_flush = now
+            pending    = False
+
+        for w in waiters:
+            w.set()
+
+
+def _start_writer():
+    t = threading.Thread(target=_writer_loop, args=(_queue,), name="logger", daemon=True)
+    t.start()
+    return t
+
+
+def _after_fork_in_child():
+    # Le thread d'écriture n'existe pas dans l'enfant : nouvelle queue + thread
+    global _queue, _writer
+    _queue  = queue.SimpleQueue()
+    _writer = _start_writer()
+
+
+def _excepthook(exc_type, exc, tb):
+    if issubclass(exc_type, KeyboardInterrupt):
+        sys.__excepthook__(exc_type, exc, tb)
+        return
+    _logger.error("Exception non gérée", exc_info=(exc_type, exc, tb))
+    dump_recent("crash")
+
+
+_writer = _start_writer()
+atexit.register(flush)
+if hasattr(os, "register_at_fork"):
+    # Flush avant fork : aucun lot à moitié bufferisé n'est dupliqué dans l'enfant
+    os.register_at_fork(before=flush, after_in_child=_after_fork_in_child)
+sys.excepthook = _excepthook
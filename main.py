@@ -1,12 +1,18 @@
 import pygame
 import sys
 import os
-import subprocess
 import importlib
 from pathlib import Path
-from logger import log
+from logger import log, dump_recent, flush as flush_log
 
+import font_cache
+import lazy_import
+import mem_budget
+import persist
+import input_recorder as _input
 import music_player as _music
+import zygote as _zygote
+from updater import SelfUpdate
 
 BASE_DIR = Path(__file__).parent
 _LAUNCHER_MUSIC_DIR = str(BASE_DIR / 'music')
@@ -14,6 +20,13 @@ _LAUNCHER_MUSIC_DIR = str(BASE_DIR / 'music')
 SCREEN_WIDTH = 480
 SCREEN_HEIGHT = 320
 
+# Launcher au repos : on attend les événements au lieu de tourner à 60 FPS
+IDLE_WAIT_MS = 1000
+# Bande occupée par la barre de progression du combo update (texte + barre)
+_UPDATE_BAR_AREA = pygame.Rect(0, SCREEN_HEIGHT - 56, SCREEN_WIDTH, 40)
+# `python main.py --record` : entrées de chaque jeu enregistrées (voir input_recorder.py)
+RECORD_INPUTS = "--record" in sys.argv
+
 GAMES = [
     {
         "title": "Pokédex",
@@ -76,8 +89,12 @@ GAMES = [
 ]
 
 
-def launch_game(game):
-    """Lance un jeu : chdir dans son dossier, importe son main et l'exécute."""
+def launch_game(game, session=None):
+    """Lance un jeu : chdir dans son dossier, importe son main et l'exécute.
+
+    `session` : `input_recorder.Recorder` / `Replayer` actif pendant la partie.
+    Avec `--record`, un Recorder est créé automatiquement.
+    """
     game_path = Path(game["path"])
     entry = game.get("entry", "main")
     log(f"[Launcher] Lancement de '{game.get('title')}' ({game_path})")
@@ -89,17 +106,27 @@ def launch_game(game):
     original_cwd = Path.cwd()
     original_syspath = sys.path.copy()
     original_modules = set(sys.modules.keys())
+    original_caches = mem_budget.registered()
 
     try:
         os.chdir(game_path)
         sys.path.insert(0, str(game_path))
         log(f"[Launcher] chdir OK, sys.path mis à jour")
 
-        # Vider la queue d'événements AVANT de quitter pygame
-        pygame.event.clear()
-        pygame.quit()
+        # Vider la queue d'événements AVANT de quitter pygame (déjà fait par
+        # le parent sur le chemin zygote : pygame n'est plus initialisé)
+        if pygame.get_init():
+            pygame.event.clear()
+            pygame.quit()
+        font_cache.clear()   # polices liées à l'instance pygame qui vient de s'arrêter
         log(f"[Launcher] pygame.quit() OK")
 
+        if session is None and RECORD_INPUTS:
+            session = _input.Recorder(_input.recording_path(game), game)
+        if session is not None:
+            # Avant l'import : graine RNG et Clock déjà en place pour le jeu
+            session.install()
+
         log(f"[Launcher] importlib.import_module('{entry}') start")
         try:
             mod = importlib.import_module(entry)
@@ -107,31 +134,46 @@ def launch_game(game):
             import traceback
             log(f"[Launcher] IMPORT CRASH '{game.get('title')}' : {e}", "error")
             log(traceback.format_exc(), "error")
+            dump_recent("crash import")
             return
 
         log(f"[Launcher] import OK, appel mod.main()")
         try:
             mod.main()
             log(f"[Launcher] mod.main() retour normal")
+        except _input.ReplayEnd:
+            log(f"[Launcher] fin du rejeu des entrées")
         except SystemExit:
             log(f"[Launcher] mod.main() sys.exit() intercepté", "warning")
+            dump_recent("sys.exit")
         except Exception as e:
             import traceback
             log(f"[Launcher] CRASH '{game.get('title')}' : {e}", "error")
             log(traceback.format_exc(), "error")
+            dump_recent("crash")
 
     finally:
+        if session is not None:
+            session.uninstall()
+        # Sauvegardes en attente écrites avant de rendre la main au launcher
+        persist.close()
+        # Un import de fond encore en cours réinsérerait ses modules après le nettoyage
+        lazy_import.join()
         log(f"[Launcher] finally : nettoyage modules pour '{game.get('title')}'")
         # Nettoyer les modules chargés par le jeu
         for key in list(sys.modules.keys()):
             if key not in original_modules:
                 del sys.modules[key]
+        mem_budget.unregister_all(keep=original_caches)
         sys.path[:] = original_syspath
         os.chdir(original_cwd)
         log(f"[Launcher] finally : nettoyage terminé")
+        flush_log()
 
 
-def main():
+def _init_display():
+    """Initialise pygame, la manette et la fenêtre du launcher."""
+    font_cache.clear()   # polices d'un éventuel pygame précédent (mode zygote)
     pygame.init()
     pygame.joystick.init()
     joysticks = [pygame.joystick.Joystick(i) for i in range(pygame.joystick.get_count())]
@@ -140,24 +182,60 @@ def main():
 
     screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
     pygame.display.set_caption("Game Launcher")
+    return screen
+
+
+def _draw_update_bar(screen, font, progress, label, color):
+    """Barre de progression du combo update (dans _UPDATE_BAR_AREA)."""
+    w, h = screen.get_size()
+    bar_w, bar_h = 200, 20
+    bar_x = (w - bar_w) // 2
+    bar_y = h - 40
+    pygame.draw.rect(screen, (50, 50, 50), (bar_x, bar_y, bar_w, bar_h))
+    pygame.draw.rect(screen, color, (bar_x, bar_y, int(bar_w * min(1.0, progress)), bar_h))
+    pygame.draw.rect(screen, (255, 255, 255), (bar_x, bar_y, bar_w, bar_h), 2)
+    if len(label) > 64:
+        label = label[:61] + "..."
+    text = font.render(label, True, (255, 255, 255))
+    screen.blit(text, ((w - text.get_width()) // 2, bar_y - 15))
+
+
+def main():
+    # Mode zygote : processus chaud, un fork par jeu (voir zygote.py)
+    use_zygote = "--zygote" in sys.argv and _zygote.available()
+    if use_zygote:
+        _zygote.warm_up()
+
+    screen = _init_display()
     clock = pygame.time.Clock()
 
     _music.load_folder(_LAUNCHER_MUSIC_DIR)
 
     from launcher import Launcher
     launcher = Launcher(screen, GAMES, BASE_DIR)
-    launcher.render()
 
     UPDATE_HOLD_DURATION = 5000  # 5 secondes
     _launcher_pressed = set()
     _update_combo_start = None
+    _bar_shown = False
+    _update = None            # SelfUpdate en cours (thread git pull + compilation)
+    _update_done_at = None
     font_ui = pygame.font.SysFont("Arial", 14)
 
     running = True
     while running:
-        dt = clock.tick(60) / 1000.0
-        events = pygame.event.get()
+        if launcher.is_idle() and _update_combo_start is None and _update is None:
+            # Rien ne bouge : dormir jusqu'au prochain événement (ou timeout)
+            first = pygame.event.wait(IDLE_WAIT_MS)
+            events = [first] if first.type != pygame.NOEVENT else []
+            events += pygame.event.get()
+            clock.tick()
+            dt = 0.0   # pas de saut d'animation après une longue attente
+        else:
+            dt = clock.tick(60) / 1000.0
+            events = pygame.event.get()
         _music.tick(events)
+        mem_budget.tick()
 
         for event in events:
             if event.type == pygame.QUIT:
@@ -177,61 +255,85 @@ def main():
             # ──────────────────────────────────────────────────────────────────
 
             result = launcher.handle_event(event)
+            if result is not None and result != -1 and _update is not None:
+                result = None   # pas de lancement de jeu pendant la mise à jour
 
             if result is not None:
                 if result == -1:
                     running = False
                 else:
                     _music.stop()
-                    launch_game(result)
-                    # Le startx relance automatiquement le launcher
-                    sys.exit(0)
+                    # Thread des fonds arrêté avant pygame.quit() : plus de
+                    # convert() ni d'événement BG_READY posté dans le jeu
+                    launcher.close()
+                    pygame.event.clear()
+                    if not use_zygote:
+                        launch_game(result)
+                        # Le startx relance automatiquement le launcher
+                        sys.exit(0)
+
+                    # Zygote : l'enfant exécute le jeu, on reprend ensuite ici
+                    pygame.quit()
+                    _zygote.spawn(result, launch_game)
+
+                    selected, show_beta = launcher.selected, launcher.show_beta
+                    screen = _init_display()
+                    clock = pygame.time.Clock()
+                    font_ui = pygame.font.SysFont("Arial", 14)
+                    launcher = Launcher(screen, GAMES, BASE_DIR)
+                    launcher.restore(selected, show_beta)
+                    _launcher_pressed.clear()
+                    _update_combo_start = None
+                    _bar_shown = False
+                    _music.load_folder(_LAUNCHER_MUSIC_DIR)
+                    break
 
         if running:
             launcher.update(dt)
-            launcher.render()
+            if _update_combo_start is not None or _update is not None or _bar_shown:
+                launcher.invalidate(_UPDATE_BAR_AREA)   # fond sous la barre
+            dirty = launcher.render()
+            _bar_shown = False
 
             # ── Barre de progression du combo update ──────────────────────────
             if _update_combo_start is not None:
                 elapsed = pygame.time.get_ticks() - _update_combo_start
-                w, h = screen.get_size()
                 if elapsed >= UPDATE_HOLD_DURATION:
-                    screen.fill((0, 0, 0))
-                    msg = font_ui.render("Mise à jour via 'git pull'...", True, (255, 255, 255))
-                    screen.blit(msg, ((w - msg.get_width()) // 2, h // 2))
-                    pygame.display.flip()
-                    try:
-                        git_result = subprocess.run(
-                            ['git', 'pull'],
-                            cwd=str(BASE_DIR),
-                            capture_output=True, text=True, check=True, encoding='utf-8'
-                        )
-                        screen.fill((0, 0, 0))
-                        msg = font_ui.render("Mise à jour terminée. Redémarrage...", True, (100, 255, 100))
-                        screen.blit(msg, ((w - msg.get_width()) // 2, h // 2))
-                        pygame.display.flip()
-                        pygame.time.wait(1500)
-                        os.execv(sys.executable, ['python'] + sys.argv)
-                    except Exception as e:
-                        screen.fill((0, 0, 0))
-                        msg = font_ui.render(f"Erreur: {e}", True, (255, 100, 100))
-                        screen.blit(msg, ((w - msg.get_width()) // 2, h // 2))
-                        pygame.display.flip()
-                        pygame.time.wait(2000)
+                    # git pull + précompilation sur un thread : l'UI reste fluide
+                    _update = SelfUpdate(BASE_DIR)
+                    _update.start()
                     _update_combo_start = None
                 else:
-                    progress = elapsed / UPDATE_HOLD_DURATION
-                    bar_w, bar_h = 200, 20
-                    bar_x = (w - bar_w) // 2
-                    bar_y = h - 40
-                    pygame.draw.rect(screen, (50, 50, 50), (bar_x, bar_y, bar_w, bar_h))
-                    pygame.draw.rect(screen, (255, 200, 0), (bar_x, bar_y, int(bar_w * progress), bar_h))
-                    pygame.draw.rect(screen, (255, 255, 255), (bar_x, bar_y, bar_w, bar_h), 2)
-                    text = font_ui.render("Maintenir : Git Pull & Restart", True, (255, 255, 255))
-                    screen.blit(text, ((w - text.get_width()) // 2, bar_y - 15))
+                    _draw_update_bar(screen, font_ui, elapsed / UPDATE_HOLD_DURATION,
+                                     "Maintenir : Git Pull & Restart", (255, 200, 0))
+                    _bar_shown = True
+
+            if _update is not None:
+                if _update.done and _update_done_at is None:
+                    _update_done_at = pygame.time.get_ticks()
+                if not _update.done:
+                    color = (255, 200, 0)
+                else:
+                    color = (100, 255, 100) if _update.ok else (255, 100, 100)
+                _draw_update_bar(screen, font_ui, _update.progress, _update.message, color)
+                _bar_shown = True
+
+                if _update_done_at is not None:
+                    shown = pygame.time.get_ticks() - _update_done_at
+                    if _update.ok and shown >= 1500:
+                        pygame.display.update(dirty + [_UPDATE_BAR_AREA])
+                        launcher.close()
+                        flush_log()
+                        os.execv(sys.executable, ['python'] + sys.argv)
+                    elif not _update.ok and shown >= 2000:
+                        _update = None
+                        _update_done_at = None
             # ──────────────────────────────────────────────────────────────────
 
-            pygame.display.flip()
+            if _bar_shown:
+                dirty.append(_UPDATE_BAR_AREA)
+            if dirty:
+                pygame.display.update(dirty)
 
     pygame.quit()
     sys.exit()
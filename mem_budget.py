@@ -0,0 +1,224 @@
+"""Module partagé – registre des caches et budget mémoire.
+
+L'Odroid n'a qu'1 Go de RAM et plusieurs caches vivent dans chaque jeu
+(chunks Minecraft2D, sprites Pokédex, fonds Shifter, polices…). Chaque cache
+s'enregistre ici avec une fonction de statistiques et, s'il peut se
+reconstruire à la demande, une fonction d'éviction :
+
+    import mem_budget
+
+    mem_budget.register("pokedex.sprites",
+                        lambda: (len(sprite_cache), mem_budget.surfaces_bytes(sprite_cache)),
+                        sprite_cache.clear)
+
+`stats()` retourne (entrées, octets estimés). `evict()` libère tout ce qui
+peut l'être ; elle est appelée sur pression mémoire (RSS du processus au-delà
+de RSS_LIMIT_MB, variable d'environnement MEM_BUDGET_MB) ou via `pressure()`.
+Un nom déjà enregistré est remplacé (une nouvelle partie remplace l'ancienne).
+
+`tick()` est appelé à chaque frame par QuitCombo : relevé du RSS toutes les
+CHECK_INTERVAL secondes, ligne « [Mem] » dans debug.log toutes les
+LOG_INTERVAL secondes. L'overlay (`MemOverlay`, relayé aussi par QuitCombo)
+s'affiche avec les boutons 7 + 13 + 16 maintenus ensemble ou F5 : accord
+qu'aucun jeu n'utilise (12 / 17 servent de bombe, modificateur, mini-carte).
+
+main.py oublie les caches enregistrés par un jeu quand on revient au
+launcher (`registered()` / `unregister_all(keep)`) : le registre ne doit pas
+garder vivants les modules d'un jeu terminé.
+"""
+
+import os
+import time
+
+import pygame
+
+from logger import log
+
+TOGGLE_BUTTONS    = (7, 13, 16)   # accord à 3 boutons, libre dans tous les jeux
+TOGGLE_KEY        = pygame.K_F5
+RSS_LIMIT_MB      = int(os.environ.get("MEM_BUDGET_MB", 600))
+CHECK_INTERVAL    = 1.0        # secondes entre deux relevés du RSS
+LOG_INTERVAL      = 30.0       # secondes entre deux lignes « [Mem] »
+PRESSURE_COOLDOWN = 10.0       # secondes minimum entre deux évictions automatiques
+TEXT_REFRESH      = 0.5        # secondes entre deux rendus du texte de l'overlay
+
+_caches     = {}               # nom -> (stats, evict | None)
+_next_check = 0.0
+_next_log   = 0.0
+_last_evict = -PRESSURE_COOLDOWN
+
+
+def register(name: str, stats, evict=None) -> None:
+    """Enregistre (ou remplace) le cache `name`."""
+    _caches[name] = (stats, evict)
+
+
+def unregister(name: str) -> None:
+    _caches.pop(name, None)
+
+
+def registered() -> frozenset:
+    """Noms enregistrés (à repasser à `unregister_all`)."""
+    return frozenset(_caches)
+
+
+def unregister_all(keep=()) -> None:
+    """Oublie tous les caches sauf ceux de `keep`."""
+    for name in list(_caches):
+        if name not in keep:
+            del _caches[name]
+
+
+def snapshot() -> list:
+    """[(nom, entrées, octets)] triés par taille décroissante."""
+    rows = []
+    for name, (stats, _) in list(_caches.items()):
+        try:
+            entries, nbytes = stats()
+        except Exception as exc:   # un cache cassé ne doit pas faire tomber le jeu
+            log(f"[Mem] stats '{name}' : {exc}", "warning")
+            entries, nbytes = 0, 0
+        rows.append((name, entries, nbytes))
+    rows.sort(key=lambda r: r[2], reverse=True)
+    return rows
+
+
+def rss_bytes():
+    """RSS actuel du processus, ou None si indisponible (hors Linux)."""
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+def pressure(reason: str = "manuel") -> int:
+    """Vide tous les caches évictables. Retourne les octets estimés libérés."""
+    global _last_evict
+    _last_evict = time.monotonic()
+    before = {name: nbytes for name, _, nbytes in snapshot()}
+    freed  = 0
+    for name, (_, evict) in list(_caches.items()):
+        if evict is None:
+            continue
+        try:
+            evict()
+        except Exception as exc:
+            log(f"[Mem] éviction '{name}' : {exc}", "warning")
+            continue
+        freed += before.get(name, 0)
+    log(f"[Mem] pression mémoire ({reason}) : ~{_mb(freed)} Mo libérés")
+    return freed
+
+
+def tick() -> None:
+    """À appeler une fois par frame (fait par QuitCombo)."""
+    global _next_check, _next_log
+    now = time.monotonic()
+    if now < _next_check:
+        return
+    _next_check = now + CHECK_INTERVAL
+
+    rss = rss_bytes()
+    if rss is not None and rss > RSS_LIMIT_MB * 2**20 \
+            and now - _last_evict >= PRESSURE_COOLDOWN:
+        pressure(f"RSS {_mb(rss)} Mo > {RSS_LIMIT_MB} Mo")
+
+    if now >= _next_log:
+        _next_log = now + LOG_INTERVAL
+        if _caches:
+            log("[Mem] " + summary(rss))
+
+
+def summary(rss=None) -> str:
+    """Ligne lisible : RSS puis chaque cache (entrées, Mo)."""
+    parts = [f"RSS {_mb(rss)} Mo" if rss is not None else "RSS ?"]
+    total = 0
+    for name, entries, nbytes in snapshot():
+        total += nbytes
+        parts.append(f"{name} {entries} ({_mb(nbytes)} Mo)")
+    parts.insert(1, f"caches {_mb(total)} Mo")
+    return " | ".join(parts)
+
+
+# ── Estimation des tailles ────────────────────────────────────────────────────
+
+def surface_bytes(surf) -> int:
+    return surf.get_pitch() * surf.get_height()
+
+
+def surfaces_bytes(obj) -> int:
+    """Octets des surfaces contenues dans `obj` (dict, liste, tuple, imbriqués)."""
+    if isinstance(obj, pygame.Surface):
+        return surface_bytes(obj)
+    if isinstance(obj, dict):
+        obj = list(obj.values())
+    if isinstance(obj, (list, tuple)):
+        return sum(surfaces_bytes(o) for o in obj)
+    return 0
+
+
+def sound_bytes(snd) -> int:
+    """Octets PCM d'un `pygame.mixer.Sound` (sans copier le buffer)."""
+    init = pygame.mixer.get_init()
+    if not init:
+        return 0
+    freq, size, channels = init
+    return int(snd.get_length() * freq) * channels * (abs(size) // 8)
+
+
+def _mb(nbytes) -> str:
+    return f"{nbytes / 2**20:.1f}"
+
+
+# ── Overlay ───────────────────────────────────────────────────────────────────
+
+class MemOverlay:
+    """Tableau RSS + caches en haut à gauche, basculé par 7+13+16 ou F5."""
+
+    def __init__(self):
+        self.visible  = False
+        self._pressed = set()
+        self._font    = None   # initialisé à la demande (pygame doit être actif)
+        self._lines   = []
+        self._text_t  = 0.0
+
+    def handle_event(self, event) -> None:
+        if event.type == pygame.KEYDOWN and event.key == TOGGLE_KEY:
+            self.visible = not self.visible
+        elif event.type == pygame.JOYBUTTONDOWN:
+            self._pressed.add(event.button)
+            if event.button in TOGGLE_BUTTONS and all(b in self._pressed for b in TOGGLE_BUTTONS):
+                self.visible = not self.visible
+        elif event.type == pygame.JOYBUTTONUP:
+            self._pressed.discard(event.button)
+
+    def draw(self, screen) -> None:
+        if not self.visible:
+            return
+        if self._font is None:
+            self._font = pygame.font.SysFont("Arial", 10)
+        now = time.monotonic()
+        if now - self._text_t >= TEXT_REFRESH:
+            self._text_t = now
+            self._lines  = [self._font.render(t, True, c) for t, c in self._rows()]
+
+        line_h = self._font.get_linesize()
+        w = max((s.get_width() for s in self._lines), default=0) + 8
+        h = line_h * len(self._lines) + 6
+        pygame.draw.rect(screen, (10, 10, 20), (2, 2, w, h))
+        for i, surf in enumerate(self._lines):
+            screen.blit(surf, (6, 5 + i * line_h))
+
+    def _rows(self) -> list:
+        rss  = rss_bytes()
+        rows = snapshot()
+        over = rss is not None and rss > RSS_LIMIT_MB * 2**20
+        head = f"RSS {_mb(rss)} / {RSS_LIMIT_MB} Mo" if rss is not None else "RSS ?"
+        lines = [(head, (255, 90, 90) if over else (140, 230, 140)),
+                 (f"caches {_mb(sum(r[2] for r in rows))} Mo", (220, 220, 220))]
+        for name, entries, nbytes in rows:
+            evictable = _caches.get(name, (None, None))[1] is not None
+            lines.append((f"{name:<22} {entries:>5}  {_mb(nbytes):>6} Mo",
+                          (200, 200, 200) if evictable else (150, 150, 170)))
+        return lines
@@ -26,15 +26,22 @@ Utilisation
 Comportement
 ------------
 - Chaque piste joue une fois (non en boucle).
-- À la fin d'une piste, une nouvelle est choisie aléatoirement parmi
+- Dès qu'une piste démarre, la suivante est choisie aléatoirement parmi
   les autres fichiers du même dossier (évite la répétition immédiate).
+  Un thread la lit entièrement (cache disque du noyau) puis elle est mise
+  en file avec `mixer.music.queue` : SDL l'enchaîne sans blanc et le
+  chargement ne lit que de la RAM, sans accroc sur la frame en cours.
+- Le contenu des dossiers est mis en cache ; il n'est relu que si la date
+  de modification du dossier change.
 - Formats acceptés : mp3, ogg, wav, flac.
 - tick() traite automatiquement les touches PageUp/PageDown et les boutons
   joystick 15 (vol+) / 14 (vol-) sans configuration supplémentaire.
 """
 from __future__ import annotations
 import os
+import queue
 import random
+import threading
 import pygame
 
 # Événement pygame déclenché automatiquement par SDL en fin de piste
@@ -44,8 +51,16 @@ _END_EVENT: int = pygame.USEREVENT + 10
 _folder:    str   = ''
 _files:     list  = []
 _last_file: str   = ''
+_next_file: str   = ''     # piste suivante, en préchargement ou en file
+_queued:    bool  = False  # _next_file déjà passée à mixer.music.queue
 _volume:    float = 0.55   # volume courant [0.0 – 1.0]
 
+_index:  dict = {}         # dossier -> (mtime_ns, fichiers)
+_warmed: str  = ''         # dernière piste lue par le thread (écrit par le thread)
+_warm_q       = queue.SimpleQueue()
+_worker       = None
+_WARM_CHUNK   = 256 * 1024
+
 # Boutons joystick pour le volume (identiques à la config Pokédex)
 _BTN_VOL_UP:   int = 15
 _BTN_VOL_DOWN: int = 14
@@ -60,9 +75,11 @@ def load_folder(folder: str) -> None:
     Si le dossier est vide ou inexistant, la musique s'arrête silencieusement.
     Stoppe automatiquement ce qui joue déjà.
     """
-    global _folder, _files, _last_file
+    global _folder, _files, _last_file, _next_file, _queued
     _folder    = folder
     _last_file = ''
+    _next_file = ''
+    _queued    = False
     _files     = _scan(folder)
     pygame.mixer.music.set_endevent(_END_EVENT)
     _play_next()
@@ -76,7 +93,7 @@ def tick(events) -> None:
     """
     for e in events:
         if e.type == _END_EVENT:
-            _play_next()
+            _on_track_end()
         elif e.type == pygame.KEYDOWN:
             if e.key == pygame.K_PAGEUP:
                 volume_up()
@@ -88,9 +105,16 @@ def tick(events) -> None:
             elif e.button == _BTN_VOL_DOWN:
                 volume_down()
 
+    # Piste suivante lue par le thread : la mettre en file (chargement depuis la RAM)
+    if _next_file and not _queued and _warmed == _next_file:
+        _queue_next()
+
 
 def stop() -> None:
     """Arrête la musique et désactive l'événement de fin."""
+    global _next_file, _queued
+    _next_file = ''
+    _queued    = False
     pygame.mixer.music.stop()
     pygame.mixer.music.set_endevent()   # supprime l'endevent
 
@@ -136,34 +160,96 @@ _EXTS = {'.mp3', '.ogg', '.wav', '.flac'}
 
 
 def _scan(folder: str) -> list:
-    """Retourne la liste des fichiers audio dans le dossier."""
+    """Liste des fichiers audio du dossier (index en cache, invalidé par mtime)."""
+    try:
+        mtime = os.stat(folder).st_mtime_ns
+    except OSError:
+        return []
+    cached = _index.get(folder)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
     try:
-        return [
+        files = [
             os.path.join(folder, f)
-            for f in os.listdir(folder)
+            for f in sorted(os.listdir(folder))
             if os.path.splitext(f)[1].lower() in _EXTS
         ]
     except OSError:
         return []
+    _index[folder] = (mtime, files)
+    return files
+
+
+def _pick(exclude: str) -> str:
+    """Piste aléatoire, différente de `exclude` si possible."""
+    choices = [f for f in _files if f != exclude] or _files
+    return random.choice(choices)
 
 
 def _play_next() -> None:
-    """Choisit et lance une piste aléatoire (différente de la précédente)."""
+    """Charge et lance une piste aléatoire (différente de la précédente)."""
     global _last_file
     if not _files:
         return
 
-    # Privilégier une piste différente de la précédente
-    choices = [f for f in _files if f != _last_file]
-    if not choices:
-        choices = _files
-
-    track = random.choice(choices)
+    track = _pick(_last_file)
     _last_file = track
 
     try:
         pygame.mixer.music.load(track)
         pygame.mixer.music.set_volume(_volume)
-        pygame.mixer.music.play()   # joue une fois → fin → _END_EVENT → _play_next
+        pygame.mixer.music.play()   # joue une fois → fin → _END_EVENT
     except Exception as exc:
         print(f'[MusicPlayer] erreur lecture {os.path.basename(track)}: {exc}')
+        return
+    _prepare_next()
+
+
+def _on_track_end() -> None:
+    """Fin de piste : la piste en file a déjà pris le relais, sinon on charge."""
+    global _last_file, _next_file, _queued
+    if _queued:
+        _last_file = _next_file
+        _next_file = ''
+        _queued    = False
+        _prepare_next()
+    else:
+        _play_next()
+
+
+def _prepare_next() -> None:
+    """Choisit la piste suivante et la fait lire par le thread de préchargement."""
+    global _next_file, _queued, _worker
+    _queued = False
+    if not _files:
+        _next_file = ''
+        return
+    _next_file = _pick(_last_file)
+    if _worker is None or not _worker.is_alive():   # aussi après un fork (zygote)
+        _worker = threading.Thread(target=_warm_loop, name="music-prefetch", daemon=True)
+        _worker.start()
+    _warm_q.put(_next_file)
+
+
+def _queue_next() -> None:
+    global _next_file, _queued
+    try:
+        pygame.mixer.music.queue(_next_file)
+        _queued = True
+    except Exception as exc:
+        print(f'[MusicPlayer] erreur file {os.path.basename(_next_file)}: {exc}')
+        _next_file = ''   # la fin de piste rechargera une piste au hasard
+
+
+def _warm_loop() -> None:
+    """Thread : lit chaque piste demandée pour la charger dans le cache disque."""
+    global _warmed
+    while True:
+        path = _warm_q.get()
+        try:
+            with open(path, 'rb', buffering=0) as f:
+                while f.read(_WARM_CHUNK):
+                    pass
+        except OSError:
+            pass
+        _warmed = path
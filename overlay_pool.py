@@ -0,0 +1,103 @@
+"""Module partagé – surfaces translucides pré-allouées pour teinter l'écran.
+
+Beaucoup de boucles créent à chaque frame une surface SRCALPHA plein écran,
+la remplissent d'une couleur puis la blittent, juste pour assombrir ou
+colorer l'image. Ce module garde ces surfaces d'une frame à l'autre :
+
+- `fill(dest, rgba, rect)` : teinte uniforme. La surface est opaque, remplie
+  une seule fois par (taille, RGB) ; l'alpha est un alpha de surface
+  (`set_alpha`) posé juste avant le blit. Toutes les valeurs d'alpha d'une
+  même couleur partagent donc un seul buffer, et SDL blitte un alpha de
+  surface plus vite qu'un alpha par pixel.
+- `ellipse(size, rgba)` : halo elliptique (alpha par pixel), alpha quantifié
+  par pas de ALPHA_STEP pour qu'un halo qui pulse ne crée pas un buffer par
+  valeur.
+
+Le pool est un LRU borné à POOL_BYTES.
+
+Usage :
+
+    import overlay_pool
+
+    overlay_pool.fill(screen, (180, 20, 20, hurt_alpha))          # plein écran
+    overlay_pool.fill(surf, (0, 0, 0, 110), (0, 0, VIEW_W, 18))   # bande HUD
+    surf.blit(overlay_pool.ellipse((w, h), (255, 230, 120, 110)), pos)
+
+Les surfaces renvoyées par `ellipse()` sont partagées : ne pas dessiner dessus.
+"""
+
+from collections import OrderedDict
+
+import pygame
+
+import mem_budget
+
+ALPHA_STEP = 8                    # quantification de l'alpha des halos
+POOL_BYTES = 4 * 1024 * 1024      # budget total des surfaces du pool
+
+_pool  = OrderedDict()            # (forme, w, h, couleur) -> Surface
+_bytes = 0
+
+
+def fill(dest, rgba, rect=None) -> None:
+    """Teinte `rect` de `dest` (tout `dest` par défaut) avec `rgba`."""
+    r, g, b, a = rgba
+    if a <= 0:
+        return
+    rect = dest.get_rect() if rect is None else pygame.Rect(rect)
+    if a >= 255:
+        dest.fill((r, g, b), rect)
+        return
+    surf = _get(("rect", rect.w, rect.h, (r, g, b)), _make_rect)
+    surf.set_alpha(a)
+    dest.blit(surf, rect.topleft)
+
+
+def ellipse(size, rgba):
+    """Ellipse translucide de `size` pixels (alpha quantifié)."""
+    r, g, b, a = rgba
+    a = min(255, round(a / ALPHA_STEP) * ALPHA_STEP)
+    return _get(("ellipse", int(size[0]), int(size[1]), (r, g, b, a)), _make_ellipse)
+
+
+def stats() -> tuple:
+    """(surfaces en cache, octets)."""
+    return len(_pool), _bytes
+
+
+def clear() -> None:
+    global _bytes
+    _pool.clear()
+    _bytes = 0
+
+
+# ── Internals ─────────────────────────────────────────────────────────────────
+
+def _get(key, make):
+    global _bytes
+    surf = _pool.get(key)
+    if surf is not None:
+        _pool.move_to_end(key)
+        return surf
+    surf = make(*key[1:])
+    _pool[key] = surf
+    _bytes += surf.get_pitch() * surf.get_height()
+    while _bytes > POOL_BYTES and len(_pool) > 1:
+        _, old = _pool.popitem(last=False)
+        _bytes -= old.get_pitch() * old.get_height()
+    return surf
+
+
+def _make_rect(w, h, rgb):
+    surf = pygame.Surface((w, h))
+    surf.fill(rgb)
+    return surf
+
+
+def _make_ellipse(w, h, rgba):
+    surf = pygame.Surface((w, h), pygame.SRCALPHA)
+    pygame.draw.ellipse(surf, rgba, surf.get_rect())
+    return surf
+
+
+mem_budget.register("overlay_pool", stats, clear)
@@ -0,0 +1,187 @@
+"""Module partagé – sauvegardes asynchrones (write-behind).
+
+Les sauvegardes des jeux écrivaient sur la carte SD depuis la boucle de jeu :
+JSON réécrit en place (Motodash), `commit` à chaque appel (Pokédex), nouvelle
+connexion SQLite à chaque sauvegarde (Minecraft2D). Un fsync peut prendre
+plusieurs dizaines de ms sur l'Odroid, soit plusieurs frames perdues.
+
+Ici, les écritures sont poussées dans une queue et exécutées par un thread
+dédié :
+
+- `save_json(path, data)` : sérialise tout de suite (instantané des données),
+  écrit plus tard dans un fichier temporaire + fsync + `os.replace` → le
+  fichier est toujours soit l'ancienne version, soit la nouvelle ;
+- `submit_db(db_path, fn, key)` : `fn(conn)` est appelée sur le thread
+  d'écriture avec une connexion SQLite ouverte une seule fois par base ;
+  un seul `commit` par lot de travaux ;
+- `submit(key, fn)` : travail quelconque.
+
+Deux travaux de même clé encore en attente fusionnent : seul le plus récent
+est exécuté (ex. position d'un joueur sauvegardée toutes les 2 s). Une clé
+None n'est jamais fusionnée (ex. lot de blocs, chaque lot compte).
+
+`flush()` attend que tout soit sur disque : à appeler avant de relire une
+base qu'on vient de modifier et sur les chemins de sortie (fin d'un jeu dans
+main.py, enfant zygote, atexit). `close()` flush puis ferme les connexions.
+
+Une erreur d'écriture est journalisée (« [Persist] ») sans arrêter le thread.
+"""
+
+import atexit
+import json
+import os
+import queue
+import sqlite3
+import threading
+
+from logger import log
+
+FLUSH_TIMEOUT = 5.0   # attente max de flush() si le disque est bloqué
+
+_lock    = threading.Lock()
+_jobs    = {}         # clé -> travail en attente (le plus récent gagne)
+_pending = 0          # travaux soumis pas encore écrits
+_conns   = {}         # chemin de base -> connexion (thread d'écriture seulement)
+_queue   = None
+_worker  = None
+_pid     = None
+
+
+# ── API ───────────────────────────────────────────────────────────────────────
+
+def submit(key, fn) -> None:
+    """Exécute `fn()` sur le thread d'écriture ; fusionne avec `key` en attente."""
+    _put(("call", key), fn)
+
+
+def submit_db(db_path, fn, key=None) -> None:
+    """Exécute `fn(conn)` sur la connexion longue durée de `db_path`."""
+    path = os.path.abspath(db_path)   # le jeu peut changer de dossier courant
+    _put(("db", path, key), (path, fn))
+
+
+def save_json(path, data, indent: int = 2) -> None:
+    """Remplace atomiquement `path` par `data` en JSON (écrit en arrière-plan)."""
+    path = os.path.abspath(path)
+    text = json.dumps(data, indent=indent)   # TypeError ici, côté appelant
+    _put(("file", path), lambda: _write_atomic(path, text.encode("utf-8")))
+
+
+def flush(timeout: float = FLUSH_TIMEOUT) -> None:
+    """Bloque jusqu'à ce que tous les travaux en attente soient écrits."""
+    if not _pending or threading.current_thread() is _worker:
+        return
+    done = threading.Event()
+    _ensure_worker().put(done)
+    if not done.wait(timeout):
+        log(f"[Persist] flush : écritures toujours en cours après {timeout:.0f} s", "warning")
+
+
+def close() -> None:
+    """Flush puis ferme les connexions SQLite (fin d'un jeu)."""
+    if _conns:
+        submit(None, _close_conns)
+    flush()
+
+
+# ── Thread d'écriture ─────────────────────────────────────────────────────────
+
+def _put(key, job) -> None:
+    global _pending
+    q = _ensure_worker()
+    if key[-1] is None:
+        key = key + (object(),)   # clé unique : jamais fusionnée
+    with _lock:
+        fresh = key not in _jobs
+        _jobs[key] = job
+        if fresh:
+            _pending += 1
+    if fresh:
+        q.put(key)
+
+
+def _ensure_worker():
+    global _queue, _worker, _pid, _pending
+    if _pid != os.getpid():
+        # Premier appel, ou enfant d'un fork : le thread du parent n'existe
+        # pas ici et ses travaux restent à la charge du parent.
+        _jobs.clear()
+        _conns.clear()
+        _pending = 0
+        _queue   = queue.SimpleQueue()
+        _worker  = threading.Thread(target=_worker_loop, args=(_queue,),
+                                    name="persist", daemon=True)
+        _worker.start()
+        _pid = os.getpid()
+    return _queue
+
+
+def _worker_loop(q):
+    global _pending
+    while True:
+        item = q.get()
+        # Vide tout ce qui est déjà en queue : un seul commit par lot
+        keys, waiters = [], []
+        while item is not None:
+            (waiters if isinstance(item, threading.Event) else keys).append(item)
+            try:
+                item = q.get_nowait()
+            except queue.Empty:
+                item = None
+
+        dirty = set()
+        for key in keys:
+            with _lock:
+                job = _jobs.pop(key)
+            try:
+                if key[0] == "db":
+                    path, fn = job
+                    fn(_connection(path))
+                    dirty.add(path)
+                else:
+                    job()
+            except Exception as exc:
+                log(f"[Persist] écriture {key[:-1]} échouée : {exc}", "warning")
+
+        for path in dirty:
+            if path not in _conns:
+                continue   # fermée dans ce lot par close() (déjà commitée)
+            try:
+                _conns[path].commit()
+            except Exception as exc:
+                log(f"[Persist] commit '{path}' échoué : {exc}", "warning")
+
+        with _lock:
+            _pending -= len(keys)
+        for w in waiters:
+            w.set()
+
+
+def _connection(path):
+    conn = _conns.get(path)
+    if conn is None:
+        conn = _conns[path] = sqlite3.connect(path)
+    return conn
+
+
+def _close_conns() -> None:
+    for path, conn in list(_conns.items()):
+        try:
+            conn.commit()
+            conn.close()
+        except sqlite3.Error as exc:
+            log(f"[Persist] fermeture '{path}' : {exc}", "warning")
+    _conns.clear()
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+atexit.register(close)
@@ -14,10 +14,18 @@ Usage dans une boucle pygame :
         return          # quitter le jeu → retour launcher
 
     pygame.display.flip()
+
+Le combo du profiler par échantillonnage (V + VI, voir sampling_profiler.py)
+et l'overlay mémoire (SELECT + VI, voir mem_budget.py) sont relayés ici :
+tous les jeux qui utilisent QuitCombo en profitent. `update_and_draw()`
+appelle aussi `mem_budget.tick()` (log périodique, pression mémoire).
 """
 
 import pygame
 
+import mem_budget
+from sampling_profiler import ProfilerCombo
+
 QUIT_BUTTONS  = (12, 13)   # SELECT + START – identiques au combo git-pull du launcher
 QUIT_DURATION = 3000       # millisecondes à maintenir avant de quitter
 
@@ -29,9 +37,13 @@ class QuitCombo:
         self._pressed = set()
         self._start   = None
         self._font    = None   # initialisé à la demande (pygame doit être actif)
+        self._prof    = ProfilerCombo()
+        self._mem     = mem_budget.MemOverlay()
 
     def handle_event(self, event) -> None:
         """À appeler pour chaque événement pygame de la boucle principale."""
+        self._prof.handle_event(event)
+        self._mem.handle_event(event)
         if event.type == pygame.JOYBUTTONDOWN:
             self._pressed.add(event.button)
             if all(b in self._pressed for b in QUIT_BUTTONS):
@@ -48,6 +60,9 @@ class QuitCombo:
         Retourne True quand le timer arrive à terme (il faut quitter).
         Doit être appelé AVANT pygame.display.flip().
         """
+        mem_budget.tick()
+        self._mem.draw(screen)
+        self._prof.draw(screen)
         if self._start is None:
             return False
 
@@ -0,0 +1,166 @@
+"""Module partagé – profiler par échantillonnage, déclenché depuis la manette.
+
+Un thread relève toutes les INTERVAL secondes la pile de chaque thread
+(`sys._current_frames()`) et compte les piles identiques. À l'arrêt, le
+résultat est écrit au format « collapsed stacks » (une pile par ligne,
+frames séparées par `;`, suivie du nombre d'échantillons), directement
+utilisable par flamegraph.pl / speedscope / inferno :
+
+    MainThread;main.py:main;loop.py:run;camera.py:draw_world 412
+
+Le fichier `profile-AAAAMMJJ-HHMMSS.folded` est créé à côté de debug.log.
+Le coût est celui d'un réveil de thread toutes les 10 ms : on peut laisser
+tourner le profiler pendant toute une session Minecraft2D.
+
+Combo V + VI (boutons 16 + 17) ou F9 : démarre / arrête l'enregistrement.
+`QuitCombo` relaie déjà ses événements à `ProfilerCombo`, tous les jeux en
+profitent donc sans code supplémentaire. Usage autonome :
+
+    prof_combo = ProfilerCombo()
+
+    # dans la boucle d'événements :
+    for e in events:
+        prof_combo.handle_event(e)
+
+    # avant pygame.display.flip() :
+    prof_combo.draw(screen)         # pastille « PROF » pendant l'enregistrement
+"""
+
+import atexit
+import os
+import sys
+import threading
+import time
+from collections import Counter
+
+import pygame
+
+from logger import LOG_PATH, log
+
+TOGGLE_BUTTONS = (16, 17)   # V + VI
+TOGGLE_KEY     = pygame.K_F9
+INTERVAL       = 0.01       # secondes entre deux échantillons (100 Hz)
+MAX_DEPTH      = 96         # frames gardées par pile (les plus proches de la racine sautent)
+
+
+class SamplingProfiler:
+    """Échantillonne les piles de tous les threads depuis un thread dédié."""
+
+    def __init__(self, interval: float = INTERVAL):
+        self.interval = interval
+        self._counts  = Counter()   # tuple(nom thread, code, code, ...) -> échantillons
+        self._samples = 0
+        self._thread  = None
+        self._stop    = threading.Event()
+        self._t0      = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._counts.clear()
+        self._samples = 0
+        self._stop.clear()
+        self._t0 = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+        log(f"[Profiler] démarré ({1 / self.interval:.0f} Hz)")
+
+    def stop(self, path=None):
+        """Arrête l'échantillonnage et écrit le fichier. Retourne son chemin."""
+        if not self.running:
+            return None
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        path = path or LOG_PATH.parent / time.strftime("profile-%Y%m%d-%H%M%S.folded")
+        self.write(path)
+        elapsed = time.perf_counter() - self._t0
+        log(f"[Profiler] {self._samples} échantillons sur {elapsed:.1f} s → {path}")
+        return path
+
+    def write(self, path) -> None:
+        """Écrit les piles au format collapsed (flame graph)."""
+        names = {}
+        lines = []
+        for stack, count in self._counts.most_common():
+            thread, codes = stack[0], stack[1:]
+            frames = [thread]
+            for code in codes:
+                label = names.get(code)
+                if label is None:
+                    label = f"{os.path.basename(code.co_filename)}:{code.co_name}"
+                    names[code] = label
+                frames.append(label)
+            lines.append(f"{';'.join(frames)} {count}")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+
+    def _run(self) -> None:
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            thread_names = {t.ident: t.name for t in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                codes = []
+                while frame is not None and len(codes) < MAX_DEPTH:
+                    codes.append(frame.f_code)
+                    frame = frame.f_back
+                codes.reverse()
+                self._counts[(thread_names.get(ident, str(ident)), *codes)] += 1
+            self._samples += 1
+
+
+# Une seule session par processus, partagée par toutes les instances du combo
+_PROFILER = SamplingProfiler()
+
+
+def stop():
+    """Arrête et écrit la session en cours (jeu quitté pendant l'enregistrement)."""
+    return _PROFILER.stop()
+
+
+atexit.register(stop)
+
+
+class ProfilerCombo:
+    """Détecte le combo V+VI (ou F9) et démarre / arrête le profiler."""
+
+    def __init__(self, profiler: SamplingProfiler = None):
+        self.profiler = profiler or _PROFILER
+        self._pressed = set()
+        self._font    = None   # initialisé à la demande (pygame doit être actif)
+
+    def handle_event(self, event) -> None:
+        """À appeler pour chaque événement pygame de la boucle principale."""
+        if event.type == pygame.KEYDOWN and event.key == TOGGLE_KEY:
+            self.toggle()
+        elif event.type == pygame.JOYBUTTONDOWN:
+            self._pressed.add(event.button)
+            if event.button in TOGGLE_BUTTONS and all(b in self._pressed for b in TOGGLE_BUTTONS):
+                self.toggle()
+        elif event.type == pygame.JOYBUTTONUP:
+            self._pressed.discard(event.button)
+
+    def toggle(self) -> None:
+        if self.profiler.running:
+            self.profiler.stop()
+        else:
+            self.profiler.start()
+
+    def draw(self, screen) -> None:
+        """Pastille rouge « PROF » en haut à droite pendant l'enregistrement."""
+        if not self.profiler.running:
+            return
+        if self._font is None:
+            self._font = pygame.font.SysFont("Arial", 10, bold=True)
+        w = screen.get_width()
+        txt = self._font.render("PROF", True, (255, 255, 255))
+        x = w - txt.get_width() - 8
+        pygame.draw.rect(screen, (170, 20, 20), (x - 12, 3, txt.get_width() + 16, txt.get_height() + 2))
+        pygame.draw.circle(screen, (255, 80, 80), (x - 6, 4 + txt.get_height() // 2), 3)
+        screen.blit(txt, (x, 4))
@@ -0,0 +1,179 @@
+"""Module partagé – synthèse audio procédurale (NumPy) et cache PCM disque.
+
+Les bruitages des jeux sont générés en code plutôt que lus dans des
+fichiers. Calculés échantillon par échantillon en Python, ils coûtaient
+plusieurs centaines de ms au lancement sur l'Odroid. Ici :
+
+- les briques (oscillateurs, bruit, enveloppes, filtre passe-bas, suites de
+  notes) travaillent sur des tableaux NumPy entiers ;
+- chaque son produit est écrit en PCM int16 dans `.cache/synth/`. La clé
+  est un hash de la recette : fonction de synthèse (bytecode), arguments,
+  amplitude, fréquence et nombre de canaux du mixer. Aux lancements
+  suivants, le son est relu tel quel, sans aucun calcul.
+
+Une recette est une fonction `build(sr, *args) -> tableau float [-1, 1]`
+(normalisé ensuite sur son pic). Ses arguments doivent avoir un `repr`
+stable (nombres, chaînes, tuples). Le bruit est tiré d'une graine fixe, donc
+deux appels identiques donnent le même son.
+
+Usage :
+
+    import synth
+
+    def _blip(sr, freq):
+        n = synth.samples(0.08, sr)
+        return synth.sine(freq, n, sr) * synth.decay(n, 15.0)
+
+    snd = synth.sound(_blip, 880.0, amp=0.5)   # None si le mixer est absent
+
+Le bytecode de la recette fait partie de la clé : la modifier invalide son
+cache. Modifier une brique de ce module demande d'incrémenter VERSION.
+"""
+
+import hashlib
+import os
+import types
+import weakref
+from pathlib import Path
+
+import numpy as np
+import pygame
+
+BASE_DIR  = Path(__file__).resolve().parent
+CACHE_DIR = BASE_DIR / ".cache" / "synth"
+VERSION   = 1          # à incrémenter si une brique ci-dessous change
+
+_TAU     = 2.0 * np.pi
+_digests = weakref.WeakKeyDictionary()   # code -> hash du bytecode (calculé une fois)
+
+
+# ── Son prêt à jouer ──────────────────────────────────────────────────────────
+
+def sound(build, *args, amp: float = 1.0):
+    """`pygame.mixer.Sound` de la recette `build(sr, *args)`, ou None sans mixer."""
+    init = pygame.mixer.get_init()
+    if not init:
+        return None
+    sr, _, channels = init
+    path = CACHE_DIR / f"{_recipe_key(build, args, amp, sr, channels)}.pcm"
+    try:
+        return pygame.mixer.Sound(buffer=path.read_bytes())
+    except (OSError, pygame.error):
+        pass
+
+    pcm = to_pcm(build(sr, *args), amp, channels)
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_bytes(pcm)
+        os.replace(tmp, path)
+    except OSError:
+        pass   # cache en lecture seule / plein : le son reste utilisable
+    return pygame.mixer.Sound(buffer=pcm)
+
+
+def to_pcm(x, amp: float = 1.0, channels: int = 2) -> bytes:
+    """Normalise `x` sur son pic × `amp` → PCM int16 entrelacé (L R L R…)."""
+    x = np.asarray(x, dtype=np.float64)
+    if not x.size:
+        x = np.zeros(1)
+    peak = float(np.max(np.abs(x))) or 1.0
+    pcm  = np.clip(x * (32767.0 * amp / peak), -32768.0, 32767.0).astype(np.int16)
+    if channels > 1:
+        pcm = np.repeat(pcm, channels)
+    return pcm.tobytes()
+
+
+def sample_rate() -> int:
+    """Fréquence réelle du mixer, ou 22050 par défaut."""
+    info = pygame.mixer.get_init()
+    return info[0] if info else 22050
+
+
+# ── Briques de synthèse ───────────────────────────────────────────────────────
+
+def samples(dur: float, sr: int) -> int:
+    return int(dur * sr)
+
+
+def index(n: int):
+    """0, 1, …, n-1 (float)."""
+    return np.arange(n, dtype=np.float64)
+
+
+def progress(n: int):
+    """Avancement i / n dans [0, 1)."""
+    return index(n) / max(1, n)
+
+
+def sine(freq, n: int, sr: int):
+    """sin(2π·f·i/sr) ; `freq` peut être un tableau (glissando)."""
+    return np.sin(_TAU * freq * index(n) / sr)
+
+
+def cycle(n: int):
+    """Phase 2π·i/n : un cycle exact sur n échantillons (boucle sans clic)."""
+    return _TAU * index(n) / max(1, n)
+
+
+def noise(n: int, seed: int = 0):
+    """Bruit blanc uniforme [-1, 1], déterministe pour une graine donnée."""
+    return np.random.default_rng(seed).uniform(-1.0, 1.0, n)
+
+
+def decay(n: int, rate: float, start: float = 0.0):
+    """Enveloppe exp(-rate·(p - start)), 1 avant `start` (p = i / n)."""
+    return np.exp(-rate * np.maximum(0.0, progress(n) - start))
+
+
+def attack(n: int, frac: float):
+    """Montée linéaire sur `frac` du son, puis 1."""
+    return np.minimum(1.0, index(n) / max(1.0, n * frac))
+
+
+def lowpass(x, cutoff: float, sr: int):
+    """Passe-bas 1 pôle y += a·(x - y), a = w / (w + 1), w = 2π·fc/sr.
+
+    Calculé comme convolution par la réponse impulsionnelle a·(1-a)^k,
+    tronquée quand elle passe sous 1e-5.
+    """
+    w = _TAU * cutoff / sr
+    a = w / (w + 1.0)
+    length = max(1, int(np.ceil(np.log(1e-5) / np.log1p(-a))))
+    kernel = a * (1.0 - a) ** index(length)
+    return np.convolve(x, kernel)[:len(x)]
+
+
+def fit(x, n: int):
+    """Tronque ou complète de zéros à n échantillons."""
+    if len(x) >= n:
+        return x[:n]
+    return np.concatenate((x, np.zeros(n - len(x))))
+
+
+def notes(freqs, n: int, sr: int, env):
+    """Suite de notes de n échantillons chacune, enveloppe `env` (tableau n)."""
+    return np.concatenate([sine(f, n, sr) * env for f in freqs])
+
+
+# ── Clé de cache ──────────────────────────────────────────────────────────────
+
+def _recipe_key(build, args, amp, sr, channels) -> str:
+    h = hashlib.sha1()
+    h.update(repr((VERSION, build.__module__, build.__qualname__,
+                   args, amp, sr, channels)).encode())
+    h.update(_code_digest(build.__code__))
+    return h.hexdigest()[:24]
+
+
+def _code_digest(code) -> bytes:
+    """Hash stable du bytecode (marshal n'est pas reproductible d'un run à l'autre)."""
+    digest = _digests.get(code)
+    if digest is None:
+        h = hashlib.sha1(code.co_code)
+        h.update(repr(code.co_names).encode())
+        for const in code.co_consts:
+            h.update(_code_digest(const) if isinstance(const, types.CodeType)
+                     else repr(const).encode())
+        digest = _digests[code] = h.digest()
+    return digest
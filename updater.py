@@ -0,0 +1,110 @@
+"""
+Mise à jour du launcher en arrière-plan (`git pull` + précompilation).
+======================================================================
+Lancé par le combo SELECT+13 du launcher. Tout le travail lent tourne sur
+un thread : la boucle de rendu continue et affiche `progress` / `message`
+dans la barre de progression existante.
+
+Étapes :
+  1. `git pull` dans BASE_DIR                     (0 % → 20 %)
+  2. précompilation `.pyc` de main.py, des modules partagés et de tous les
+     jeux (`compileall`, fichiers déjà à jour ignorés) (20 % → 50 %)
+  3. compilation des images dans l'archive d'assets (asset_pack.py,
+     images inchangées recopiées sans décodage)    (50 % → 100 %)
+
+Le premier lancement après une mise à jour ne paie donc plus la
+recompilation des modules modifiés ni le décodage des PNG/JPEG. Le
+redémarrage (`os.execv`) reste à la charge de l'appelant, sur le thread
+principal, une fois `done` à True.
+
+Usage :
+    upd = SelfUpdate(BASE_DIR)
+    upd.start()
+    # chaque frame :
+    draw_bar(upd.progress, upd.message)
+    if upd.done:
+        if upd.ok: os.execv(...)
+"""
+import compileall
+import subprocess
+import threading
+from pathlib import Path
+
+import asset_pack
+from logger import log
+
+PULL_SHARE = 0.2   # part de la barre attribuée au git pull
+PYC_SHARE  = 0.3   # part de la précompilation .pyc ; le reste va aux assets
+
+# Dossiers jamais compilés (venv, caches, dépôt git…)
+_SKIP_DIRS = {".git", ".cache", "__pycache__", "venv", ".venv", "poc"}
+
+
+class SelfUpdate:
+    """`git pull` puis précompilation, exécutés sur un thread dédié."""
+
+    def __init__(self, base_dir):
+        self.base_dir = Path(base_dir)
+        self.progress = 0.0          # [0, 1]
+        self.message  = "Mise à jour via 'git pull'..."
+        self.done     = False
+        self.ok       = False
+        self._thread  = threading.Thread(target=self._run, name="self-update", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    @property
+    def running(self) -> bool:
+        return self._thread.is_alive()
+
+    # ── Thread ────────────────────────────────────────────────────────────────
+
+    def _run(self) -> None:
+        try:
+            result = subprocess.run(
+                ['git', 'pull'],
+                cwd=str(self.base_dir),
+                capture_output=True, text=True, check=True, encoding='utf-8'
+            )
+            log(f"[Update] git pull : {result.stdout.strip()}")
+            self.progress = PULL_SHARE
+
+            self._precompile()
+            self._compile_assets()
+
+            self.message = "Mise à jour terminée. Redémarrage..."
+            self.ok = True
+        except Exception as e:
+            log(f"[Update] échec : {e}", "error")
+            self.message = f"Erreur: {e}"
+        finally:
+            self.done = True
+
+    def _precompile(self) -> None:
+        files = self._sources()
+        failed = 0
+        for i, path in enumerate(files):
+            self.message = f"Compilation {i + 1}/{len(files)} : {path.parent.name}/{path.name}"
+            if not compileall.compile_file(str(path), quiet=2):
+                failed += 1
+            self.progress = PULL_SHARE + PYC_SHARE * (i + 1) / max(1, len(files))
+        log(f"[Update] {len(files)} modules précompilés ({failed} en erreur)")
+
+    def _compile_assets(self) -> None:
+        start = PULL_SHARE + PYC_SHARE
+
+        def progress(i, n, name):
+            self.message  = f"Assets {i}/{n} : {name.rsplit('/', 1)[-1]}"
+            self.progress = start + (1.0 - start) * i / max(1, n)
+
+        entries, size, decoded = asset_pack.compile_pack(self.base_dir, progress)
+        log(f"[Update] {entries} images dans l'archive ({decoded} décodées, {size / 1e6:.0f} Mo)")
+
+    def _sources(self) -> list:
+        """Fichiers .py du launcher et des jeux, hors venv / caches."""
+        files = sorted(self.base_dir.glob("*.py"))
+        for path in sorted((self.base_dir / "games").rglob("*.py")):
+            if not _SKIP_DIRS.intersection(path.relative_to(self.base_dir).parts):
+                files.append(path)
+        return files
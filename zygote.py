@@ -0,0 +1,145 @@
+"""
+Lanceur « zygote » – processus chaud qui forke un enfant par jeu.
+=================================================================
+Sans zygote, chaque lancement de jeu repart à froid : `launch_game` fait
+`pygame.quit()`, le jeu ré-importe pygame/numpy et tous ses modules, puis
+le launcher est relancé par startx (nouvel interpréteur Python).
+
+En mode zygote (`python main.py --zygote`), le launcher garde pygame, numpy
+et les modules partagés déjà importés. À chaque lancement il forke :
+
+- l'enfant hérite des modules chauds, exécute le jeu puis meurt
+  (`os._exit`) → le `sys.modules` du parent n'est jamais pollué ;
+- le parent attend la fin de l'enfant puis réaffiche le launcher,
+  sans repasser par le démarrage de Python.
+
+Le temps entre le fork et le premier `pygame.display.flip()/update()` de
+l'enfant est journalisé (« time-to-first-frame ») pour chaque jeu.
+
+Usage :
+    import zygote
+    if zygote.available():
+        zygote.warm_up()
+        ...
+        code = zygote.spawn(game, launch_game)
+
+Sur une plateforme sans `os.fork` (Windows), `available()` renvoie False
+et le launcher garde le chemin classique en processus unique.
+"""
+import importlib
+import os
+import sys
+import time
+import traceback
+
+from logger import log, flush as flush_log
+import persist
+
+# Modules importés une seule fois dans le zygote, hérités par chaque enfant
+WARM_MODULES = (
+    "pygame",
+    "pygame.surfarray",
+    "pygame.sndarray",
+    "numpy",
+    "logger",
+    "music_player",
+    "quit_combo",
+    "sampling_profiler",
+)
+
+
+def available() -> bool:
+    """True si la plateforme sait forker (Linux / Odroid)."""
+    return hasattr(os, "fork")
+
+
+def warm_up() -> None:
+    """Importe les modules lourds/partagés dans le processus zygote."""
+    t0 = time.perf_counter()
+    for name in WARM_MODULES:
+        try:
+            importlib.import_module(name)
+        except Exception as e:
+            # numpy / sndarray sont optionnels : on continue sans eux
+            log(f"[Zygote] préchargement '{name}' impossible : {e}", "warning")
+    ms = (time.perf_counter() - t0) * 1000
+    log(f"[Zygote] modules chauds prêts en {ms:.0f} ms")
+
+
+def spawn(game: dict, run_game) -> int:
+    """Forke un enfant qui exécute `run_game(game)` et attend sa fin.
+
+    Le parent doit avoir libéré l'écran et l'audio (`pygame.quit()`) avant
+    l'appel. Retourne le code de sortie de l'enfant.
+    """
+    title = game.get("title")
+    t0 = time.perf_counter()
+    pid = os.fork()
+
+    if pid == 0:
+        # ── Enfant : exécute le jeu puis meurt sans revenir au launcher ──
+        code = 0
+        try:
+            _install_first_frame_probe(title, t0)
+            run_game(game)
+        except SystemExit as e:
+            code = e.code if isinstance(e.code, int) else 0
+        except BaseException as e:
+            log(f"[Zygote] CRASH enfant '{title}' : {e}", "error")
+            log(traceback.format_exc(), "error")
+            code = 1
+        finally:
+            # os._exit ne passe pas par atexit
+            if "sampling_profiler" in sys.modules:
+                sys.modules["sampling_profiler"].stop()
+            persist.close()
+            flush_log()
+            os._exit(code)
+
+    # ── Parent : attend la fin du jeu ──────────────────────────────────────
+    log(f"[Zygote] '{title}' lancé (pid {pid})")
+    _, status = os.waitpid(pid, 0)
+    code = os.waitstatus_to_exitcode(status)
+    elapsed = time.perf_counter() - t0
+    log(f"[Zygote] '{title}' terminé (code {code}) après {elapsed:.1f} s")
+    return code
+
+
+# ── Internals ─────────────────────────────────────────────────────────────────
+
+def _install_first_frame_probe(title: str, t0: float) -> None:
+    """Remplace flip/update par une version qui mesure le premier frame.
+
+    Les jeux appellent `pygame.display.flip()` via l'attribut du module :
+    il suffit de le remplacer une fois, puis de restaurer l'original dès le
+    premier appel (aucun coût sur les frames suivants).
+    """
+    import pygame
+
+    orig_flip   = pygame.display.flip
+    orig_update = pygame.display.update
+
+    reported = []
+
+    def _report():
+        if reported:
+            return
+        reported.append(True)
+        # Si un autre hook (input_recorder…) nous a enveloppés, on reste en place
+        if pygame.display.flip is flip:
+            pygame.display.flip   = orig_flip
+        if pygame.display.update is update:
+            pygame.display.update = orig_update
+        ms = (time.perf_counter() - t0) * 1000
+        log(f"[Zygote] '{title}' : premier frame en {ms:.0f} ms")
+
+    def flip():
+        _report()
+        return orig_flip()
+
+    def update(*args, **kwargs):
+        _report()
+        return orig_update(*args, **kwargs)
+
+    pygame.display.flip   = flip
+    pygame.display.update = update